@@ -1,14 +1,18 @@
-import sys
+import os
+import time
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from generadores import (RandomGenerator, RunningStats, UniformSource, RandomnessTests,
+                         AliasTable, DistributionTransformer)
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QSpinBox, QMessageBox,
-    QTableWidget, QTableWidgetItem, QFrame, QGroupBox, QHeaderView,
-    QComboBox, QFormLayout, QDoubleSpinBox, QStackedWidget
+    QTableView, QFrame, QGroupBox, QHeaderView,
+    QComboBox, QFormLayout, QDoubleSpinBox, QStackedWidget, QProgressDialog,
+    QFileDialog, QProgressBar
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QAbstractTableModel, QModelIndex, QObject, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib
@@ -16,371 +20,149 @@ matplotlib.use('Qt5Agg')
 plt.style.use('seaborn-v0_8-whitegrid')
 
 
-class RandomGenerator:
-    """Clase que implementa diferentes algoritmos de generación de números aleatorios"""
+class GenerationWorker(QObject):
+    """Genera y transforma por bloques fuera del hilo de la interfaz.
     
-    @staticmethod
-    def mersenne_twister(n, seed=None):
-        """Generador Mersenne Twister usando numpy"""
-        # Usamos numpy que ya implementa Mersenne Twister
-        np.random.seed(seed)  # Usa la semilla proporcionada
-        return list(np.random.random(n))
-    
-    @staticmethod
-    def xorshift(n, seed=123456789):
-        """Implementación básica de XorShift"""
-        numbers = []
-        state = seed
-        for _ in range(n):
-            # XorShift algorithm (32-bit)
-            state ^= (state << 13) & 0xFFFFFFFF
-            state ^= (state >> 17) & 0xFFFFFFFF
-            state ^= (state << 5) & 0xFFFFFFFF
-            # Normalizar a [0,1)
-            numbers.append(state / 0xFFFFFFFF)
-        return numbers
-    
-    @staticmethod
-    def pcg(n, seed=42, mult=6364136223846793005, inc=1442695040888963407):
-        """Implementación básica de PCG (Permuted Congruential Generator)"""
-        numbers = []
-        state = seed
-        for _ in range(n):
-            # Actualizar estado usando LCG
-            state = (mult * state + inc) & 0xFFFFFFFFFFFFFFFF
-            # Aplicar función de salida PCG
-            xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
-            rot = state >> 59
-            result = ((xorshifted >> rot) | (xorshifted << (32 - rot))) & 0xFFFFFFFF
-            # Normalizar a [0,1)
-            numbers.append(result / 0xFFFFFFFF)
-        return numbers
-    
-    @staticmethod
-    def well(n, seed=123456789):
-        """Implementación simplificada de WELL (Well Equidistributed Long-period Linear)"""
-        # Usamos numpy.random.random() como aproximación, ya que una implementación
-        # completa de WELL es bastante compleja
-        np.random.seed(seed)
-        return list(np.random.random(n))
+    Después de cada bloque emite `progress` con los valores generados y `partial`
+    con los valores nuevos para la vista previa (mientras quede espacio) y un
+    resumen (cantidad, media, desviación, mínimo, máximo) de lo acumulado.
+    """
     
-    @staticmethod
-    def lcg(n, seed=123456789, a=1103515245, c=12345, m=2**31):
-        """Generador Congruencial Lineal Mixto"""
-        numbers = []
-        x = seed
-        for _ in range(n):
-            x = (a * x + c) % m
-            numbers.append(x / m)
-        return numbers
-    
-    @staticmethod
-    def mcg(n, seed=123456789, a=48271, m=2**31-1):
-        """Generador Congruencial Multiplicativo"""
-        numbers = []
-        x = seed
-        for _ in range(n):
-            x = (a * x) % m
-            numbers.append(x / m)
-        return numbers
+    progress = pyqtSignal(int)
+    partial = pyqtSignal(object, object)
+    finished = pyqtSignal(int, bool)
+    failed = pyqtSignal(str)
     
-    @staticmethod
-    def tausworthe(n, seed=123456789):
-        """Implementación básica de generador Tausworthe/LFSR"""
-        numbers = []
-        r = 32  # Tamaño del registro
-        q = 3  # Posición de tap
-        s = seed
-        for _ in range(n):
-            result = 0
-            for j in range(32):
-                bit = (s >> 0) & 1  # Bit menos significativo
-                result = result | (bit << j)
-                new_bit = ((s >> 0) ^ (s >> q)) & 1  # XOR de bits en posiciones 0 y q
-                s = (s >> 1) | (new_bit << (r-1))  # Desplazar y añadir nuevo bit
-            # Normalizar a [0,1)
-            numbers.append(result / 0xFFFFFFFF)
-        return numbers
-    
-    @staticmethod
-    def middle_square(n, seed=675248):
-        """Método de Productos Medios (Von Neumann)"""
-        numbers = []
-        digits = len(str(seed))
-        if digits % 2 != 0:
-            seed = seed * 10  # Asegurar un número par de dígitos
-            digits += 1
-        
-        x = seed
-        for _ in range(n):
-            x_squared = x * x
-            x_squared_str = str(x_squared).zfill(digits * 2)
-            
-            # Extraer dígitos del medio
-            start = (len(x_squared_str) - digits) // 2
-            x = int(x_squared_str[start:start+digits])
-            
-            # Normalizar a [0,1)
-            numbers.append(x / (10**digits))
-            
-            # Verificar si hemos llegado a un ciclo (prevenir bucles)
-            if x == 0:
-                x = seed
-        
-        return numbers
-    
-    @staticmethod
-    def middle_square_weyl(n, seed=675248, w_seed=123456789):
-        """Método Cuadrático Medio con la secuencia de Weyl para evitar ciclos"""
-        numbers = []
-        x = seed
-        w = w_seed
-        m = 2**32
-        
-        for _ in range(n):
-            # Actualizar secuencia de Weyl
-            w = (w + w_seed) % m
-            
-            # Combinar con el estado actual
-            x = (x + w) % m
-            
-            # Operación cuadrado medio
-            y = (x * x) % m
-            
-            # Normalizar a [0,1)
-            numbers.append(y / m)
-            
-            # Actualizar x para la siguiente iteración
-            x = y
-        
-        return numbers
-class DistributionTransformer:
-    """Clase para transformar números aleatorios uniformes a otras distribuciones"""
-    
-    @staticmethod
-    def uniform(random_nums, a=0, b=1):
-        """Distribución Uniforme en [a,b]"""
-        return [a + (b - a) * r for r in random_nums]
+    def __init__(self, method, params, seed, count, transform, chunk_size, preview_limit):
+        super().__init__()
+        self.method = method
+        self.params = params
+        self.seed = seed
+        self.count = count
+        self.transform = transform
+        self.chunk_size = chunk_size
+        self.preview_limit = preview_limit
+        self.cancelled = False
     
-    @staticmethod
-    def normal(random_nums, mean=0, std=1):
-        """Distribución Normal (Box-Muller)"""
-        result = []
-        # Asegurar que tenemos un número par de valores
-        if len(random_nums) % 2 != 0:
-            random_nums = random_nums[:-1]
-        
-        for i in range(0, len(random_nums), 2):
-            if i+1 < len(random_nums):
-                u1 = random_nums[i]
-                u2 = random_nums[i+1]
-                
-                # Evitar logaritmo de cero
-                if u1 <= 0:
-                    u1 = 0.0001
-                
-                # Transformación Box-Muller
-                z1 = mean + std * np.sqrt(-2 * np.log(u1)) * np.cos(2 * np.pi * u2)
-                z2 = mean + std * np.sqrt(-2 * np.log(u1)) * np.sin(2 * np.pi * u2)
-                
-                result.append(z1)
-                result.append(z2)
-        
-        # Asegurar que devolvemos exactamente la cantidad solicitada
-        return result[:len(random_nums)]
+    def cancel(self):
+        """Pide detener la generación al terminar el bloque en curso"""
+        self.cancelled = True
     
-    @staticmethod
-    def exponential(random_nums, lambd=1.0):
-        """Distribución Exponencial"""
-        # Transformación inversa
-        return [-np.log(1 - r) / lambd for r in random_nums]
+    def run(self):
+        try:
+            # Una sola fuente: los muestreadores por rechazo toman del mismo flujo los
+            # uniformes adicionales que necesitan
+            source = UniformSource(RandomGenerator.stream(self.method, self.seed, self.chunk_size, **self.params))
+            stats = RunningStats()
+            kept = 0
+            generated = 0
+            while generated < self.count and not self.cancelled:
+                uniform_nums = source.draw(min(self.chunk_size, self.count - generated))
+                values = np.asarray(self.transform(uniform_nums, source))
+                stats.update(values)
+                generated += len(uniform_nums)
+                new = values[:self.preview_limit - kept].copy()
+                kept += len(new)
+                self.partial.emit(new, (stats.count, stats.mean, stats.std, stats.min, stats.max))
+                self.progress.emit(generated)
+            self.finished.emit(generated, self.cancelled)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.failed.emit(str(e))
+
+
+class NumberTableModel(QAbstractTableModel):
+    """Modelo de una columna que muestra directamente un arreglo de numpy.
     
-    @staticmethod
-    def poisson(random_nums, lambd=1.0):
-        """Distribución de Poisson - Algoritmo de transformación por rechazo"""
-        result = []
-        
-        for r in random_nums:
-            # Algoritmo directo para generar Poisson
-            L = np.exp(-lambd)
-            k = 0
-            p = 1
-            
-            while p > L:
-                k += 1
-                # Generar otro número aleatorio - usando numpy aquí para simplificar
-                u = np.random.random()
-                p *= u
-            
-            result.append(k-1)
-        
-        return result
+    No crea un elemento por fila: la vista pide el texto solo de las celdas
+    visibles y cada valor se formatea en ese momento. Las filas agregadas con
+    `append` se copian en un búfer reservado de una vez, así llenar la tabla
+    por bloques cuesta tiempo lineal.
+    """
     
-    @staticmethod
-    def binomial(random_nums, n=10, p=0.5):
-        """Distribución Binomial - suma de n ensayos de Bernoulli"""
-        result = []
-        
-        for i in range(0, len(random_nums), n):
-            # Tomar n valores o lo que quede si no hay suficientes
-            subset = random_nums[i:i+n]
-            if len(subset) < n:
-                # Si no hay suficientes valores, repetir algunos
-                subset = subset + subset[:n-len(subset)]
-            
-            # Contar éxitos (r <= p)
-            successes = sum(1 for r in subset if r <= p)
-            result.append(successes)
-        
-        # Puede que generemos menos resultados que la entrada original
-        # Repetir resultados si es necesario
-        while len(result) < len(random_nums):
-            result.append(result[len(result) % len(result)])
-        
-        return result[:len(random_nums)]
+    def __init__(self, values=None, parent=None):
+        super().__init__(parent)
+        self.buffer = np.empty(0) if values is None else np.asarray(values)
+        self.rows = len(self.buffer)
+        self.capacity = 0
+        self.header = "Valor"
     
-    @staticmethod
-    def gamma(random_nums, shape=1.0, scale=1.0):
-        """Distribución Gamma - Implementación simplificada"""
-        result = []
-        
-        for r in random_nums:
-            # Para shape >= 1, usamos aproximación
-            if shape >= 1:
-                # Usar la transformación básica - en la práctica se utilizaría
-                # un algoritmo más sofisticado como Marsaglia-Tsang
-                u = np.random.random()  # Otro número aleatorio
-                x = -np.log(r * u) * scale
-                result.append(x)
-            else:
-                # Para shape < 1 también necesitaríamos otro algoritmo
-                # Esta es una aproximación muy básica
-                x = -np.log(r) * scale
-                result.append(x)
-        
-        return result
+    @property
+    def values(self):
+        """Filas mostradas (vista del búfer, sin copiar)"""
+        return self.buffer[:self.rows]
     
-    @staticmethod
-    def beta(random_nums, alpha=2.0, beta=2.0):
-        """Distribución Beta"""
-        result = []
-        
-        # Necesitamos pares de números aleatorios
-        if len(random_nums) % 2 != 0:
-            random_nums = random_nums[:-1]
-        
-        for i in range(0, len(random_nums), 2):
-            if i+1 < len(random_nums):
-                u1 = random_nums[i]
-                u2 = random_nums[i+1]
-                
-                # Evitar logaritmo de cero
-                if u1 <= 0:
-                    u1 = 0.0001
-                if u2 <= 0:
-                    u2 = 0.0001
-                
-                # Usar aproximación - en la práctica se utilizaría otro algoritmo
-                y1 = u1 ** (1/alpha)
-                y2 = u2 ** (1/beta)
-                
-                if y1 + y2 <= 1:
-                    x = y1 / (y1 + y2)
-                    result.append(x)
-                else:
-                    # Si no cumple la condición, generar otro número
-                    result.append(np.random.beta(alpha, beta))
-        
-        # Asegurar que devolvemos exactamente la cantidad solicitada
-        while len(result) < len(random_nums):
-            result.append(np.random.beta(alpha, beta))
-        
-        return result[:len(random_nums)]
+    def set_values(self, values, capacity=0, header="Valor"):
+        """Reemplaza el arreglo mostrado; `capacity` filas se reservan para los `append` siguientes"""
+        self.beginResetModel()
+        self.buffer = np.asarray(values)
+        self.rows = len(self.buffer)
+        self.capacity = capacity
+        self.header = header
+        self.endResetModel()
     
-    @staticmethod
-    def chi_squared(random_nums, df=1):
-        """Distribución Chi-cuadrado (caso especial de Gamma)"""
-        # Chi-cuadrado es un caso especial de Gamma con shape=df/2 y scale=2
-        return DistributionTransformer.gamma(random_nums, shape=df/2, scale=2)
+    def append(self, values):
+        """Agrega filas al final sin reiniciar la vista"""
+        if len(values) == 0:
+            return
+        start, end = self.rows, self.rows + len(values)
+        if end > len(self.buffer):
+            # El búfer se reserva con la capacidad indicada (o se duplica si no alcanza)
+            dtype = np.result_type(self.buffer, values) if start else np.asarray(values).dtype
+            grown = np.empty(max(end, self.capacity, 2 * len(self.buffer)), dtype=dtype)
+            grown[:start] = self.buffer[:start]
+            self.buffer = grown
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self.buffer[start:end] = values
+        self.rows = end
+        self.endInsertRows()
     
-    @staticmethod
-    def t_distribution(random_nums, df=1):
-        """Distribución t-Student"""
-        result = []
-        
-        # Necesitamos pares de números aleatorios
-        if len(random_nums) % 2 != 0:
-            random_nums = random_nums[:-1]
-        
-        for i in range(0, len(random_nums), 2):
-            if i+1 < len(random_nums):
-                u1 = random_nums[i]
-                u2 = random_nums[i+1]
-                
-                # Evitar logaritmo de cero
-                if u1 <= 0:
-                    u1 = 0.0001
-                
-                # Generar normal estándar con Box-Muller
-                z = np.sqrt(-2 * np.log(u1)) * np.cos(2 * np.pi * u2)
-                
-                # Generar chi-cuadrado para los grados de libertad
-                v = np.random.chisquare(df)
-                
-                # Calcular t-Student
-                t = z / np.sqrt(v/df)
-                result.append(t)
-        
-        # Completar si es necesario
-        while len(result) < len(random_nums):
-            result.append(np.random.standard_t(df))
-        
-        return result[:len(random_nums)]
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
     
-    @staticmethod
-    def f_distribution(random_nums, dfn=1, dfd=1):
-        """Distribución F"""
-        result = []
-        
-        # Necesitamos pares de números aleatorios
-        if len(random_nums) % 2 != 0:
-            random_nums = random_nums[:-1]
-        
-        for i in range(0, len(random_nums), 2):
-            if i+1 < len(random_nums):
-                # Generar dos chi-cuadrado independientes
-                chi1 = np.random.chisquare(dfn)
-                chi2 = np.random.chisquare(dfd)
-                
-                # Calcular estadístico F
-                f = (chi1/dfn) / (chi2/dfd)
-                result.append(f)
-        
-        # Completar si es necesario
-        while len(result) < len(random_nums):
-            result.append(np.random.f(dfn, dfd))
-        
-        return result[:len(random_nums)]
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
     
-    @staticmethod
-    def geometric(random_nums, p=0.5):
-        """Distribución Geométrica"""
-        # Número de ensayos Bernoulli hasta el primer éxito
-        return [int(np.ceil(np.log(1-r) / np.log(1-p))) for r in random_nums]
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self.values[index.row()]
+            return f"{value:.8f}" if isinstance(value, np.floating) else f"{value}"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
     
-    @staticmethod
-    def negative_binomial(random_nums, n=10, p=0.5):
-        """Distribución Binomial Negativa"""
-        # Número de ensayos Bernoulli hasta obtener r éxitos
-        result = []
-        
-        for r in random_nums:
-            # Aproximación
-            x = np.random.negative_binomial(n, p)
-            result.append(x)
-        
-        return result
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        return self.header if orientation == Qt.Horizontal else str(section + 1)
+
+
 class numram(QWidget):
+    # Método de RandomGenerator y parámetros de cada opción del selector
+    GENERATION_METHODS = {
+        "Mersenne Twister": ('mersenne_twister', {}),
+        "Xorshift": ('xorshift', {}),
+        "PCG (Permuted Congruential Generator)": ('pcg', {}),
+        "WELL (Well Equidistributed Long-period Linear)": ('well', {}),
+        "WELL1024a": ('well', {'variant': '1024a'}),
+        "Congruencial Lineal Mixto (MCL)": ('lcg', {}),
+        "Congruencial Multiplicativo": ('mcg', {}),
+        "Tausworthe / LFSR": ('tausworthe', {'variant': 'lfsr'}),
+        "Tausworthe combinado (LFSR113)": ('tausworthe', {'variant': 'lfsr113'}),
+        "Tausworthe combinado (taus88)": ('tausworthe', {'variant': 'taus88'}),
+        "Philox4x32-10 (basado en contador)": ('philox', {}),
+        "Threefry2x32-20 (basado en contador)": ('threefry', {}),
+        "Productos Medios": ('middle_square', {}),
+        "Cuadrático Medio": ('middle_square_weyl', {}),
+    }
+    # Valores que se generan y transforman en cada bloque
+    CHUNK_SIZE = 1000000
+    # Valores que se conservan en memoria para la tabla y las gráficas
+    PREVIEW_LIMIT = 1000000
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Generador de Números Aleatorios y Distribuciones")
@@ -420,16 +202,16 @@ class numram(QWidget):
             QPushButton:pressed {
                 background-color: #0b2447;
             }
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 1px solid #19A7CE;
                 border-radius: 5px;
                 gridline-color: #AEFEFF;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #AEFEFF;
                 color: #0b2447;
             }
@@ -484,6 +266,11 @@ class numram(QWidget):
         self.setup_ui()
         self.generator = RandomGenerator()
         self.transformer = DistributionTransformer()
+        self.worker = None
+        self.worker_thread = None
+        self.preview_note = ""
+        # Dentro de la ventana principal esta página no recibe closeEvent: detener también al salir
+        QApplication.instance().aboutToQuit.connect(self.detener_generacion)
 
     def setup_ui(self):
         main_layout = QVBoxLayout()
@@ -503,17 +290,7 @@ class numram(QWidget):
         
         # Selector de método de generación
         self.method_selector = QComboBox()
-        self.method_selector.addItems([
-            "Mersenne Twister",
-            "Xorshift",
-            "PCG (Permuted Congruential Generator)",
-            "WELL (Well Equidistributed Long-period Linear)",
-            "Congruencial Lineal Mixto (MCL)",
-            "Congruencial Multiplicativo",
-            "Tausworthe / LFSR",
-            "Productos Medios",
-            "Cuadrático Medio"
-        ])
+        self.method_selector.addItems(list(self.GENERATION_METHODS))
         
         # Selector de distribución
         self.distribution_selector = QComboBox()
@@ -529,7 +306,8 @@ class numram(QWidget):
             "t-Student",
             "F",
             "Geométrica",
-            "Binomial Negativa"
+            "Binomial Negativa",
+            "Discreta (tabla)"
         ])
         self.distribution_selector.currentIndexChanged.connect(self.update_param_widgets)
         
@@ -543,7 +321,7 @@ class numram(QWidget):
         
         # Número de valores a generar
         self.count_input = QSpinBox()
-        self.count_input.setRange(1, 10000)
+        self.count_input.setRange(1, 10**9)
         self.count_input.setValue(100)
         
         # Semilla opcional
@@ -588,8 +366,11 @@ class numram(QWidget):
         self.normal_std.setRange(0.01, 1000)
         self.normal_std.setValue(1)
         self.normal_std.setDecimals(2)
+        self.normal_method = QComboBox()
+        self.normal_method.addItems(["Box-Muller", "Ziggurat"])
         normal_layout.addRow("Media (μ):", self.normal_mean)
         normal_layout.addRow("Desv. (σ):", self.normal_std)
+        normal_layout.addRow("Método:", self.normal_method)
         self.param_container.addWidget(normal_widget)
         
         # 3. Parámetros para Exponencial
@@ -601,7 +382,10 @@ class numram(QWidget):
         self.exp_lambda.setRange(0.01, 100)
         self.exp_lambda.setValue(1)
         self.exp_lambda.setDecimals(2)
+        self.exp_method = QComboBox()
+        self.exp_method.addItems(["Inversa", "Ziggurat"])
         exp_layout.addRow("Lambda (λ):", self.exp_lambda)
+        exp_layout.addRow("Método:", self.exp_method)
         self.param_container.addWidget(exp_widget)
         
         # 4. Parámetros para Poisson
@@ -731,6 +515,19 @@ class numram(QWidget):
         nbinom_layout.addRow("Prob. éxito (p):", self.nbinom_p)
         self.param_container.addWidget(nbinom_widget)
         
+        # 13. Tabla de probabilidades para la distribución discreta
+        discrete_widget = QWidget()
+        discrete_layout = QFormLayout(discrete_widget)
+        discrete_layout.setContentsMargins(0, 0, 0, 0)
+        discrete_layout.setSpacing(5)
+        self.alias_table = None
+        self.discrete_btn = QPushButton("Cargar CSV...")
+        self.discrete_btn.clicked.connect(self.cargar_tabla)
+        self.discrete_label = QLabel("Sin tabla cargada")
+        discrete_layout.addRow("Tabla:", self.discrete_btn)
+        discrete_layout.addRow(self.discrete_label)
+        self.param_container.addWidget(discrete_widget)
+        
         # Botón generar compacto
         self.gen_btn = QPushButton("Generar")
         self.gen_btn.setIcon(QIcon("img/random.png"))
@@ -738,13 +535,30 @@ class numram(QWidget):
         self.gen_btn.setIconSize(QSize(20, 20))
         self.gen_btn.clicked.connect(self.generar)
         
+        # Botón para la batería de pruebas de calidad del generador
+        self.test_btn = QPushButton("Pruebas de calidad")
+        self.test_btn.setMinimumHeight(30)
+        self.test_btn.clicked.connect(self.evaluar_calidad)
+        
         # Añadir todo al layout de configuración
         config_layout.addLayout(col1_layout)
         config_layout.addLayout(col2_layout)
         config_layout.addWidget(self.param_container)
         config_layout.addWidget(self.gen_btn)
+        config_layout.addWidget(self.test_btn)
         
         main_layout.addWidget(config_frame)
+        
+        # Progreso y resumen de la generación en curso
+        status_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumHeight(18)
+        self.progress_bar.setVisible(False)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("font-size: 12px; color: #0b2447;")
+        status_layout.addWidget(self.progress_bar, 1)
+        status_layout.addWidget(self.status_label, 2)
+        main_layout.addLayout(status_layout)
 
         # Layout para la tabla y gráficas
         content_layout = QHBoxLayout()
@@ -760,13 +574,15 @@ class numram(QWidget):
         table_header.setStyleSheet("font-size: 12px; font-weight: bold; color: #19A7CE; padding: 2px;")
         table_layout.addWidget(table_header)
         
-        self.table = QTableWidget()
+        self.table_model = NumberTableModel()
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #F0F8FF;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 font-family: 'Consolas', monospace;
                 font-size: 13px;
@@ -780,6 +596,8 @@ class numram(QWidget):
         self.table.horizontalHeader().setMinimumSectionSize(100)
         self.table.horizontalHeader().setDefaultSectionSize(120)
         self.table.verticalHeader().setDefaultSectionSize(30)
+        # Altura fija: la vista no necesita medir cada fila
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         table_layout.addWidget(self.table)
         
         # Gráficas
@@ -813,7 +631,31 @@ class numram(QWidget):
         """Actualiza los widgets de parámetros según la distribución seleccionada"""
         self.param_container.setCurrentIndex(index)
     
+    def cargar_tabla(self):
+        """Carga desde un CSV las probabilidades de la distribución discreta"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Cargar tabla de probabilidades", "",
+            "Archivo CSV (*.csv);;Todos los archivos (*)")
+        if not path:
+            return
+        try:
+            table = AliasTable.from_csv(path)
+            if table.values is not None and not np.issubdtype(table.values.dtype, np.number):
+                raise ValueError("La columna de valores debe ser numérica")
+            self.alias_table = table
+            self.discrete_label.setText(f"{os.path.basename(path)}: {len(table)} categorías")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"No se pudo cargar la tabla:\n{str(e)}")
+    
+    # Intervalo mínimo (segundos) entre redibujados de las gráficas durante la generación
+    PLOT_INTERVAL = 1.0
+    
     def generar(self):
+        # Si hay una generación en curso el botón funciona como "Cancelar"
+        if self.worker is not None:
+            self.worker.cancel()
+            self.gen_btn.setEnabled(False)
+            return
         try:
             method = self.method_selector.currentText()
             distribution = self.distribution_selector.currentText()
@@ -823,141 +665,273 @@ class numram(QWidget):
             # Para depuración - imprime los valores que se están usando
             print(f"Método: {method}, Distribución: {distribution}, Cantidad: {count}, Semilla: {seed}")
             
-            # 1. Generar números aleatorios uniformes con el método seleccionado
-            uniform_nums = []
-            if method == "Mersenne Twister":
-                uniform_nums = self.generator.mersenne_twister(count, seed)
-            elif method == "Xorshift":
-                uniform_nums = self.generator.xorshift(count, seed)
-            elif method == "PCG (Permuted Congruential Generator)":
-                uniform_nums = self.generator.pcg(count, seed)
-            elif method == "WELL (Well Equidistributed Long-period Linear)":
-                uniform_nums = self.generator.well(count, seed)
-            elif method == "Congruencial Lineal Mixto (MCL)":
-                uniform_nums = self.generator.lcg(count, seed)
-            elif method == "Congruencial Multiplicativo":
-                uniform_nums = self.generator.mcg(count, seed)
-            elif method == "Tausworthe / LFSR":
-                uniform_nums = self.generator.tausworthe(count, seed)
-            elif method == "Productos Medios":
-                uniform_nums = self.generator.middle_square(count, seed)
-            elif method == "Cuadrático Medio":
-                uniform_nums = self.generator.middle_square_weyl(count, seed)
-            
-            # 2. Transformar a la distribución deseada
-            random_nums = []
-            if distribution == "Uniforme":
-                a = self.uniform_min.value()
-                b = self.uniform_max.value()
-                random_nums = self.transformer.uniform(uniform_nums, a, b)
-            elif distribution == "Normal":
-                mean = self.normal_mean.value()
-                std = self.normal_std.value()
-                random_nums = self.transformer.normal(uniform_nums, mean, std)
-            elif distribution == "Exponencial":
-                lambd = self.exp_lambda.value()
-                random_nums = self.transformer.exponential(uniform_nums, lambd)
-            elif distribution == "Poisson":
-                lambd = self.poisson_lambda.value()
-                random_nums = self.transformer.poisson(uniform_nums, lambd)
-            elif distribution == "Binomial":
-                n = self.binomial_n.value()
-                p = self.binomial_p.value()
-                random_nums = self.transformer.binomial(uniform_nums, n, p)
-            elif distribution == "Gamma":
-                shape = self.gamma_shape.value()
-                scale = self.gamma_scale.value()
-                random_nums = self.transformer.gamma(uniform_nums, shape, scale)
-            elif distribution == "Beta":
-                alpha = self.beta_alpha.value()
-                beta = self.beta_beta.value()
-                random_nums = self.transformer.beta(uniform_nums, alpha, beta)
-            elif distribution == "Chi-cuadrado":
-                df = self.chi2_df.value()
-                random_nums = self.transformer.chi_squared(uniform_nums, df)
-            elif distribution == "t-Student":
-                df = self.t_df.value()
-                random_nums = self.transformer.t_distribution(uniform_nums, df)
-            elif distribution == "F":
-                dfn = self.f_dfn.value()
-                dfd = self.f_dfd.value()
-                random_nums = self.transformer.f_distribution(uniform_nums, dfn, dfd)
-            elif distribution == "Geométrica":
-                p = self.geo_p.value()
-                random_nums = self.transformer.geometric(uniform_nums, p)
-            elif distribution == "Binomial Negativa":
-                n = self.nbinom_n.value()
-                p = self.nbinom_p.value()
-                random_nums = self.transformer.negative_binomial(uniform_nums, n, p)
-            
-            # Preparar la tabla
-            self.table.clearContents()
-            self.table.setRowCount(min(count, 1000))  # Mostrar máximo 1000 filas
-            self.table.setColumnCount(1)  # Solo una columna para los valores
-            self.table.setHorizontalHeaderLabels(["Valor"])
-            
-            # Llenar la tabla
-            for i in range(min(count, 1000)):
-                # Columna valor
-                val_item = QTableWidgetItem(f"{random_nums[i]:.8f}" if isinstance(random_nums[i], float) else f"{random_nums[i]}")
-                val_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(i, 0, val_item)
+            # 1. Generar por bloques con el método seleccionado y 2. transformar cada bloque,
+            # en un hilo aparte; bloques pequeños en cantidades pequeñas para ver el avance
+            method_name, params = self.GENERATION_METHODS[method]
+            transform = self.crear_transformacion(distribution)
+            chunk_size = min(self.CHUNK_SIZE, max(count // 100, 10000), count)
+            self.worker = GenerationWorker(method_name, params, seed, count, transform,
+                                           chunk_size, self.PREVIEW_LIMIT)
+            self.worker_thread = QThread(self)
+            self.worker.moveToThread(self.worker_thread)
+            self.worker_thread.started.connect(self.worker.run)
+            self.worker.progress.connect(self.progress_bar.setValue)
+            self.worker.partial.connect(self.mostrar_parcial)
+            self.worker.finished.connect(self.generacion_terminada)
+            self.worker.failed.connect(self.generacion_fallida)
+            self.worker.finished.connect(self.worker_thread.quit)
+            self.worker.failed.connect(self.worker_thread.quit)
+            self.worker_thread.finished.connect(self.liberar_hilo)
             
-            self.table.resizeColumnsToContents()
-            
-            # Actualizar gráficos
-            self.plot_analysis(random_nums, method, distribution)
-            
-            QMessageBox.information(self, "Generación Completada", 
-                                   f"Se han generado {count} números aleatorios usando el método {method} y la distribución {distribution}.")
+            self.current_run = (method, distribution)
+            self.summary = ""
+            self.last_plot = time.perf_counter()
+            # Solo los primeros PREVIEW_LIMIT valores se guardan para la tabla y las gráficas
+            if count > self.PREVIEW_LIMIT:
+                header = f"Valor (primeros {self.PREVIEW_LIMIT} de {count})"
+                self.preview_note = f"   La tabla solo conserva los primeros {self.PREVIEW_LIMIT} valores."
+            else:
+                header, self.preview_note = "Valor", ""
+            self.table_model.set_values(np.empty(0), capacity=min(count, self.PREVIEW_LIMIT), header=header)
+            self.progress_bar.setRange(0, count)
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(True)
+            self.status_label.setText("Generando números aleatorios..." + self.preview_note)
+            self.gen_btn.setText("Cancelar")
+            self.worker_thread.start()
         
         except Exception as e:
+            self.worker = None
             QMessageBox.critical(self, "Error", f"Ocurrió un error durante la generación:\n{str(e)}")
             import traceback
             traceback.print_exc()
     
+    def mostrar_parcial(self, values, summary):
+        """Agrega a la tabla los valores nuevos y actualiza el resumen y, cada cierto tiempo, las gráficas"""
+        self.table_model.append(values)
+        count, mean, std, min_val, max_val = summary
+        self.summary = (f"Media: {mean:.6f}   Desv. estándar: {std:.6f}   "
+                        f"Mínimo: {min_val:.6f}   Máximo: {max_val:.6f}")
+        self.status_label.setText(f"{count} valores   {self.summary}" + self.preview_note)
+        if len(values) and time.perf_counter() - self.last_plot > self.PLOT_INTERVAL:
+            self.plot_analysis(self.table_model.values, *self.current_run)
+            self.last_plot = time.perf_counter()
+    
+    def generacion_terminada(self, generated, cancelled):
+        """Dibuja las gráficas finales y muestra el resumen sin bloquear la ventana"""
+        method, distribution = self.current_run
+        random_nums = self.table_model.values
+        if len(random_nums):
+            self.plot_analysis(random_nums, method, distribution)
+        resumen = (f"{'Cancelado: se generaron' if cancelled else 'Se han generado'} {generated} números "
+                   f"con {method} y distribución {distribution}.   " + self.summary)
+        if generated > len(random_nums):
+            resumen += f"   La tabla y las gráficas muestran los primeros {len(random_nums)} valores."
+        self.status_label.setText(resumen)
+    
+    def generacion_fallida(self, message):
+        QMessageBox.critical(self, "Error", f"Ocurrió un error durante la generación:\n{message}")
+    
+    def detener_generacion(self):
+        """Cancela la generación en curso y espera a que su hilo termine"""
+        if self.worker_thread is not None:
+            self.worker.cancel()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+    
+    def closeEvent(self, event):
+        """Detiene el hilo de generación al cerrar la ventana"""
+        self.detener_generacion()
+        super().closeEvent(event)
+    
+    def liberar_hilo(self):
+        """Restablece la interfaz cuando el hilo de generación termina"""
+        self.worker_thread.deleteLater()
+        self.worker.deleteLater()
+        self.worker = None
+        self.worker_thread = None
+        self.progress_bar.setVisible(False)
+        self.gen_btn.setText("Generar")
+        self.gen_btn.setEnabled(True)
+    
+    def evaluar_calidad(self):
+        """Aplica la batería de pruebas a la salida uniforme del método seleccionado"""
+        try:
+            method = self.method_selector.currentText()
+            count = self.count_input.value()
+            seed = self.seed_input.value()
+            method_name, params = self.GENERATION_METHODS[method]
+            progress = QProgressDialog("Ejecutando pruebas de calidad...", "Cancelar", 0, count, self)
+            progress.setWindowTitle("Pruebas en curso")
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(500)
+            
+            battery = RandomnessTests()
+            chunk_size = min(self.CHUNK_SIZE, count)
+            workers = min(len(battery.tests), os.cpu_count() or 1)
+            with ThreadPoolExecutor(workers) as pool:
+                for chunk in self.generator.stream(method_name, seed, chunk_size, total=count, **params):
+                    battery.update(chunk, pool)
+                    progress.setValue(battery.count)
+                    if progress.wasCanceled():
+                        break
+            progress.close()
+            
+            lines = [f"{name}: estadístico = {statistic:.4f}   p = {p_value:.4f}"
+                     for name, (statistic, p_value) in battery.results().items()]
+            QMessageBox.information(
+                self, "Pruebas de calidad",
+                f"Método {method}, {battery.count} valores:\n\n" + "\n".join(lines) +
+                "\n\nValores p muy cercanos a 0 (o a 1) indican que el generador falla la prueba.")
+        
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Ocurrió un error durante las pruebas:\n{str(e)}")
+    
+    def crear_transformacion(self, distribution):
+        """Devuelve la transformación f(u, source) de la distribución seleccionada.
+        
+        Los parámetros se leen de los controles en el momento de la llamada, de modo
+        que la función puede usarse después desde otro hilo. Las transformaciones
+        vectorizadas escriben sobre el propio bloque; las que usan rechazo toman de
+        `source` los uniformes adicionales.
+        """
+        transform = None
+        if distribution == "Uniforme":
+            a = self.uniform_min.value()
+            b = self.uniform_max.value()
+            transform = lambda u, source: self.transformer.uniform(u, a, b, out=u)
+        elif distribution == "Normal":
+            mean = self.normal_mean.value()
+            std = self.normal_std.value()
+            method = 'ziggurat' if self.normal_method.currentText() == "Ziggurat" else 'box-muller'
+            transform = lambda u, source: self.transformer.normal(u, mean, std, out=u, method=method, source=source)
+        elif distribution == "Exponencial":
+            lambd = self.exp_lambda.value()
+            method = 'ziggurat' if self.exp_method.currentText() == "Ziggurat" else 'inversion'
+            transform = lambda u, source: self.transformer.exponential(u, lambd, out=u, method=method, source=source)
+        elif distribution == "Poisson":
+            lambd = self.poisson_lambda.value()
+            transform = lambda u, source: self.transformer.poisson(u, lambd, source=source)
+        elif distribution == "Binomial":
+            n = self.binomial_n.value()
+            p = self.binomial_p.value()
+            transform = lambda u, source: self.transformer.binomial(u, n, p, source=source)
+        elif distribution == "Gamma":
+            shape = self.gamma_shape.value()
+            scale = self.gamma_scale.value()
+            transform = lambda u, source: self.transformer.gamma(u, shape, scale, source=source)
+        elif distribution == "Beta":
+            alpha = self.beta_alpha.value()
+            beta = self.beta_beta.value()
+            transform = lambda u, source: self.transformer.beta(u, alpha, beta, source=source)
+        elif distribution == "Chi-cuadrado":
+            df = self.chi2_df.value()
+            transform = lambda u, source: self.transformer.chi_squared(u, df, source=source)
+        elif distribution == "t-Student":
+            df = self.t_df.value()
+            transform = lambda u, source: self.transformer.t_distribution(u, df, source=source)
+        elif distribution == "F":
+            dfn = self.f_dfn.value()
+            dfd = self.f_dfd.value()
+            transform = lambda u, source: self.transformer.f_distribution(u, dfn, dfd, source=source)
+        elif distribution == "Geométrica":
+            p = self.geo_p.value()
+            transform = lambda u, source: self.transformer.geometric(u, p)
+        elif distribution == "Binomial Negativa":
+            n = self.nbinom_n.value()
+            p = self.nbinom_p.value()
+            transform = lambda u, source: self.transformer.negative_binomial(u, n, p, source=source)
+        elif distribution == "Discreta (tabla)":
+            if self.alias_table is None:
+                raise ValueError("Primero cargue una tabla de probabilidades desde un CSV")
+            transform = lambda u, source: self.transformer.discrete(u, self.alias_table, source=source)
+        return transform
+    
+    # Puntos que se dibujan como máximo en el gráfico de secuencia
+    SEQUENCE_POINTS = 2000
+    
+    @staticmethod
+    def lttb(values, threshold):
+        """Índices de los puntos elegidos por Largest-Triangle-Three-Buckets.
+        
+        Conserva el primero y el último; de cada cubeta intermedia toma el punto que
+        forma el triángulo de mayor área con el elegido antes y el promedio de la
+        cubeta siguiente, así que picos y valles sobreviven a la reducción.
+        """
+        n = len(values)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+        y = np.asarray(values, dtype=np.float64)
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+        # Promedio de cada cubeta (la última cubeta "siguiente" es el punto final)
+        sums = np.add.reduceat(y[:n - 1], edges[:-1])
+        lengths = np.diff(edges)
+        avg_x = np.append((edges[:-1] + edges[1:] - 1) / 2, n - 1)
+        avg_y = np.append(sums / lengths, y[-1])
+        
+        selected = np.empty(threshold, dtype=np.intp)
+        selected[0], selected[-1] = 0, n - 1
+        a = 0
+        for i in range(threshold - 2):
+            start, stop = edges[i], edges[i + 1]
+            bx = np.arange(start, stop)
+            area = np.abs((a - avg_x[i + 1]) * (y[start:stop] - y[a]) - (a - bx) * (avg_y[i + 1] - y[a]))
+            a = start + int(np.argmax(area))
+            selected[i + 1] = a
+        return selected
+    
     def plot_analysis(self, numbers, method, distribution):
         # Limpiar gráficos anteriores
         for ax in self.axes:
             ax.clear()
-
+        
+        # Estadísticos e histograma en una sola pasada sobre el arreglo
+        numbers = np.asarray(numbers, dtype=np.float64)
+        finite = numbers if np.isfinite(numbers).all() else numbers[np.isfinite(numbers)]
+        if finite.size == 0:
+            # Sin valores finitos (inf o NaN) no hay histograma ni secuencia que dibujar
+            for ax in self.axes:
+                ax.text(0.5, 0.5, "No hay valores finitos para graficar", ha='center', va='center',
+                        transform=ax.transAxes, fontsize=11, color="#0b2447")
+            self.figure.suptitle(f"{method.split(' ')[0]} - {distribution}",
+                                 fontsize=12, fontweight='bold', color="#0b2447")
+            self.canvas.draw()
+            return
+        min_val, max_val = float(finite.min()), float(finite.max())
+        mean = float(finite.mean())
+        std = float(finite.std())
+        
         # Ajustar el número de bins para el histograma
-        try:
-            data_range = max(numbers) - min(numbers)
-            if data_range > 0:
-                n_bins = int(np.ceil(np.log2(len(numbers)) + 1))
-                n_bins = min(max(n_bins, 10), 50)
-            else:
-                n_bins = 20
-        except:
+        if max_val - min_val > 0:
+            n_bins = int(np.ceil(np.log2(len(finite)) + 1))
+            n_bins = min(max(n_bins, 10), 50)
+        else:
             n_bins = 20
-
-        # Histograma con estilo similar al gráfico de la imagen
-        self.axes[0].hist(numbers, bins=n_bins, color='#1976D2', alpha=0.8, edgecolor='white', linewidth=1)
-
-        # Calcular media y desviación para la curva normal (usando datos reales)
-        mean = np.mean(numbers)
-        std = np.std(numbers)
-
-        # Crear valores x para la curva normal
-        x = np.linspace(min(numbers), max(numbers), 200)
-        y = (1 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std)**2)
-
-        # Escalar la curva para que encaje con el histograma
-        scale_factor = len(numbers) * (max(numbers) - min(numbers)) / n_bins
+        counts, bin_edges = np.histogram(finite, bins=n_bins)
+        
+        # Histograma con estilo similar al gráfico de la imagen (desde los conteos)
+        self.axes[0].hist(bin_edges[:-1], bins=bin_edges, weights=counts,
+                          color='#1976D2', alpha=0.8, edgecolor='white', linewidth=1)
+        
+        # Curva normal con la media y desviación de los datos, escalada al histograma
+        x = np.linspace(min_val, max_val, 200)
+        y = (1 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std)**2) if std > 0 else np.zeros_like(x)
+        scale_factor = len(finite) * (max_val - min_val) / n_bins
         y_scaled = y * scale_factor
-
+        
         # Graficar la curva normal en rojo
         self.axes[0].plot(x, y_scaled, color='red', linewidth=2, label=f"Normal(μ={mean:.2f}, σ={std:.2f})")
-
+        
         self.axes[0].set_title("Distribución", fontweight='bold', color="#0b2447")
         self.axes[0].set_xlabel("Valor", fontweight='bold')
         self.axes[0].set_ylabel("Frecuencia", fontweight='bold')
         self.axes[0].grid(True, linestyle='--', alpha=0.7)
         self.axes[0].legend()
 
-        # Gráfico de dispersión secuencial (igual que antes)
-        self.axes[1].plot(range(len(numbers)), numbers, 'o', markersize=3, color='#1976D2', alpha=0.6)
+        # Gráfico de dispersión secuencial reducido con LTTB: el costo de dibujar no
+        # depende de la cantidad de valores
+        shown = self.lttb(numbers, self.SEQUENCE_POINTS)
+        self.axes[1].plot(shown, numbers[shown], 'o', markersize=3, color='#1976D2', alpha=0.6)
         self.axes[1].set_title("Secuencia", fontweight='bold', color="#0b2447")
         self.axes[1].set_xlabel("Índice", fontweight='bold')
         self.axes[1].set_ylabel("Valor", fontweight='bold')
@@ -965,8 +939,6 @@ class numram(QWidget):
 
         self.axes[0].set_ylim(bottom=0)
 
-        min_val = min(numbers)
-        max_val = max(numbers)
         padding = (max_val - min_val) * 0.05
         self.axes[1].set_ylim(min_val - padding, max_val + padding)
 
@@ -0,0 +1,2367 @@
+# Núcleo de aleatorios.py sin dependencias de Qt ni de matplotlib: generadores, flujos,
+# pruebas y transformaciones. Así la salida cruda funciona también en un servidor sin pantalla.
+import sys
+import os
+import math
+import time
+import inspect
+import hashlib
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri, gammaln, expit, gammainc
+from scipy.stats import chi2, kstwo, norm, poisson, kstest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class RandomGenerator:
+    """Clase que implementa diferentes algoritmos de generación de números aleatorios"""
+    
+    # Métodos con salto O(log n) (o acceso directo, los basados en contador y las
+    # secuencias de baja discrepancia) que admiten `offset` y división en subflujos
+    JUMPABLE = ('lcg', 'mcg', 'pcg', 'philox', 'threefry', 'sobol', 'halton')
+    
+    # Métodos cuya salida nativa son palabras de 32 bits (ver raw_stream)
+    NATIVE_WORDS = ('mersenne_twister', 'xorshift', 'pcg', 'philox', 'threefry', 'well', 'tausworthe')
+    
+    # Constantes de Philox4x32 (multiplicadores y constantes de Weyl de la clave)
+    PHILOX_M = (0xD2511F53, 0xCD9E8D57)
+    PHILOX_W = (0x9E3779B9, 0xBB67AE85)
+    
+    # Rotaciones de Threefry2x32 y paridad del calendario de claves de Skein
+    THREEFRY_R = (13, 15, 26, 6, 17, 29, 16, 24)
+    THREEFRY_PARITY = 0x1BD11BDA
+    
+    # Parámetros (R, M1, M2, M3) de las variantes de WELL de Panneton, L'Ecuyer y Matsumoto
+    WELL_VARIANTS = {'512a': (16, 13, 9, 5), '1024a': (32, 3, 24, 10)}
+    
+    # Componentes (máscara, q, s, k) de los Tausworthe combinados de L'Ecuyer;
+    # cada semilla de componente debe ser al menos 1 + ~máscara
+    TAUSWORTHE_VARIANTS = {
+        'taus88': ((0xFFFFFFFE, 13, 19, 12), (0xFFFFFFF8, 2, 25, 4), (0xFFFFFFF0, 3, 11, 17)),
+        'lfsr113': ((0xFFFFFFFE, 6, 13, 18), (0xFFFFFFF8, 2, 27, 2),
+                    (0xFFFFFFF0, 13, 21, 7), (0xFFFFFF80, 3, 12, 13)),
+    }
+    
+    @staticmethod
+    def _output(numbers, as_array):
+        """Devuelve el resultado como arreglo de numpy o como lista de Python"""
+        return numbers if as_array else numbers.tolist()
+    
+    @staticmethod
+    def _normalize(values, divisor):
+        """Divide los enteros generados entre el divisor con redondeo exacto (igual que int / int)"""
+        if values.dtype == object:
+            return (values / divisor).astype(np.float64)
+        return values / divisor
+    
+    @staticmethod
+    def _affine_block(n, x, a, c, m):
+        """Devuelve los n estados siguientes de la recurrencia x -> (a*x + c) mod m.
+        
+        Se calculan los primeros L estados en serie (L ~ sqrt(n)) junto con el mapa
+        compuesto x -> (A*x + C) mod m que avanza L pasos; a partir de ahí cada fila
+        de L carriles intercalados se obtiene de la anterior con una sola operación
+        vectorial. Al aplanar las filas se recupera la secuencia en su orden original.
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.uint64)
+        a, c, x = a % m, c % m, x % m
+        lanes = max(1, math.isqrt(n))
+        rows = -(-n // lanes)
+        
+        first = []
+        mult, inc = 1, 0
+        for _ in range(lanes):
+            x = (a * x + c) % m
+            first.append(x)
+            mult, inc = (a * mult) % m, (a * inc + c) % m
+        
+        # uint64 es exacto si los productos caben en 64 bits o si m es potencia de 2
+        power_of_two = m & (m - 1) == 0
+        if m <= 2**32 or (power_of_two and m <= 2**64):
+            states = np.empty((rows, lanes), dtype=np.uint64)
+            states[0] = first
+            for r in range(1, rows):
+                row = states[r]
+                np.multiply(states[r - 1], mult, out=row)
+                np.add(row, inc, out=row)
+                if power_of_two:
+                    np.bitwise_and(row, m - 1, out=row)
+                else:
+                    np.remainder(row, m, out=row)
+        else:
+            # Módulos arbitrarios: enteros de Python dentro de un arreglo object
+            states = np.empty((rows, lanes), dtype=object)
+            states[0] = first
+            for r in range(1, rows):
+                states[r] = (states[r - 1] * mult + inc) % m
+        return states.ravel()[:n]
+    
+    @staticmethod
+    def affine_jump(k, a, c, m):
+        """Coeficientes (A, C) del mapa que avanza k pasos: x_{i+k} = (A*x_i + C) mod m.
+        
+        Se obtienen por exponenciación binaria del mapa afín, en O(log k) operaciones.
+        """
+        A, C = 1, 0
+        step_a, step_c = a % m, c % m
+        while k > 0:
+            if k & 1:
+                A, C = (A * step_a) % m, (C * step_a + step_c) % m
+            # Componer el mapa consigo mismo: x -> a*(a*x + c) + c
+            step_a, step_c = (step_a * step_a) % m, (step_c * (step_a + 1)) % m
+            k >>= 1
+        return A, C
+    
+    @staticmethod
+    def skip_ahead(seed, k, a, c, m):
+        """Estado de la recurrencia x -> (a*x + c) mod m después de k pasos"""
+        A, C = RandomGenerator.affine_jump(k, a, c, m)
+        return (A * seed + C) % m
+    
+    @staticmethod
+    def split(method, n, k, seed=None, **params):
+        """Divide los n primeros valores de un flujo en k subflujos contiguos sin solapamiento.
+        
+        Cada subflujo es un diccionario con los argumentos para `generate_substream`;
+        concatenar sus salidas en orden reproduce exactamente la secuencia serie.
+        """
+        if method not in RandomGenerator.JUMPABLE:
+            raise ValueError(f"El método '{method}' no admite saltos; use uno de {RandomGenerator.JUMPABLE}")
+        if k < 1:
+            raise ValueError("El número de subflujos debe ser al menos 1")
+        if seed is not None:
+            params['seed'] = seed
+        base, extra = divmod(n, k)
+        substreams = []
+        offset = params.pop('offset', 0)
+        for i in range(k):
+            count = base + (1 if i < extra else 0)
+            substreams.append(dict(params, method=method, n=count, offset=offset))
+            offset += count
+        return substreams
+    
+    @staticmethod
+    def generate_substream(substream):
+        """Genera como arreglo de numpy un subflujo devuelto por `split`"""
+        params = dict(substream)
+        method = params.pop('method')
+        n = params.pop('n')
+        return getattr(RandomGenerator, method)(n, as_array=True, **params)
+    
+    @staticmethod
+    def generate_parallel(method, n, seed=None, workers=None, **params):
+        """Genera n valores repartiendo subflujos disjuntos entre varios procesos.
+        
+        El resultado coincide valor a valor con la llamada serie equivalente.
+        """
+        workers = workers or os.cpu_count() or 1
+        substreams = RandomGenerator.split(method, n, workers, seed, **params)
+        if workers == 1:
+            return RandomGenerator.generate_substream(substreams[0])
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(RandomGenerator.generate_substream, substreams))
+        return np.concatenate(chunks)
+    
+    @staticmethod
+    def _linear32_block(step, n, state):
+        """Devuelve los n estados siguientes de una recurrencia lineal sobre GF(2) de 32 bits.
+        
+        `step` aplica un paso a un arreglo uint64 de palabras. Al evolucionar el estado
+        junto con la base canónica se obtienen la primera fila de L estados y la matriz
+        de T^L, que se guarda como cuatro tablas de 256 entradas (una por byte). Cada
+        fila siguiente se calcula con cuatro búsquedas en tabla y tres XOR.
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.uint64)
+        lanes = max(1, math.isqrt(n))
+        rows = -(-n // lanes)
+        
+        words = np.array([state] + [1 << j for j in range(32)], dtype=np.uint64)
+        states = np.empty((rows, lanes), dtype=np.uint64)
+        for i in range(lanes):
+            words = step(words)
+            states[0, i] = words[0]
+        
+        images = words[1:]
+        bits = (np.arange(256)[:, None] >> np.arange(8)) & 1 == 1
+        tables = [np.bitwise_xor.reduce(np.where(bits, images[8 * k:8 * k + 8], 0), axis=1)
+                  for k in range(4)]
+        for r in range(1, rows):
+            prev = states[r - 1]
+            states[r] = (tables[0][prev & 0xFF] ^ tables[1][(prev >> 8) & 0xFF] ^
+                         tables[2][(prev >> 16) & 0xFF] ^ tables[3][prev >> 24])
+        return states.ravel()[:n]
+    
+    @staticmethod
+    def _xorshift_step(s):
+        """Un paso de XorShift de 32 bits sobre un arreglo uint64"""
+        s = s ^ ((s << 13) & 0xFFFFFFFF)
+        s = s ^ ((s >> 17) & 0xFFFFFFFF)
+        return s ^ ((s << 5) & 0xFFFFFFFF)
+    
+    @staticmethod
+    def _tausworthe_step(z, mask, q, s, k):
+        """Un paso de una componente Tausworthe con desplazamientos de palabra completa"""
+        b = (((z << q) & 0xFFFFFFFF) ^ z) >> s
+        return (((z & mask) << k) & 0xFFFFFFFF) ^ b
+    
+    @staticmethod
+    def _lfsr_step(s):
+        """32 pasos de bit del LFSR x^32 + x^3 + 1 (q = 3) en una sola operación de palabra.
+        
+        El bit nuevo j vale b_j ^ b_(j+3); los tres bits altos dependen de los tres
+        primeros bits nuevos, que se corrigen con un segundo XOR.
+        """
+        t = s ^ (s >> 3)
+        return t ^ ((t & 0x7) << 29)
+    
+    @staticmethod
+    def _seed_words(seed, r):
+        """Deriva r palabras de estado de 32 bits a partir de una semilla entera"""
+        state = np.empty(r, dtype=np.uint64)
+        word = seed & 0xFFFFFFFF
+        for k in range(r):
+            state[k] = word
+            word = (1812433253 * (word ^ (word >> 30)) + k + 1) & 0xFFFFFFFF
+        return state
+    
+    @staticmethod
+    def _well_run(state, blocks, variant, out=None):
+        """Avanza en el lugar `blocks` bloques de R pasos en cada carril (columna) de `state`.
+        
+        Cada bloque deja el índice circular en su posición inicial, por lo que se
+        recorre con índices fijos. Si se indica `out`, su columna t recibe la salida t
+        de los primeros out.shape[0] carriles.
+        """
+        r, m1, m2, m3 = RandomGenerator.WELL_VARIANTS[variant]
+        mask = 0xFFFFFFFF
+        lanes = 0 if out is None else out.shape[0]
+        t = 0
+        for _ in range(blocks):
+            for i in range(0, -r, -1):
+                i %= r
+                prev = (i + r - 1) % r
+                z0 = state[prev]
+                v0, vm1, vm2 = state[i], state[(i + m1) % r], state[(i + m2) % r]
+                if variant == '512a':
+                    z1 = (v0 ^ (v0 << 16) ^ vm1 ^ (vm1 << 15)) & mask
+                    z2 = vm2 ^ (vm2 >> 11)
+                    new1 = z1 ^ z2
+                    new0 = (z0 ^ (z0 << 2) ^ z1 ^ (z1 << 18) ^ (z2 << 28) ^
+                            new1 ^ ((new1 << 5) & 0xDA442D24)) & mask
+                else:
+                    vm3 = state[(i + m3) % r]
+                    z1 = v0 ^ vm1 ^ (vm1 >> 8)
+                    z2 = (vm2 ^ (vm2 << 19) ^ vm3 ^ (vm3 << 14)) & mask
+                    new1 = z1 ^ z2
+                    new0 = (z0 ^ (z0 << 11) ^ z1 ^ (z1 << 7) ^ z2 ^ (z2 << 13)) & mask
+                state[i] = new1
+                state[prev] = new0
+                if lanes:
+                    out[:, t] = new0[:lanes]
+                t += 1
+    
+    @staticmethod
+    def _well_words(n, state, variant):
+        """Devuelve al menos n palabras de 32 bits del flujo WELL y el estado final exacto.
+        
+        El flujo se reparte en carriles contiguos de B bloques de R pasos. El primer
+        carril avanza junto con la base canónica del estado, lo que da la matriz de
+        M^B sobre GF(2); con ella se calcula el estado inicial de cada carril y todos
+        avanzan a la vez, de modo que la salida coincide con la secuencia serie. Se
+        generan carriles completos, así que el estado final corresponde a la última
+        palabra devuelta y permite continuar el flujo.
+        """
+        r = RandomGenerator.WELL_VARIANTS[variant][0]
+        if n <= 0:
+            return np.empty(0, dtype=np.uint64), state
+        blocks = -(-n // r)
+        per_lane = max(1, math.isqrt(blocks // r))
+        lanes = -(-blocks // per_lane)
+        bits = 32 * r
+        
+        shifts = np.arange(32, dtype=np.uint64)
+        index = np.arange(bits)
+        work = np.zeros((r, bits + 1), dtype=np.uint64)
+        work[:, 0] = state
+        work[index // 32, index + 1] = np.uint64(1) << (index % 32).astype(np.uint64)
+        out = np.empty((lanes, per_lane * r), dtype=np.uint64)
+        RandomGenerator._well_run(work, per_lane, variant, out[:1])
+        final = work[:, 0]
+        
+        if lanes > 1:
+            jump = ((work[:, None, 1:] >> shifts[None, :, None]) & 1).reshape(bits, bits)
+            jump = jump.astype(np.float32)
+            starts = np.empty((r, lanes - 1), dtype=np.uint64)
+            current = ((state[:, None] >> shifts) & 1).ravel().astype(np.float32)
+            for j in range(lanes - 1):
+                current = np.remainder(jump @ current, 2)
+                starts[:, j] = (current.reshape(r, 32).astype(np.uint64) << shifts).sum(axis=1)
+            RandomGenerator._well_run(starts, per_lane, variant, out[1:])
+            final = starts[:, -1]
+        return out.ravel(), final.copy()
+    
+    @staticmethod
+    def benchmark(n=1000000, methods=('mersenne_twister', 'well', ('well', {'variant': '1024a'})), repeat=3):
+        """Mide el mejor tiempo (en segundos) de generar n valores con cada método.
+        
+        Cada elemento de `methods` es un nombre de método o un par (nombre, parámetros).
+        """
+        timings = {}
+        for method in methods:
+            name, params = (method, {}) if isinstance(method, str) else method
+            label = name + ''.join(f" {k}={v}" for k, v in params.items())
+            func = getattr(RandomGenerator, name)
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(n, as_array=True, **params)
+                best = min(best, time.perf_counter() - start)
+            timings[label] = best
+        return timings
+    
+    @staticmethod
+    def mersenne_twister(n, seed=None, as_array=False):
+        """Generador Mersenne Twister usando numpy"""
+        # Estado propio por llamada (misma secuencia que np.random.seed) para no
+        # compartir el estado global de numpy entre hilos o ventanas
+        return RandomGenerator._output(np.random.RandomState(seed).random_sample(n), as_array)
+    
+    @staticmethod
+    def xorshift(n, seed=123456789, as_array=False):
+        """Implementación básica de XorShift"""
+        states = RandomGenerator._xorshift_states(n, seed)
+        # Normalizar a [0,1)
+        numbers = RandomGenerator._normalize(states, 0xFFFFFFFF)
+        return RandomGenerator._output(numbers, as_array)
+    
+    @staticmethod
+    def _xorshift_states(n, state):
+        """Devuelve los n estados siguientes de XorShift; el último permite continuar el flujo"""
+        if 0 <= state <= 0xFFFFFFFF:
+            return RandomGenerator._linear32_block(RandomGenerator._xorshift_step, n, state)
+        # Semillas fuera de 32 bits conservan bits altos: se recorre en serie
+        states = np.empty(max(n, 0), dtype=object)
+        for i in range(n):
+            state ^= (state << 13) & 0xFFFFFFFF
+            state ^= (state >> 17) & 0xFFFFFFFF
+            state ^= (state << 5) & 0xFFFFFFFF
+            states[i] = state
+        return states
+    
+    @staticmethod
+    def pcg(n, seed=42, mult=6364136223846793005, inc=1442695040888963407, as_array=False, offset=0):
+        """Implementación básica de PCG (Permuted Congruential Generator)"""
+        result = RandomGenerator._pcg_words(n, seed, mult, inc, offset)
+        # Normalizar a [0,1)
+        return RandomGenerator._output(result / 0xFFFFFFFF, as_array)
+    
+    @staticmethod
+    def _pcg_words(n, seed, mult, inc, offset):
+        """Palabras de 32 bits de PCG en las posiciones [offset, offset + n)"""
+        # Saltar `offset` posiciones del flujo sin recorrerlas
+        seed = RandomGenerator.skip_ahead(seed, offset, mult, inc, 2**64)
+        # Actualizar estado usando LCG (módulo 2^64)
+        state = RandomGenerator._affine_block(n, seed, mult, inc, 2**64)
+        # Aplicar función de salida PCG
+        xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
+        rot = state >> 59
+        return ((xorshifted >> rot) | (xorshifted << (32 - rot))) & 0xFFFFFFFF
+    
+    @staticmethod
+    def _counter_blocks(n, offset, width):
+        """Bloques de contador que cubren las posiciones [offset, offset + n) y el desfase inicial"""
+        first, skip = divmod(offset, width)
+        blocks = -(-(skip + max(n, 0)) // width)
+        counters = np.arange(blocks, dtype=np.uint64) + np.uint64(first)
+        return counters, skip
+    
+    @staticmethod
+    def philox_block(counters, key, rounds=10):
+        """Aplica Philox4x32 a cuatro arreglos de palabras de contador con la clave (k0, k1).
+        
+        Cada ronda multiplica dos palabras por constantes de 32 bits y mezcla las
+        mitades alta y baja de los productos con las otras palabras y la clave.
+        """
+        mask = np.uint64(0xFFFFFFFF)
+        m0, m1 = (np.uint64(m) for m in RandomGenerator.PHILOX_M)
+        c0, c1, c2, c3 = (np.asarray(c, dtype=np.uint64) for c in counters)
+        k0, k1 = key
+        for r in range(rounds):
+            p0 = m0 * c0
+            p1 = m1 * c2
+            c0, c1, c2, c3 = ((p1 >> np.uint64(32)) ^ c1 ^ np.uint64(k0), p1 & mask,
+                              (p0 >> np.uint64(32)) ^ c3 ^ np.uint64(k1), p0 & mask)
+            k0 = (k0 + RandomGenerator.PHILOX_W[0]) & 0xFFFFFFFF
+            k1 = (k1 + RandomGenerator.PHILOX_W[1]) & 0xFFFFFFFF
+        return c0, c1, c2, c3
+    
+    @staticmethod
+    def philox(n, seed=20111115, as_array=False, offset=0):
+        """Generador Philox4x32-10 basado en contador (Salmon et al., 2011).
+        
+        El valor i es una palabra del bloque cifrado del contador i // 4 con la clave
+        derivada de la semilla, así que cualquier posición se calcula directamente sin
+        recorrer las anteriores.
+        """
+        words = RandomGenerator._philox_words(n, seed, offset)
+        # Normalizar a [0,1)
+        return RandomGenerator._output(words / 2**32, as_array)
+    
+    @staticmethod
+    def _philox_words(n, seed, offset):
+        """Palabras de 32 bits de Philox4x32-10 en las posiciones [offset, offset + n)"""
+        counters, skip = RandomGenerator._counter_blocks(n, offset, 4)
+        mask = np.uint64(0xFFFFFFFF)
+        key = (seed & 0xFFFFFFFF, (seed >> 32) & 0xFFFFFFFF)
+        zeros = np.zeros_like(counters)
+        words = RandomGenerator.philox_block((counters & mask, counters >> np.uint64(32), zeros, zeros), key)
+        return np.stack(words, axis=1).ravel()[skip:skip + max(n, 0)]
+    
+    @staticmethod
+    def threefry_block(counters, key, rounds=20):
+        """Aplica Threefry2x32 a dos arreglos de palabras de contador con la clave (k0, k1).
+        
+        Cada ronda suma, rota y aplica XOR; cada cuatro rondas se inyecta la clave
+        extendida con la paridad de Skein.
+        """
+        mask = np.uint64(0xFFFFFFFF)
+        k0, k1 = key
+        ks = (k0, k1, RandomGenerator.THREEFRY_PARITY ^ k0 ^ k1)
+        x0 = (np.asarray(counters[0], dtype=np.uint64) + np.uint64(ks[0])) & mask
+        x1 = (np.asarray(counters[1], dtype=np.uint64) + np.uint64(ks[1])) & mask
+        for r in range(rounds):
+            rot = RandomGenerator.THREEFRY_R[r % 8]
+            x0 = (x0 + x1) & mask
+            x1 = ((x1 << np.uint64(rot)) & mask) | (x1 >> np.uint64(32 - rot))
+            x1 ^= x0
+            if r % 4 == 3:
+                injection = (r + 1) // 4
+                x0 = (x0 + np.uint64(ks[injection % 3])) & mask
+                x1 = (x1 + np.uint64((ks[(injection + 1) % 3] + injection) & 0xFFFFFFFF)) & mask
+        return x0, x1
+    
+    @staticmethod
+    def threefry(n, seed=20111115, as_array=False, offset=0):
+        """Generador Threefry2x32-20 basado en contador (Salmon et al., 2011).
+        
+        Igual que Philox, el valor i sale del bloque del contador i // 2, de modo que
+        cualquier rango de posiciones se genera de forma independiente.
+        """
+        words = RandomGenerator._threefry_words(n, seed, offset)
+        # Normalizar a [0,1)
+        return RandomGenerator._output(words / 2**32, as_array)
+    
+    @staticmethod
+    def _threefry_words(n, seed, offset):
+        """Palabras de 32 bits de Threefry2x32-20 en las posiciones [offset, offset + n)"""
+        counters, skip = RandomGenerator._counter_blocks(n, offset, 2)
+        mask = np.uint64(0xFFFFFFFF)
+        key = (seed & 0xFFFFFFFF, (seed >> 32) & 0xFFFFFFFF)
+        words = RandomGenerator.threefry_block((counters & mask, counters >> np.uint64(32)), key)
+        return np.stack(words, axis=1).ravel()[skip:skip + max(n, 0)]
+    
+    @staticmethod
+    def well(n, seed=123456789, variant='512a', as_array=False):
+        """WELL (Well Equidistributed Long-period Linear), variantes WELL512a y WELL1024a"""
+        if variant not in RandomGenerator.WELL_VARIANTS:
+            raise ValueError(f"Variante de WELL desconocida: {variant}")
+        state = RandomGenerator._seed_words(seed, RandomGenerator.WELL_VARIANTS[variant][0])
+        words, _ = RandomGenerator._well_words(n, state, variant)
+        # Normalizar a [0,1)
+        return RandomGenerator._output(words[:n] / 2**32, as_array)
+    
+    @staticmethod
+    def lcg(n, seed=123456789, a=1103515245, c=12345, m=2**31, as_array=False, offset=0):
+        """Generador Congruencial Lineal Mixto"""
+        seed = RandomGenerator.skip_ahead(seed, offset, a, c, m)
+        states = RandomGenerator._affine_block(n, seed, a, c, m)
+        return RandomGenerator._output(RandomGenerator._normalize(states, m), as_array)
+    
+    @staticmethod
+    def mcg(n, seed=123456789, a=48271, m=2**31-1, as_array=False, offset=0):
+        """Generador Congruencial Multiplicativo"""
+        seed = RandomGenerator.skip_ahead(seed, offset, a, 0, m)
+        states = RandomGenerator._affine_block(n, seed, a, 0, m)
+        return RandomGenerator._output(RandomGenerator._normalize(states, m), as_array)
+    
+    @staticmethod
+    def tausworthe(n, seed=123456789, variant='lfsr113', as_array=False):
+        """Generadores Tausworthe combinados de L'Ecuyer (taus88 y LFSR113).
+        
+        Cada componente es una recurrencia lineal de 32 bits que avanza con
+        desplazamientos y XOR de palabra completa, vectorizada por carriles; la salida
+        es el XOR de todas las componentes. La variante 'lfsr' conserva el LFSR simple
+        de registro de 32 bits (taps en 0 y 3) de versiones anteriores.
+        """
+        if variant == 'lfsr':
+            return RandomGenerator._tausworthe_lfsr(n, seed, as_array)
+        if variant not in RandomGenerator.TAUSWORTHE_VARIANTS:
+            raise ValueError(f"Variante de Tausworthe desconocida: {variant}")
+        components = RandomGenerator.TAUSWORTHE_VARIANTS[variant]
+        states = RandomGenerator._tausworthe_seeds(seed, components)
+        words, _ = RandomGenerator._tausworthe_words(n, states, components)
+        # Normalizar a [0,1)
+        return RandomGenerator._output(words / 2**32, as_array)
+    
+    @staticmethod
+    def _tausworthe_seeds(seed, components):
+        """Semillas de cada componente a partir de una semilla entera"""
+        states = []
+        for z, (mask, q, s, k) in zip(RandomGenerator._seed_words(seed, len(components)), components):
+            # Semillas por debajo del mínimo dejarían la componente en un ciclo trivial
+            z = int(z)
+            if z <= (~mask & 0xFFFFFFFF):
+                z += (~mask & 0xFFFFFFFF) + 1
+            states.append(z)
+        return states
+    
+    @staticmethod
+    def _tausworthe_words(n, states, components):
+        """Devuelve n palabras combinadas y el estado final de cada componente"""
+        words = np.zeros(max(n, 0), dtype=np.uint64)
+        final = []
+        for z, (mask, q, s, k) in zip(states, components):
+            step = lambda v, mask=mask, q=q, s=s, k=k: RandomGenerator._tausworthe_step(v, mask, q, s, k)
+            component = RandomGenerator._linear32_block(step, n, z)
+            words ^= component
+            final.append(int(component[-1]) if n > 0 else z)
+        return words, final
+    
+    @staticmethod
+    def _tausworthe_lfsr(n, seed, as_array):
+        """Implementación básica de generador Tausworthe/LFSR (modo de compatibilidad)"""
+        states, _ = RandomGenerator._lfsr_states(n, seed)
+        # Normalizar a [0,1)
+        numbers = RandomGenerator._normalize(states, 0xFFFFFFFF)
+        return RandomGenerator._output(numbers, as_array)
+    
+    @staticmethod
+    def _lfsr_states(n, s):
+        """Devuelve los n registros emitidos por el LFSR simple y el registro siguiente.
+        
+        Los 32 bits extraídos en cada salida son exactamente el registro antes de
+        desplazarlo, así que la salida k es el estado tras k saltos de 32 bits.
+        """
+        if 0 <= s <= 0xFFFFFFFF:
+            states = np.empty(max(n, 0), dtype=np.uint64)
+            states[:1] = s
+            states[1:] = RandomGenerator._linear32_block(RandomGenerator._lfsr_step, n - 1, s)
+            if n > 0:
+                s = int(RandomGenerator._lfsr_step(states[-1]))
+            return states, s
+        # Semillas de más de 32 bits: se conserva el recorrido bit a bit original
+        states = np.empty(max(n, 0), dtype=object)
+        r = 32  # Tamaño del registro
+        q = 3  # Posición de tap
+        for i in range(n):
+            result = 0
+            for j in range(32):
+                bit = (s >> 0) & 1  # Bit menos significativo
+                result = result | (bit << j)
+                new_bit = ((s >> 0) ^ (s >> q)) & 1  # XOR de bits en posiciones 0 y q
+                s = (s >> 1) | (new_bit << (r-1))  # Desplazar y añadir nuevo bit
+            states[i] = result
+        return states, s
+    
+    @staticmethod
+    def middle_square(n, seed=675248, as_array=False):
+        """Método de Productos Medios (Von Neumann).
+        
+        Si `seed` es un arreglo de semillas, todas avanzan a la vez como carriles
+        independientes y el resultado tiene forma (len(seed), n).
+        """
+        if np.ndim(seed) > 0:
+            x, half, modulus = RandomGenerator._middle_square_seeds(seed)
+            start = x.copy()
+            states = np.empty((n,) + x.shape, dtype=x.dtype)
+            for i in range(n):
+                x = (x * x // half) % modulus
+                states[i] = x
+                # Al llegar a cero cada carril vuelve a su semilla
+                x = np.where(x == 0, start, x)
+            numbers = (np.moveaxis(states, 0, -1) / modulus[:, None]).astype(np.float64)
+            return RandomGenerator._output(numbers, as_array)
+        
+        digits = len(str(seed))
+        if digits % 2 != 0:
+            seed = seed * 10  # Asegurar un número par de dígitos
+            digits += 1
+        numbers, _ = RandomGenerator._middle_square_states(n, seed, seed, digits)
+        return RandomGenerator._output(numbers, as_array)
+    
+    @staticmethod
+    def _middle_square_seeds(seeds):
+        """Estados iniciales, 10^(d/2) y 10^d de cada semilla (int64 si x^2 cabe, object si no)"""
+        seeds = np.atleast_1d(np.asarray(seeds, dtype=object))
+        digits = np.array([len(str(seed)) for seed in seeds])
+        # Misma normalización que con una sola semilla: número par de dígitos
+        seeds = np.where(digits % 2 != 0, seeds * 10, seeds)
+        digits += digits % 2
+        dtype = np.int64 if digits.max() <= 9 else object
+        half = np.array([10 ** int(d // 2) for d in digits], dtype=dtype)
+        modulus = np.array([10 ** int(d) for d in digits], dtype=dtype)
+        return seeds.astype(dtype), half, modulus
+    
+    # Estados recordados como máximo al buscar el ciclo de una sola semilla
+    MIDDLE_SQUARE_MEMORY = 1000000
+    
+    @staticmethod
+    def _middle_square_states(n, x, seed, digits):
+        """Devuelve n valores normalizados de Productos Medios desde x y el estado siguiente.
+        
+        Los dígitos centrales se extraen con división entera y módulo por potencias de
+        diez. Como la recurrencia entra pronto en un ciclo, se recuerda en qué paso
+        apareció cada estado y, al repetirse uno, el resto de la salida se completa
+        repitiendo el ciclo sin calcularlo.
+        """
+        half, modulus = 10 ** (digits // 2), 10 ** digits
+        
+        def step(x):
+            x = (x * x // half) % modulus
+            # Verificar si hemos llegado a un ciclo (prevenir bucles)
+            return (x, x) if x else (0, seed)
+        
+        numbers = np.empty(max(n, 0), dtype=np.float64)
+        seen = {}
+        for i in range(n):
+            if x in seen:
+                j = seen[x]
+                period = i - j
+                numbers[i:] = np.resize(numbers[j:i], n - i)
+                # x es el estado del paso j: el siguiente estado está (n - j) % period pasos más allá
+                for _ in range((n - j) % period):
+                    _, x = step(x)
+                return numbers, x
+            if len(seen) < RandomGenerator.MIDDLE_SQUARE_MEMORY:
+                seen[x] = i
+            value, x = step(x)
+            numbers[i] = value / modulus
+        return numbers, x
+    
+    @staticmethod
+    def middle_square_weyl(n, seed=675248, w_seed=123456789, as_array=False):
+        """Método Cuadrático Medio con la secuencia de Weyl para evitar ciclos.
+        
+        La recurrencia cuadrática no admite saltos, así que cada secuencia se recorre
+        en serie; si `seed` es un arreglo de semillas, todas avanzan a la vez como
+        carriles independientes y el resultado tiene forma (len(seed), n).
+        """
+        m = 2**32
+        if np.ndim(seed) == 0:
+            numbers, _ = RandomGenerator._middle_square_weyl_states(n, seed, w_seed, w_seed)
+            return RandomGenerator._output(numbers, as_array)
+        
+        seeds = np.asarray(seed, dtype=object) % m
+        x = seeds.astype(np.uint64)
+        w = np.full(x.shape, w_seed % m, dtype=np.uint64)
+        step = np.uint64(w_seed % m)
+        states = np.empty((n,) + x.shape, dtype=np.uint64)
+        for i in range(n):
+            w = (w + step) & 0xFFFFFFFF
+            x = (x + w) & 0xFFFFFFFF
+            # El producto desborda 64 bits, pero su módulo 2^32 se conserva
+            x = (x * x) & 0xFFFFFFFF
+            states[i] = x
+        return RandomGenerator._output(np.moveaxis(states, 0, -1) / m, as_array)
+    
+    @staticmethod
+    def _middle_square_weyl_states(n, x, w, w_step):
+        """Devuelve n valores normalizados del Cuadrático Medio y el estado (x, w) siguiente"""
+        m = 2**32
+        numbers = np.empty(max(n, 0), dtype=np.float64)
+        for i in range(n):
+            # Actualizar secuencia de Weyl
+            w = (w + w_step) % m
+            # Combinar con el estado actual
+            x = (x + w) % m
+            # Operación cuadrado medio
+            x = (x * x) % m
+            # Normalizar a [0,1)
+            numbers[i] = x / m
+        return numbers, (x, w)
+    
+    # Polinomios primitivos y números de dirección iniciales de Joe y Kuo
+    # (new-joe-kuo-6.21201) como (grado s, coeficientes a, m_1..m_s), desde la dimensión 2
+    SOBOL_DIRECTIONS = (
+        (1, 0, (1,)), (2, 1, (1, 3)), (3, 1, (1, 3, 1)), (3, 2, (1, 1, 1)), (4, 1, (1, 1, 3, 3)),
+        (4, 4, (1, 3, 5, 13)), (5, 2, (1, 1, 5, 5, 17)), (5, 4, (1, 1, 5, 5, 5)),
+        (5, 7, (1, 1, 7, 11, 19)), (5, 11, (1, 1, 5, 1, 1)), (5, 13, (1, 1, 1, 3, 11)),
+        (5, 14, (1, 3, 5, 5, 31)), (6, 1, (1, 3, 3, 9, 7, 49)), (6, 13, (1, 1, 1, 15, 21, 21)),
+        (6, 16, (1, 3, 1, 13, 27, 49)), (6, 19, (1, 1, 1, 15, 7, 5)),
+        (6, 22, (1, 3, 1, 15, 13, 25)), (6, 25, (1, 1, 5, 5, 19, 61)),
+        (7, 1, (1, 3, 7, 11, 23, 15, 103)), (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+        (7, 7, (1, 1, 3, 13, 7, 35, 63)), (7, 8, (1, 3, 5, 9, 1, 25, 53)),
+        (7, 14, (1, 3, 1, 13, 9, 35, 107)), (7, 19, (1, 3, 1, 5, 27, 61, 31)),
+        (7, 21, (1, 1, 5, 11, 19, 41, 61)), (7, 28, (1, 3, 5, 3, 3, 13, 69)),
+        (7, 31, (1, 1, 7, 13, 1, 19, 1)), (7, 32, (1, 3, 7, 5, 13, 19, 59)),
+        (7, 37, (1, 1, 3, 9, 25, 29, 41)), (7, 41, (1, 3, 5, 13, 23, 1, 55)),
+        (7, 42, (1, 3, 7, 3, 13, 59, 17)), (7, 50, (1, 3, 1, 3, 5, 53, 69)),
+        (7, 55, (1, 1, 5, 5, 23, 33, 13)), (7, 56, (1, 1, 7, 7, 1, 61, 123)),
+        (7, 59, (1, 1, 7, 9, 13, 61, 49)), (7, 62, (1, 3, 3, 5, 3, 55, 33)),
+        (8, 14, (1, 3, 1, 15, 31, 13, 49, 245)), (8, 21, (1, 3, 5, 15, 31, 59, 63, 97)),
+        (8, 22, (1, 3, 1, 11, 11, 11, 77, 249)),
+    )
+    # Bits de precisión de los puntos de Sobol (hasta 2^32 puntos)
+    SOBOL_BITS = 32
+    # Cantidad de bits en 1 de cada byte (popcount portable, sin np.bitwise_count de NumPy 2)
+    POPCOUNT = np.array([bin(v).count('1') for v in range(256)], dtype=np.uint8)
+    
+    @staticmethod
+    def _sobol_directions(dim):
+        """Números de dirección V[j, k] (enteros de 32 bits) de las primeras `dim` dimensiones"""
+        bits = RandomGenerator.SOBOL_BITS
+        if not 1 <= dim <= len(RandomGenerator.SOBOL_DIRECTIONS) + 1:
+            raise ValueError(f"Sobol admite entre 1 y {len(RandomGenerator.SOBOL_DIRECTIONS) + 1} dimensiones")
+        # La primera dimensión tiene m_k = 1 para todo k (secuencia de van der Corput)
+        directions = [[1 << (bits - k) for k in range(1, bits + 1)]]
+        for s, a, initial in RandomGenerator.SOBOL_DIRECTIONS[:dim - 1]:
+            m = list(initial)
+            for k in range(s, bits):
+                # m_k = 2^s m_{k-s} xor m_{k-s} xor sum_i a_i 2^i m_{k-i}
+                value = m[k - s] ^ (m[k - s] << s)
+                for i in range(1, s):
+                    if (a >> (s - 1 - i)) & 1:
+                        value ^= m[k - i] << i
+                m.append(value)
+            directions.append([m[k] << (bits - 1 - k) for k in range(bits)])
+        return np.array(directions, dtype=np.uint64)
+    
+    @staticmethod
+    def _linear_scramble(directions, rng):
+        """Aplica a cada dimensión una matriz binaria triangular inferior aleatoria (LMS).
+        
+        El bit más significativo de salida r es la paridad de la fila r (con diagonal
+        1) aplicada a los bits de entrada más significativos que r o iguales.
+        """
+        bits = RandomGenerator.SOBOL_BITS
+        dim = directions.shape[0]
+        # rows[j, r]: máscara de la fila r en orden de bits (el bit bits-1-r es la diagonal)
+        below = rng.integers(0, 2**32, size=(dim, bits), dtype=np.uint64)
+        positions = np.arange(bits, dtype=np.uint64)
+        upper = ~np.uint64(0) << (np.uint64(bits) - positions)
+        rows = (below & upper & np.uint64(2**bits - 1)) | (np.uint64(1) << (np.uint64(bits - 1) - positions))
+        # Paridad de (fila r AND V_k) para cada dimensión, fila y número de dirección
+        masked = rows[:, :, None] & directions[:, None, :]
+        parity = sum(RandomGenerator.POPCOUNT[(masked >> np.uint64(8 * byte)) & np.uint64(255)]
+                     for byte in range(bits // 8)) & np.uint8(1)
+        weights = np.uint64(1) << (np.uint64(bits - 1) - positions)
+        return (parity.astype(np.uint64) * weights[None, :, None]).sum(axis=1, dtype=np.uint64)
+    
+    @staticmethod
+    def sobol(n, seed=None, dim=1, scramble=False, as_array=False, offset=0):
+        """Secuencia de baja discrepancia de Sobol (números de dirección de Joe y Kuo).
+        
+        El punto i es la suma xor de los números de dirección de los bits del código
+        Gray de i, así que cualquier posición se calcula directamente; el bloque se
+        obtiene con tablas de 256 entradas por byte del código Gray (cuatro consultas
+        y tres xor por punto). Con `scramble` se aplica una
+        mezcla lineal de Matoušek más un desplazamiento digital aleatorios derivados
+        de `seed`. Con dim=1 el resultado es 1-D; si no, tiene forma (n, dim).
+        """
+        bits = RandomGenerator.SOBOL_BITS
+        if offset + n > 2**bits:
+            raise ValueError(f"Sobol genera como máximo 2^{bits} puntos")
+        directions = RandomGenerator._sobol_directions(dim)
+        shift = np.zeros(dim, dtype=np.uint64)
+        if scramble:
+            rng = np.random.default_rng(seed)
+            directions = RandomGenerator._linear_scramble(directions, rng)
+            shift = rng.integers(0, 2**bits, size=dim, dtype=np.uint64)
+        
+        directions = directions.astype(np.uint32)
+        index = np.arange(offset, offset + n, dtype=np.uint64)
+        gray = index ^ (index >> np.uint64(1))
+        points = np.broadcast_to(shift.astype(np.uint32), (n, dim)).copy()
+        # Bytes necesarios para el código Gray del último índice, offset + n - 1
+        for byte in range(-(-int(max(offset + n - 1, 0)).bit_length() // 8)):
+            # table[v] = xor de los números de dirección de los bits del byte v
+            table = np.zeros((256, dim), dtype=np.uint32)
+            for b in range(8):
+                table[1 << b:2 << b] = table[:1 << b] ^ directions[:, 8 * byte + b]
+            points ^= table[(gray >> np.uint64(8 * byte)).astype(np.uint8)]
+        numbers = points / 2**bits
+        return RandomGenerator._output(numbers[:, 0] if dim == 1 else numbers, as_array)
+    
+    @staticmethod
+    def _primes(k):
+        """Los k primeros números primos"""
+        limit = max(16, int(k * (math.log(k + 1) + math.log(math.log(k + 2)) + 3)))
+        sieve = np.ones(limit, dtype=bool)
+        sieve[:2] = False
+        for p in range(2, math.isqrt(limit) + 1):
+            if sieve[p]:
+                sieve[p * p::p] = False
+        return np.flatnonzero(sieve)[:k]
+    
+    @staticmethod
+    def halton(n, seed=None, dim=1, scramble=False, as_array=False, offset=0):
+        """Secuencia de Halton: inverso radical de i en el j-ésimo primo para cada dimensión.
+        
+        Todos los índices avanzan a la vez, un dígito por pasada. Con `scramble` cada
+        posición de dígito de cada dimensión usa una permutación aleatoria derivada
+        de `seed` (se toman los dígitos necesarios para la precisión de un double).
+        Con dim=1 el resultado es 1-D; si no, tiene forma (n, dim).
+        """
+        if scramble and dim > 300:
+            # Con primos mayores que 2^11 los dígitos acumulados no caben en 64 bits
+            raise ValueError("Halton mezclado admite como máximo 300 dimensiones")
+        rng = np.random.default_rng(seed) if scramble else None
+        index = np.arange(offset, offset + n, dtype=np.int64)
+        numbers = np.empty((n, dim), dtype=np.float64)
+        for j, base in enumerate(RandomGenerator._primes(dim)):
+            base = int(base)
+            q = index.copy()
+            column = numbers[:, j]
+            column[:] = 0
+            scale = 1.0 / base
+            if rng is None:
+                while q.any():
+                    column += (q % base) * scale
+                    q //= base
+                    scale /= base
+            else:
+                # Todas las permutaciones se sortean antes, así el resultado no depende de n;
+                # los dígitos permutados se acumulan como entero exacto en base `base`
+                digits = math.ceil(53 / math.log2(base))
+                perms = [rng.permutation(base).astype(np.uint64) for _ in range(digits)]
+                acc = np.zeros(n, dtype=np.uint64)
+                level = 0
+                while level < digits and q.any():
+                    acc += perms[level][q % base] * np.uint64(base ** (digits - 1 - level))
+                    q //= base
+                    level += 1
+                # Los dígitos restantes son cero en todos los índices: su aporte es constante
+                acc += np.uint64(sum(int(perms[k][0]) * base ** (digits - 1 - k) for k in range(level, digits)))
+                column[:] = acc / float(base ** digits)
+        # Redondeos al sumar los dígitos permutados podrían alcanzar 1
+        np.minimum(numbers, np.nextafter(1, 0), out=numbers)
+        return RandomGenerator._output(numbers[:, 0] if dim == 1 else numbers, as_array)
+    
+    # Multiplicadores de Korobov ya buscados, por (n, dim)
+    _korobov_cache = {}
+    
+    @staticmethod
+    def korobov_multiplier(n, dim, candidates=64):
+        """Multiplicador a de la retícula de Korobov que minimiza el criterio P_2.
+        
+        P_2 = -1 + (1/n) sum_i prod_j (1 + 2 pi^2 B_2(x_ij)), con B_2 el polinomio de
+        Bernoulli, se evalúa exactamente sobre la retícula de cada candidato. Se
+        prueban los enteros coprimos con n (todos si son pocos, si no una muestra
+        repartida por la razón áurea) y el resultado se recuerda.
+        """
+        key = (n, dim, candidates)
+        if key in RandomGenerator._korobov_cache:
+            return RandomGenerator._korobov_cache[key]
+        if n < 3 or dim == 1:
+            return 1
+        if n // 2 <= candidates:
+            pool = range(1, n // 2 + 1)
+        else:
+            golden = (math.sqrt(5) - 1) / 2
+            pool = {int(n * ((k * golden) % 1)) for k in range(1, 4 * candidates)}
+        pool = sorted(a for a in pool if a > 1 and math.gcd(a, n) == 1)[:candidates] or [1]
+        
+        i = np.arange(n, dtype=np.int64)
+        best, best_score = pool[0], float('inf')
+        for a in pool:
+            product = np.ones(n)
+            z = 1
+            for _ in range(dim):
+                x = (i * z % n) / n
+                product *= 1 + 2 * math.pi ** 2 * (x * x - x + 1 / 6)
+                z = z * a % n
+            score = product.mean() - 1
+            if score < best_score:
+                best, best_score = a, score
+        RandomGenerator._korobov_cache[key] = best
+        return best
+    
+    @staticmethod
+    def korobov(n, seed=None, dim=2, a=None, scramble=False, as_array=False):
+        """Retícula de rango 1 de Korobov: x_i = frac(i * (1, a, a^2, ...) / n).
+        
+        La retícula depende del número de puntos n, así que no admite desplazamiento;
+        si no se indica `a` se busca con `korobov_multiplier`. Con `scramble` se suma
+        un desplazamiento aleatorio módulo 1 (Cranley-Patterson) derivado de `seed`.
+        Con dim=1 el resultado es 1-D; si no, tiene forma (n, dim).
+        """
+        if n * n >= 2**63:
+            raise ValueError("La retícula de Korobov admite como máximo 3*10^9 puntos")
+        if a is None:
+            a = RandomGenerator.korobov_multiplier(n, dim)
+        z = np.array([pow(a, j, n) if n > 1 else 0 for j in range(dim)], dtype=np.int64)
+        numbers = (np.arange(n, dtype=np.int64)[:, None] * z % n) / n
+        if scramble:
+            numbers += np.random.default_rng(seed).random(dim)
+            numbers %= 1
+        return RandomGenerator._output(numbers[:, 0] if dim == 1 else numbers, as_array)
+    
+    @staticmethod
+    def _stream_source(method, seed, params, words=False):
+        """Devuelve una función draw(k) que continúa el flujo del método en cada llamada.
+        
+        draw puede devolver más de k valores (WELL genera carriles completos); el
+        estado guardado corresponde siempre al último valor devuelto. Con `words`
+        devuelve palabras uint32 en lugar de números en [0,1): las de salida nativa
+        de 32 bits de los métodos de NATIVE_WORDS y floor(u * 2^32) en los demás.
+        Los flujos son de una sola columna: se rechazan dim != 1 y las semillas en arreglo.
+        """
+        G = RandomGenerator
+        if params.get('dim', 1) != 1 or np.ndim(seed) != 0:
+            raise ValueError("Los flujos son de una sola columna: no admiten dim distinto de 1 "
+                             "ni varias semillas a la vez")
+        if seed is None:
+            seed = inspect.signature(getattr(G, method)).parameters['seed'].default
+        
+        def emit(values, divisor):
+            # Las semillas de más de 32 bits (xorshift) dejan estados object con bits altos
+            return (values & 0xFFFFFFFF).astype(np.uint32) if words else G._normalize(values, divisor)
+        
+        if method in G.JUMPABLE:
+            position = 0
+            if words and method in G.NATIVE_WORDS:
+                signature = inspect.signature(getattr(G, method)).parameters
+                extra = {name: params.get(name, signature[name].default) for name in ('mult', 'inc')
+                         if name in signature}
+                generate = lambda k, offset: emit(getattr(G, f'_{method}_words')(k, seed, offset=offset, **extra), None)
+            else:
+                generate = lambda k, offset: getattr(G, method)(k, seed, as_array=True, offset=offset, **params)
+            def draw(k):
+                nonlocal position
+                chunk = generate(k, position)
+                position += k
+                return chunk
+        elif method == 'mersenne_twister':
+            state = np.random.RandomState(seed)
+            if words:
+                # En todo el rango de uint32 randint devuelve las palabras del MT sin alterar
+                draw = lambda k: state.randint(0, 2**32, size=k, dtype=np.uint32)
+            else:
+                draw = state.random_sample
+        elif method == 'xorshift':
+            state = seed
+            def draw(k):
+                nonlocal state
+                states = G._xorshift_states(k, state)
+                state = states[-1]
+                return emit(states, 0xFFFFFFFF)
+        elif method == 'well':
+            variant = params.get('variant', '512a')
+            state = G._seed_words(seed, G.WELL_VARIANTS[variant][0])
+            def draw(k):
+                nonlocal state
+                values, state = G._well_words(k, state, variant)
+                return emit(values, 2**32)
+        elif method == 'tausworthe' and params.get('variant', 'lfsr113') == 'lfsr':
+            state = seed
+            def draw(k):
+                nonlocal state
+                states, state = G._lfsr_states(k, state)
+                return emit(states, 0xFFFFFFFF)
+        elif method == 'tausworthe':
+            components = G.TAUSWORTHE_VARIANTS[params.get('variant', 'lfsr113')]
+            states = G._tausworthe_seeds(seed, components)
+            def draw(k):
+                nonlocal states
+                values, states = G._tausworthe_words(k, states, components)
+                return emit(values, 2**32)
+        elif method == 'middle_square':
+            digits = len(str(seed))
+            if digits % 2 != 0:
+                seed = seed * 10  # Asegurar un número par de dígitos
+                digits += 1
+            state = seed
+            def draw(k):
+                nonlocal state
+                numbers, state = G._middle_square_states(k, state, seed, digits)
+                return numbers
+        elif method == 'middle_square_weyl':
+            w_step = params.get('w_seed', 123456789)
+            state = (seed, w_step)
+            def draw(k):
+                nonlocal state
+                numbers, state = G._middle_square_weyl_states(k, *state, w_step)
+                return numbers
+        else:
+            raise ValueError(f"Método de generación desconocido: {method}")
+        
+        if words and method not in G.NATIVE_WORDS:
+            # Sin salida nativa de 32 bits: se escala el número en [0,1)
+            uniform = draw
+            draw = lambda k: (uniform(k) * 2**32).astype(np.uint32)
+        return draw
+    
+    @staticmethod
+    def _blocks(draw, chunk_size, total, dtype):
+        """Reparte lo que devuelve draw(k) en bloques de exactamente `chunk_size` valores"""
+        pending = np.empty(0, dtype=dtype)
+        produced = 0
+        while total is None or produced < total:
+            size = chunk_size if total is None else min(chunk_size, total - produced)
+            while len(pending) < size:
+                pending = np.concatenate((pending, draw(size - len(pending))))
+            chunk, pending = pending[:size], pending[size:]
+            produced += size
+            yield chunk
+    
+    @staticmethod
+    def stream(method, seed=None, chunk_size=1000000, total=None, **params):
+        """Iterador que produce el flujo del método en bloques de numpy de `chunk_size` valores.
+        
+        Entre bloques solo se conserva el estado del generador, por lo que la memoria
+        no depende de la longitud total; concatenar los bloques reproduce la llamada
+        directa al método. Con `total=None` el flujo no termina.
+        """
+        draw = RandomGenerator._stream_source(method, seed, params)
+        return RandomGenerator._blocks(draw, chunk_size, total, np.float64)
+    
+    @staticmethod
+    def raw_stream(method, seed=None, bits=32, chunk_size=2**20, total=None, **params):
+        """Iterador de bloques de palabras enteras sin signo (uint32 o uint64), sin pasar por [0,1).
+        
+        Las palabras de 64 bits juntan dos de 32 consecutivas, la primera en la mitad
+        baja (igual que leer el flujo de 32 bits en little-endian). `chunk_size` y
+        `total` se cuentan en palabras del tamaño pedido. Los parámetros se validan
+        al llamar, antes de producir el primer bloque.
+        """
+        if bits not in (32, 64):
+            raise ValueError("Las palabras deben ser de 32 o 64 bits")
+        draw = RandomGenerator._stream_source(method, seed, params, words=True)
+        per_word = bits // 32
+        blocks = RandomGenerator._blocks(draw, chunk_size * per_word,
+                                         None if total is None else total * per_word, np.uint32)
+        if bits == 32:
+            return blocks
+        return (block[0::2].astype(np.uint64) | (block[1::2].astype(np.uint64) << np.uint64(32))
+                for block in blocks)
+    
+    @staticmethod
+    def write_raw(method, target, count=None, seed=None, bits=32, chunk_size=2**20, **params):
+        """Escribe `count` palabras del flujo en binario little-endian, bloque a bloque.
+        
+        `target` es '-' (salida estándar, pensada para tuberías hacia PractRand o
+        dieharder; sin `count` escribe hasta que se cierre la tubería) o una ruta
+        .npy/.bin que se abre como archivo mapeado en memoria del tamaño final.
+        Devuelve la cantidad de palabras escritas.
+        """
+        dtype = np.dtype(f'<u{bits // 8}')
+        chunks = RandomGenerator.raw_stream(method, seed, bits, chunk_size, count, **params)
+        written = 0
+        if target == '-':
+            out = sys.stdout.buffer
+            try:
+                for chunk in chunks:
+                    out.write(chunk.astype(dtype, copy=False).tobytes())
+                    written += chunk.size
+                out.flush()
+            except BrokenPipeError:
+                # El consumidor dejó de leer: evitar otro error al cerrar la salida
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return written
+        
+        if count is None:
+            raise ValueError("Para escribir en un archivo se necesita la cantidad de palabras")
+        if target.endswith('.npy'):
+            mapped = np.lib.format.open_memmap(target, mode='w+', dtype=dtype, shape=(count,))
+        else:
+            mapped = np.memmap(target, dtype=dtype, mode='w+', shape=(count,))
+        for chunk in chunks:
+            mapped[written:written + chunk.size] = chunk
+            written += chunk.size
+        mapped.flush()
+        del mapped
+        return written
+    
+    # Métodos con estado pequeño cuyo ciclo puede buscarse directamente
+    PERIOD_METHODS = ('lcg', 'mcg', 'pcg', 'xorshift', 'tausworthe', 'middle_square', 'middle_square_weyl')
+    
+    @staticmethod
+    def _state_map(method, seeds, params):
+        """Devuelve (estados iniciales, f) con f la transición del estado, vectorizada por semilla.
+        
+        Los estados son enteros (uint64 si caben en 64 bits, object si no); el del
+        Cuadrático Medio empaqueta x y el contador de Weyl en una sola palabra.
+        """
+        G = RandomGenerator
+        seeds = np.atleast_1d(np.asarray(seeds, dtype=object))
+        defaults = inspect.signature(getattr(G, method)).parameters
+        params = {name: params.get(name, p.default) for name, p in defaults.items()
+                  if name not in ('n', 'seed', 'as_array', 'offset')}
+        
+        if method in ('lcg', 'mcg', 'pcg'):
+            if method == 'pcg':
+                a, c, m = params['mult'], params['inc'], 2**64
+            else:
+                a, c, m = params['a'], params.get('c', 0), params['m']
+            if m == 2**64:
+                # La aritmética de uint64 ya reduce módulo 2^64
+                a, c = np.uint64(a), np.uint64(c)
+                return (seeds % m).astype(np.uint64), lambda x: a * x + c
+            if (m - 1) * a + c < 2**64:
+                a, c, m = np.uint64(a), np.uint64(c), np.uint64(m)
+                return (seeds % int(m)).astype(np.uint64), lambda x: (a * x + c) % m
+            return seeds % m, lambda x: (a * x + c) % m
+        
+        if method == 'xorshift':
+            if all(0 <= seed <= 0xFFFFFFFF for seed in seeds):
+                return seeds.astype(np.uint64), G._xorshift_step
+            # Semillas de más de 32 bits: mismo paso con enteros de Python
+            def step(x):
+                x = x ^ ((x << 13) & 0xFFFFFFFF)
+                x = x ^ ((x >> 17) & 0xFFFFFFFF)
+                return x ^ ((x << 5) & 0xFFFFFFFF)
+            return seeds, step
+        
+        if method == 'tausworthe':
+            if params['variant'] != 'lfsr':
+                raise ValueError("Los Tausworthe combinados tienen periodo conocido (2^88 o 2^113); "
+                                 "solo la variante 'lfsr' admite búsqueda de ciclos")
+            if not all(0 <= seed <= 0xFFFFFFFF for seed in seeds):
+                raise ValueError("El análisis del LFSR requiere semillas de 32 bits")
+            return seeds.astype(np.uint64), G._lfsr_step
+        
+        if method == 'middle_square':
+            start, half, modulus = G._middle_square_seeds(seeds)
+            def step(x):
+                x = (x * x // half) % modulus
+                # Al llegar a cero el generador vuelve a su semilla
+                return np.where(x == 0, start, x)
+            return start.copy(), step
+        
+        if method == 'middle_square_weyl':
+            w_step = np.uint64(params['w_seed'] % 2**32)
+            mask = np.uint64(0xFFFFFFFF)
+            def step(state):
+                x, w = state >> np.uint64(32), state & mask
+                w = (w + w_step) & mask
+                x = (x + w) & mask
+                x = (x * x) & mask
+                return (x << np.uint64(32)) | w
+            return ((seeds % 2**32).astype(np.uint64) << np.uint64(32)) | w_step, step
+        
+        raise ValueError(f"El método {method} no admite análisis de periodo; "
+                         f"disponibles: {', '.join(RandomGenerator.PERIOD_METHODS)}")
+    
+    @staticmethod
+    def period(method, seeds, max_steps=1000000, **params):
+        """Longitud de la cola (mu) y del ciclo (lambda) de cada semilla, por el algoritmo de Brent.
+        
+        Todas las semillas avanzan a la vez como carriles de numpy y cada una guarda
+        solo la tortuga, la liebre y dos contadores, así que la memoria es O(1) por
+        semilla. Las semillas cuyo ciclo no se cierra en `max_steps` pasos reciben -1.
+        La cola cuenta los pasos desde la semilla hasta entrar en el ciclo.
+        """
+        x0, f = RandomGenerator._state_map(method, seeds, params)
+        lanes = x0.size
+        
+        # Fase 1: la tortuga salta a la liebre en cada potencia de dos
+        tortoise = x0.copy()
+        hare = f(x0)
+        power = np.ones(lanes, dtype=np.int64)
+        lam = np.ones(lanes, dtype=np.int64)
+        found = tortoise == hare
+        steps = 1
+        while steps < max_steps and not found.all():
+            active = ~found
+            reset = active & (power == lam)
+            tortoise[reset] = hare[reset]
+            power[reset] *= 2
+            lam[reset] = 0
+            hare = np.where(active, f(hare), hare)
+            lam += active
+            found |= tortoise == hare
+            steps += 1
+        
+        # Fase 2: la liebre se adelanta lambda pasos desde la semilla
+        hare = x0.copy()
+        for k in range(int(lam[found].max(initial=0))):
+            hare = np.where(found & (k < lam), f(hare), hare)
+        
+        # Fase 3: ambas avanzan juntas hasta encontrarse al inicio del ciclo
+        tortoise = x0.copy()
+        mu = np.zeros(lanes, dtype=np.int64)
+        moving = found & (tortoise != hare)
+        while moving.any():
+            tortoise = np.where(moving, f(tortoise), tortoise)
+            hare = np.where(moving, f(hare), hare)
+            mu += moving
+            moving &= tortoise != hare
+        
+        return np.where(found, mu, -1), np.where(found, lam, -1)
+
+
+class RunningStats:
+    """Acumulador de media, varianza, mínimo y máximo que se actualiza por bloques.
+    
+    Cada bloque se resume con numpy y se combina con lo acumulado mediante la
+    fórmula de Welford/Chan, así que el resultado no depende del tamaño de bloque.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+    
+    def update(self, values):
+        """Incorpora un bloque de valores"""
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        mean = values.mean()
+        m2 = np.square(values - mean).sum()
+        self.merge_moments(values.size, mean, m2)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+    
+    def merge_moments(self, count, mean, m2):
+        """Combina (n, media, suma de cuadrados centrados) de otro grupo de valores"""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+    
+    def merge(self, other):
+        """Combina con otro acumulador"""
+        if other.count:
+            self.merge_moments(other.count, other.mean, other.m2)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+    
+    @property
+    def variance(self):
+        """Varianza poblacional"""
+        return self.m2 / self.count if self.count else float('nan')
+    
+    @property
+    def std(self):
+        """Desviación estándar poblacional"""
+        return math.sqrt(self.variance) if self.count else float('nan')
+
+class UniformSource:
+    """Fuente de números uniformes que entrega bloques de cualquier tamaño.
+    
+    Consume primero `values` y después los bloques del iterador `stream` (por
+    ejemplo RandomGenerator.stream u otra UniformSource), así que los muestreadores
+    por rechazo pueden pedir tantos uniformes como necesiten del mismo flujo.
+    
+    `stream` también puede ser un objeto de estado de numpy (np.random.Generator,
+    BitGenerator o RandomState); cada fuente conserva así su propio estado y varias
+    pueden usarse a la vez en hilos distintos sin tocar el estado global.
+    """
+    
+    # Tamaño de bloque al iterar sobre un objeto de estado de numpy
+    CHUNK_SIZE = 1000000
+    
+    def __init__(self, stream=None, values=()):
+        if isinstance(stream, np.random.BitGenerator):
+            stream = np.random.Generator(stream)
+        self.stream = stream
+        self.buffer = np.asarray(values, dtype=np.float64)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        """Devuelve lo que quede en el búfer o el siguiente bloque del flujo"""
+        if self.buffer.size:
+            chunk, self.buffer = self.buffer, self.buffer[:0]
+            return chunk
+        if self.stream is None:
+            raise StopIteration
+        if self._numpy_state:
+            return self.stream.random(self.CHUNK_SIZE)
+        return next(self.stream)
+    
+    @property
+    def _numpy_state(self):
+        """Indica si el flujo es un objeto de estado de numpy"""
+        return isinstance(self.stream, (np.random.Generator, np.random.RandomState))
+    
+    def draw(self, k):
+        """Devuelve los k uniformes siguientes"""
+        while self.buffer.size < k:
+            if self.stream is None:
+                raise ValueError("La fuente no tiene suficientes números uniformes")
+            if self._numpy_state:
+                # Pedir exactamente lo que falta
+                extra = self.stream.random(k - self.buffer.size)
+            elif isinstance(self.stream, UniformSource):
+                # Pedir a otra fuente solo lo que falta, sin descartar su remanente
+                extra = self.stream.draw(k - self.buffer.size)
+            else:
+                extra = next(self.stream)
+            self.buffer = np.concatenate((self.buffer, extra))
+        chunk, self.buffer = self.buffer[:k], self.buffer[k:]
+        return chunk
+
+
+
+class StreamingTest:
+    """Base de las pruebas de calidad que se actualizan bloque a bloque.
+    
+    Cada prueba guarda solo contadores de tamaño fijo (y el remanente que no
+    completa un grupo), así que su memoria no depende de la longitud del flujo.
+    """
+    
+    name = ""
+    
+    def __init__(self):
+        self.count = 0
+        self.pending = np.empty(0)
+    
+    def _groups(self, u, size):
+        """Agrupa el remanente anterior y el bloque en filas de `size` valores"""
+        u = np.concatenate((self.pending, u)) if self.pending.size else u
+        whole = u.size // size * size
+        self.pending = u[whole:].copy()
+        return u[:whole].reshape(-1, size)
+    
+    def update(self, u):
+        raise NotImplementedError
+    
+    def result(self):
+        """Devuelve (estadístico, valor p)"""
+        raise NotImplementedError
+
+
+class ChiSquareTest(StreamingTest):
+    """Bondad de ajuste chi-cuadrado de la frecuencia de cada clase"""
+    
+    name = "Chi-cuadrado"
+    
+    def __init__(self, bins=256):
+        super().__init__()
+        self.counts = np.zeros(bins, dtype=np.int64)
+    
+    def update(self, u):
+        bins = self.counts.size
+        self.counts += np.bincount(np.minimum((u * bins).astype(np.intp), bins - 1), minlength=bins)
+        self.count += u.size
+    
+    def result(self):
+        if not self.count:
+            return float('nan'), float('nan')
+        expected = self.count / self.counts.size
+        statistic = float(((self.counts - expected) ** 2).sum() / expected)
+        return statistic, float(chi2.sf(statistic, self.counts.size - 1))
+
+
+class KolmogorovSmirnovTest(StreamingTest):
+    """Kolmogorov-Smirnov sobre un histograma fino.
+    
+    La distancia se mide en los bordes de 2^20 clases, así que subestima la exacta
+    en menos de 2^-20, muy por debajo del valor crítico incluso con 10^9 muestras.
+    """
+    
+    name = "Kolmogorov-Smirnov"
+    
+    def __init__(self, bins=2 ** 20):
+        super().__init__()
+        self.counts = np.zeros(bins, dtype=np.int64)
+    
+    def update(self, u):
+        bins = self.counts.size
+        self.counts += np.bincount(np.minimum((u * bins).astype(np.intp), bins - 1), minlength=bins)
+        self.count += u.size
+    
+    def result(self):
+        if not self.count:
+            return float('nan'), float('nan')
+        bins = self.counts.size
+        empirical = np.cumsum(self.counts) / self.count
+        edges = np.arange(1, bins + 1) / bins
+        statistic = float(np.abs(empirical - edges).max())
+        return statistic, float(kstwo.sf(statistic, self.count))
+
+
+class RunsTest(StreamingTest):
+    """Rachas por encima y por debajo de 0.5 (Wald-Wolfowitz)"""
+    
+    name = "Rachas"
+    
+    def __init__(self):
+        super().__init__()
+        self.high = 0
+        self.runs = 0
+        self.last = None
+    
+    def update(self, u):
+        if u.size == 0:
+            return
+        above = u >= 0.5
+        self.runs += int(np.count_nonzero(above[1:] != above[:-1]))
+        self.runs += 1 if self.last is None or above[0] != self.last else 0
+        self.last = above[-1]
+        self.high += int(np.count_nonzero(above))
+        self.count += u.size
+    
+    def result(self):
+        if self.count < 2:
+            return float('nan'), float('nan')
+        n, n1 = self.count, self.high
+        n2 = n - n1
+        mean = 2 * n1 * n2 / n + 1
+        variance = 2 * n1 * n2 * (2 * n1 * n2 - n) / (n * n * (n - 1))
+        if variance <= 0:
+            return float('nan'), 0.0
+        z = (self.runs - mean) / math.sqrt(variance)
+        return z, float(2 * norm.sf(abs(z)))
+
+
+class GapTest(StreamingTest):
+    """Prueba de huecos de Knuth: distancia entre valores que caen en [0, beta)"""
+    
+    name = "Huecos"
+    
+    def __init__(self, beta=0.1, classes=40):
+        super().__init__()
+        self.beta = beta
+        self.counts = np.zeros(classes + 1, dtype=np.int64)
+        self.gap = 0
+    
+    def update(self, u):
+        hits = np.flatnonzero(u < self.beta)
+        if hits.size:
+            gaps = np.diff(hits, prepend=-1 - self.gap) - 1
+            classes = self.counts.size - 1
+            self.counts += np.bincount(np.minimum(gaps, classes), minlength=classes + 1)
+            self.gap = u.size - 1 - hits[-1]
+        else:
+            self.gap += u.size
+        self.count += u.size
+    
+    def result(self):
+        classes = self.counts.size - 1
+        total = self.counts.sum()
+        if not total:
+            return float('nan'), float('nan')
+        probs = self.beta * (1 - self.beta) ** np.arange(classes + 1)
+        probs[-1] = (1 - self.beta) ** classes
+        expected = total * probs
+        statistic = float(((self.counts - expected) ** 2 / expected).sum())
+        return statistic, float(chi2.sf(statistic, classes))
+
+
+class SerialPairsTest(StreamingTest):
+    """Chi-cuadrado de pares no solapados (u_2i, u_2i+1) en una rejilla d x d"""
+    
+    name = "Pares seriales"
+    
+    def __init__(self, d=64):
+        super().__init__()
+        self.d = d
+        self.counts = np.zeros(d * d, dtype=np.int64)
+    
+    def update(self, u):
+        d = self.d
+        cells = np.minimum((self._groups(u, 2) * d).astype(np.intp), d - 1)
+        self.counts += np.bincount(cells[:, 0] * d + cells[:, 1], minlength=d * d)
+        self.count += cells.shape[0]
+    
+    def result(self):
+        if not self.count:
+            return float('nan'), float('nan')
+        expected = self.count / self.counts.size
+        statistic = float(((self.counts - expected) ** 2).sum() / expected)
+        return statistic, float(chi2.sf(statistic, self.counts.size - 1))
+
+
+class BirthdaySpacingsTest(StreamingTest):
+    """Espaciamientos de cumpleaños de Marsaglia.
+    
+    En cada grupo de m cumpleaños en un año de n días se cuentan los
+    espaciamientos repetidos; el total sobre G grupos se contrasta con una Poisson.
+    La media usa m^2 (m - 1) / 4n menos la corrección por triples, ya que con
+    cientos de miles de grupos la aproximación clásica m^3 / 4n rechaza incluso
+    generadores perfectos.
+    """
+    
+    name = "Espaciamientos de cumpleaños"
+    
+    def __init__(self, m=512, days=2 ** 24):
+        super().__init__()
+        self.m = m
+        self.days = days
+        self.lambd = m * m * (m - 1) / (4 * days) - m * m * math.comb(m, 3) / (3 * days * days)
+        self.groups = 0
+        self.repeated = 0
+    
+    def update(self, u):
+        groups = self._groups(u, self.m)
+        if groups.shape[0] == 0:
+            return
+        birthdays = np.sort(np.minimum((groups * self.days).astype(np.int64), self.days - 1), axis=1)
+        spacings = np.sort(np.diff(birthdays, axis=1, prepend=0), axis=1)
+        self.repeated += int(np.count_nonzero(spacings[:, 1:] == spacings[:, :-1]))
+        self.groups += groups.shape[0]
+        self.count += groups.size
+    
+    def result(self):
+        if not self.groups:
+            return float('nan'), float('nan')
+        expected = self.groups * self.lambd
+        # Valor p bilateral de la Poisson
+        p_value = 2 * min(poisson.cdf(self.repeated, expected), poisson.sf(self.repeated - 1, expected))
+        return float(self.repeated), float(min(p_value, 1.0))
+
+
+class PeriodogramTest(StreamingTest):
+    """Prueba espectral: periodograma promediado sobre bloques de longitud L.
+    
+    Sin estructura periódica cada ordenada normalizada es Exp(1), así que su suma
+    sobre B bloques es Gamma(B, 1); los valores de su distribución en cada
+    frecuencia deben ser uniformes (se contrasta con Kolmogorov-Smirnov).
+    """
+    
+    name = "Espectral (periodograma)"
+    
+    def __init__(self, length=4096):
+        super().__init__()
+        self.length = length
+        self.sums = np.zeros(length // 2 - 1)
+        self.blocks = 0
+    
+    def update(self, u):
+        groups = self._groups(u, self.length)
+        if groups.shape[0] == 0:
+            return
+        spectrum = np.abs(np.fft.rfft(groups - 0.5, axis=1)[:, 1:self.length // 2]) ** 2
+        # Varianza de U(0,1): 1/12
+        self.sums += spectrum.sum(axis=0) * (12 / self.length)
+        self.blocks += groups.shape[0]
+        self.count += groups.size
+    
+    def result(self):
+        if self.blocks == 0:
+            return float('nan'), float('nan')
+        outcome = kstest(gammainc(self.blocks, self.sums), 'uniform')
+        return float(outcome.statistic), float(outcome.pvalue)
+
+
+class RandomnessTests:
+    """Batería de pruebas de calidad que recorre el flujo de un generador una sola vez.
+    
+    Cada bloque se entrega a todas las pruebas; como son independientes y numpy
+    libera el GIL en sus operaciones, se actualizan en paralelo con hilos.
+    """
+    
+    TESTS = (ChiSquareTest, KolmogorovSmirnovTest, RunsTest, GapTest,
+             SerialPairsTest, BirthdaySpacingsTest, PeriodogramTest)
+    
+    def __init__(self, tests=None):
+        self.tests = [test() for test in (tests or RandomnessTests.TESTS)]
+        self.count = 0
+    
+    def update(self, u, pool=None):
+        """Actualiza todas las pruebas con un bloque de uniformes"""
+        u = np.asarray(u, dtype=np.float64)
+        if pool is None:
+            for test in self.tests:
+                test.update(u)
+        else:
+            for future in [pool.submit(test.update, u) for test in self.tests]:
+                future.result()
+        self.count += u.size
+    
+    def results(self):
+        """Diccionario nombre -> (estadístico, valor p)"""
+        return {test.name: test.result() for test in self.tests}
+    
+    @staticmethod
+    def run(method, n=100000000, seed=None, chunk_size=1000000, workers=None, **params):
+        """Aplica la batería a n valores del método indicado, generados por bloques"""
+        battery = RandomnessTests()
+        workers = workers or min(len(battery.tests), os.cpu_count() or 1)
+        chunks = RandomGenerator.stream(method, seed, chunk_size, total=n, **params)
+        if workers == 1:
+            for chunk in chunks:
+                battery.update(chunk)
+        else:
+            with ThreadPoolExecutor(workers) as pool:
+                for chunk in chunks:
+                    battery.update(chunk, pool)
+        return battery.results()
+
+class SpectralTest:
+    """Prueba espectral de los generadores congruenciales (LCG y MCG).
+    
+    Las t-uplas (x_n, ..., x_{n+t-1}) / m caen sobre hiperplanos paralelos; la
+    mayor separación entre ellos es 1 / nu_t, con nu_t la norma del vector más
+    corto del retículo dual {s : s_1 + a s_2 + ... + a^(t-1) s_t = 0 mod m}. Ese
+    vector se obtiene reduciendo la base del dual con LLL (aritmética entera exacta,
+    válida para cualquier m) y enumerando después alrededor de la base reducida.
+    """
+    
+    # gamma_t^t (constante de Hermite a la t) para t = 2..8: en el dual, de determinante
+    # m, el vector más corto nunca es más largo que gamma_t^(1/2) m^(1/t)
+    HERMITE = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+    DIMENSIONS = tuple(range(2, 9))
+    
+    @staticmethod
+    def dual_basis(a, m, t):
+        """Base del retículo dual en dimensión t: (m, 0, ..., 0) y e_i - a^(i-1) e_1"""
+        basis = [[m] + [0] * (t - 1)]
+        for i in range(1, t):
+            row = [0] * t
+            row[0] = -pow(a, i, m)
+            row[i] = 1
+            basis.append(row)
+        return basis
+    
+    @staticmethod
+    def lll(basis, delta=(99, 100)):
+        """Reducción LLL entera (Cohen, algoritmo 2.6.7) con delta = p / q.
+        
+        Se guardan los determinantes d_i de Gram y lambda_ij = d_j mu_ij, que son
+        enteros, así que todas las divisiones son exactas y no hay error de redondeo
+        aunque los coeficientes tengan cientos de bits.
+        """
+        p, q = delta
+        b = [[int(x) for x in row] for row in basis]
+        n = len(b)
+        d = [1] * (n + 1)
+        lam = [[0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                u = sum(x * y for x, y in zip(b[i], b[j]))
+                for l in range(j):
+                    u = (d[l + 1] * u - lam[i][l] * lam[j][l]) // d[l]
+                if j < i:
+                    lam[i][j] = u
+                else:
+                    d[i + 1] = u
+        
+        def reduce(k, l):
+            if 2 * abs(lam[k][l]) > d[l + 1]:
+                r = (2 * lam[k][l] + d[l + 1]) // (2 * d[l + 1])
+                b[k] = [x - r * y for x, y in zip(b[k], b[l])]
+                lam[k][l] -= r * d[l + 1]
+                for i in range(l):
+                    lam[k][i] -= r * lam[l][i]
+        
+        k = 1
+        while k < n:
+            reduce(k, k - 1)
+            if q * (d[k + 1] * d[k - 1] + lam[k][k - 1] ** 2) < p * d[k] ** 2:
+                # Condición de Lovász incumplida: intercambiar b_k y b_{k-1}
+                b[k], b[k - 1] = b[k - 1], b[k]
+                for j in range(k - 1):
+                    lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+                mu = lam[k][k - 1]
+                new = (d[k - 1] * d[k + 1] + mu * mu) // d[k]
+                for i in range(k + 1, n):
+                    t = lam[i][k]
+                    lam[i][k] = (d[k + 1] * lam[i][k - 1] - mu * t) // d[k]
+                    lam[i][k - 1] = (new * t + mu * lam[i][k]) // d[k + 1]
+                d[k] = new
+                k = max(1, k - 1)
+            else:
+                for l in range(k - 2, -1, -1):
+                    reduce(k, l)
+                k += 1
+        return b
+    
+    @staticmethod
+    def shortest_vector(basis):
+        """Vector no nulo más corto del retículo y su norma al cuadrado (exacta).
+        
+        Enumeración de Fincke-Pohst sobre la base reducida con LLL: las coordenadas
+        se recorren de la última a la primera dentro de la elipsoide de radio igual
+        al mejor vector hallado hasta el momento.
+        """
+        b = SpectralTest.lll(basis)
+        n = len(b)
+        best = min(b, key=lambda v: sum(x * x for x in v))
+        best_norm = sum(x * x for x in best)
+        # Gram-Schmidt en coma flotante: solo acota la búsqueda, las normas son exactas
+        rows = np.array(b, dtype=np.float64)
+        mu = np.zeros((n, n))
+        star = rows.copy()
+        for i in range(n):
+            for j in range(i):
+                mu[i, j] = rows[i] @ star[j] / (star[j] @ star[j])
+                star[i] -= mu[i, j] * star[j]
+        norms = np.einsum('ij,ij->i', star, star)
+        coeffs = [0] * n
+        
+        def search(level, remaining):
+            nonlocal best, best_norm
+            center = -sum(coeffs[j] * mu[j, level] for j in range(level + 1, n))
+            radius = math.sqrt(max(remaining, 0) / norms[level])
+            for x in range(math.ceil(center - radius), math.floor(center + radius) + 1):
+                coeffs[level] = x
+                left = remaining - (x - center) ** 2 * norms[level]
+                if level:
+                    search(level - 1, left)
+                elif any(coeffs):
+                    v = [sum(c * row[i] for c, row in zip(coeffs, b)) for i in range(n)]
+                    norm = sum(y * y for y in v)
+                    if norm < best_norm:
+                        best, best_norm = v, norm
+            coeffs[level] = 0
+        
+        search(n - 1, best_norm * (1 + 1e-9))
+        return best, best_norm
+    
+    @staticmethod
+    def analyze(a, m, dims=DIMENSIONS):
+        """Diccionario t -> (nu_t, separación máxima 1/nu_t, mérito nu_t / nu*_t en (0, 1])"""
+        results = {}
+        for t in dims:
+            _, norm = SpectralTest.shortest_vector(SpectralTest.dual_basis(a, m, t))
+            nu = math.sqrt(norm)
+            bound = math.sqrt(SpectralTest.HERMITE[t] ** (1 / t)) * m ** (1 / t)
+            results[t] = (nu, 1 / nu, nu / bound)
+        return results
+    
+    @staticmethod
+    def lattice_modulus(a, c, m):
+        """Módulo del retículo que forman las t-uplas del generador.
+        
+        Con c = 0, m potencia de 2 y a = 3 o 5 (mod 8) el periodo es m/4 y las
+        t-uplas quedan en un retículo trasladado de módulo m/4 (Knuth, 3.3.4). Con
+        cualquier otro multiplicador esa reducción no vale y se usa el módulo m.
+        """
+        if c == 0 and m & (m - 1) == 0 and m >= 8 and a % 8 in (3, 5):
+            return m // 4
+        return m
+    
+    @staticmethod
+    def for_generator(method='lcg', dims=DIMENSIONS, **params):
+        """Prueba espectral de RandomGenerator.lcg o .mcg con sus parámetros (o los por defecto)"""
+        if method not in ('lcg', 'mcg'):
+            raise ValueError("La prueba espectral se aplica a los métodos 'lcg' y 'mcg'")
+        signature = inspect.signature(getattr(RandomGenerator, method)).parameters
+        a, m = (params.get(name, signature[name].default) for name in ('a', 'm'))
+        c = params.get('c', signature['c'].default) if 'c' in signature else 0
+        return SpectralTest.analyze(a, SpectralTest.lattice_modulus(a, c, m), dims)
+    
+    @staticmethod
+    def merit(a, m, dims=DIMENSIONS):
+        """Figura de mérito: el peor cociente nu_t / nu*_t en las dimensiones indicadas"""
+        return min(merit for _, _, merit in SpectralTest.analyze(a, m, dims).values())
+    
+    @staticmethod
+    def _merits(args):
+        """Figuras de mérito de un lote de multiplicadores (se ejecuta en un proceso)"""
+        multipliers, m, dims = args
+        return [SpectralTest.merit(int(a), m, dims) for a in multipliers]
+    
+    @staticmethod
+    def score(multipliers, m, dims=DIMENSIONS, workers=None):
+        """Figura de mérito de cada multiplicador candidato, repartiendo lotes entre procesos.
+        
+        Devuelve un arreglo alineado con `multipliers`; los mejores se obtienen con
+        np.argsort(-score).
+        """
+        multipliers = [int(a) for a in multipliers]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(multipliers) < 2:
+            return np.array(SpectralTest._merits((multipliers, m, tuple(dims))))
+        # Varios lotes por proceso para equilibrar la carga
+        size = max(1, -(-len(multipliers) // (workers * 4)))
+        batches = [(multipliers[i:i + size], m, tuple(dims)) for i in range(0, len(multipliers), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            merits = [value for batch in executor.map(SpectralTest._merits, batches) for value in batch]
+        return np.array(merits)
+
+
+class AliasTable:
+    """Tabla de alias de Walker para una distribución discreta arbitraria.
+    
+    La tabla se construye una vez en O(K log K) y cada muestra cuesta O(1): un
+    uniforme elige la columna y otro decide entre la categoría y su alias.
+    """
+    
+    # Tablas ya construidas, indexadas por el resumen de probabilidades y valores
+    _cache = {}
+    
+    def __init__(self, weights, values=None):
+        weights = np.asarray(weights, dtype=np.float64).ravel()
+        if weights.size == 0 or not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("Las probabilidades deben ser números finitos no negativos")
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("La suma de las probabilidades debe ser positiva")
+        self.probabilities = weights / total
+        self.values = None if values is None else np.asarray(values).ravel()
+        if self.values is not None and self.values.size != weights.size:
+            raise ValueError("Debe haber un valor por cada probabilidad")
+        self.prob, self.alias = AliasTable._build(self.probabilities * weights.size)
+    
+    @staticmethod
+    def _build(scaled):
+        """Construye (prob, alias) a partir de las probabilidades escaladas a media 1.
+        
+        Equivale al algoritmo de Vose procesando las categorías pequeñas en orden: los
+        excedentes de las grandes se colocan uno tras otro en una recta y cada déficit
+        ocupa el tramo siguiente. Una pequeña toma como alias la grande en cuyo tramo
+        empieza su déficit; una grande que queda por debajo de 1 toma como alias la
+        grande siguiente, con probabilidad 1 menos lo que el déficit en curso la
+        rebasó. Todo se resuelve con sumas acumuladas y búsquedas binarias.
+        """
+        k = scaled.size
+        prob = np.ones(k)
+        alias = np.arange(k)
+        small = np.flatnonzero(scaled < 1)
+        large = np.flatnonzero(scaled >= 1)
+        if small.size == 0:
+            return prob, alias
+        deficit_end = np.cumsum(1 - scaled[small])
+        deficit_start = deficit_end - (1 - scaled[small])
+        excess_end = np.cumsum(scaled[large] - 1)
+        
+        # Alias de las pequeñas: la grande cuyo tramo contiene el inicio de su déficit
+        owner = np.minimum(np.searchsorted(excess_end, deficit_start, side='right'), large.size - 1)
+        prob[small] = scaled[small]
+        alias[small] = large[owner]
+        
+        # Grandes que se agotan: el déficit que cruza el final de su tramo las rebasa
+        crossing = np.searchsorted(deficit_end, excess_end[:-1], side='right')
+        crossing = np.minimum(crossing, small.size - 1)
+        straddles = (deficit_start[crossing] < excess_end[:-1]) & (deficit_end[crossing] > excess_end[:-1])
+        exhausted = large[:-1]
+        prob[exhausted] = np.where(straddles, 1 - (deficit_end[crossing] - excess_end[:-1]), 1.0)
+        alias[exhausted] = large[1:]
+        np.clip(prob, 0.0, 1.0, out=prob)
+        return prob, alias
+    
+    @staticmethod
+    def cached(weights, values=None):
+        """Devuelve la tabla de estas probabilidades, construyéndola solo la primera vez"""
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        digest = hashlib.blake2b(weights.tobytes(), digest_size=16)
+        if values is not None:
+            digest.update(np.asarray(values).tobytes())
+        key = digest.hexdigest()
+        table = AliasTable._cache.get(key)
+        if table is None:
+            table = AliasTable._cache[key] = AliasTable(weights, values)
+        return table
+    
+    @staticmethod
+    def from_csv(path):
+        """Carga una tabla desde un CSV.
+        
+        Con una sola columna numérica se toma como pesos de las categorías 0..K-1;
+        con dos o más, la primera son los valores y la segunda los pesos.
+        """
+        # Si la primera fila no es numérica se trata como encabezado
+        first = pd.read_csv(path, header=None, nrows=1)
+        header = None if pd.api.types.is_numeric_dtype(first.iloc[:, -1]) else 0
+        data = pd.read_csv(path, header=header)
+        if data.shape[1] == 1:
+            return AliasTable.cached(data.iloc[:, 0].to_numpy(dtype=np.float64))
+        return AliasTable.cached(data.iloc[:, 1].to_numpy(dtype=np.float64), data.iloc[:, 0].to_numpy())
+    
+    def __len__(self):
+        return self.prob.size
+    
+    def sample(self, columns, coins):
+        """Muestras a partir de dos arreglos de uniformes del mismo tamaño"""
+        k = self.prob.size
+        index = np.minimum((np.asarray(columns) * k).astype(np.intp), k - 1)
+        index = np.where(np.asarray(coins) < self.prob[index], index, self.alias[index])
+        return index if self.values is None else self.values[index]
+
+
+class DistributionTransformer:
+    """Clase para transformar números aleatorios uniformes a otras distribuciones.
+    
+    Las transformaciones vectorizadas devuelven un arreglo de numpy si reciben un
+    arreglo y una lista si reciben una lista; con `out` escriben el resultado en un
+    arreglo existente (puede ser el propio arreglo de entrada).
+    """
+    
+    @staticmethod
+    def _result(values, random_nums):
+        """Devuelve el resultado con el mismo tipo de contenedor que la entrada"""
+        return values if isinstance(random_nums, np.ndarray) else values.tolist()
+    
+    @staticmethod
+    def uniform(random_nums, a=0, b=1, out=None):
+        """Distribución Uniforme en [a,b]"""
+        u = np.asarray(random_nums, dtype=np.float64)
+        result = np.multiply(u, b - a, out=out)
+        np.add(result, a, out=result)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def normal(random_nums, mean=0, std=1, out=None, method='box-muller', source=None):
+        """Distribución Normal (Box-Muller o Ziggurat).
+        
+        Con Box-Muller cada par (u1, u2) produce dos normales; si la cantidad es
+        impar, el último valor se obtiene por la inversa de la función de distribución
+        normal. Con method='ziggurat' los uniformes adicionales se toman de `source`.
+        """
+        if method == 'ziggurat':
+            src = DistributionTransformer._uniforms(random_nums, source)
+            z = DistributionTransformer._ziggurat(np.size(random_nums), src, 'normal')
+            result = np.multiply(z, std, out=out)
+            result += mean
+            return DistributionTransformer._result(result, random_nums)
+        
+        u = np.asarray(random_nums, dtype=np.float64)
+        pairs = u.size // 2
+        # Evitar logaritmo de cero
+        u1 = np.where(u[0:2 * pairs:2] <= 0, 0.0001, u[0:2 * pairs:2])
+        angle = 2 * np.pi * u[1:2 * pairs:2]
+        radius = np.log(u1)
+        radius *= -2
+        np.sqrt(radius, out=radius)
+        radius *= std
+        last = ndtri(np.clip(u[-1], 0.0001, 0.9999)) if u.size % 2 else None
+        
+        result = np.empty_like(u) if out is None else out
+        # Transformación Box-Muller
+        np.multiply(radius, np.cos(angle), out=result[0:2 * pairs:2])
+        np.multiply(radius, np.sin(angle), out=result[1:2 * pairs:2])
+        result[0:2 * pairs] += mean
+        if last is not None:
+            result[-1] = mean + std * last
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def exponential(random_nums, lambd=1.0, out=None, method='inversion', source=None):
+        """Distribución Exponencial (transformación inversa o Ziggurat)"""
+        if method == 'ziggurat':
+            src = DistributionTransformer._uniforms(random_nums, source)
+            z = DistributionTransformer._ziggurat(np.size(random_nums), src, 'exponential')
+            result = np.divide(z, lambd, out=out)
+            return DistributionTransformer._result(result, random_nums)
+        
+        # Transformación inversa
+        u = np.asarray(random_nums, dtype=np.float64)
+        result = np.subtract(1, u, out=out)
+        with np.errstate(divide='ignore'):
+            np.log(result, out=result)
+        np.negative(result, out=result)
+        result /= lambd
+        return DistributionTransformer._result(result, random_nums)
+    
+    # Capas, borde de la cola r y área de cada capa v (Marsaglia y Tsang, 2000)
+    ZIGGURAT_PARAMS = {
+        'normal': (256, 3.6541528853610088, 0.00492867323399),
+        'exponential': (256, 7.69711747013104972, 0.0039496598225815571993),
+    }
+    _ziggurat_tables = {}
+    
+    @staticmethod
+    def _ziggurat_table(kind):
+        """Bordes x_i y alturas f(x_i) de las capas del Ziggurat (se calculan una vez).
+        
+        La capa 0 es la base de ancho v/f(r) que incluye la cola; la capa i > 0 es el
+        rectángulo de ancho x_i entre las alturas f(x_i) y f(x_{i+1}).
+        """
+        table = DistributionTransformer._ziggurat_tables.get(kind)
+        if table is None:
+            layers, r, v = DistributionTransformer.ZIGGURAT_PARAMS[kind]
+            if kind == 'normal':
+                f, f_inv = (lambda x: math.exp(-0.5 * x * x)), (lambda y: math.sqrt(-2 * math.log(y)))
+            else:
+                f, f_inv = (lambda x: math.exp(-x)), (lambda y: -math.log(y))
+            x = np.zeros(layers + 1)
+            x[0], x[1] = v / f(r), r
+            for i in range(1, layers - 1):
+                x[i + 1] = f_inv(f(x[i]) + v / x[i])
+            fx = np.array([f(xi) for xi in x])
+            fx[0] = 0.0
+            table = DistributionTransformer._ziggurat_tables[kind] = (x, fx, r)
+        return table
+    
+    @staticmethod
+    def _ziggurat(n, src, kind='normal'):
+        """n variables normales o exponenciales estándar por el método Ziggurat.
+        
+        Cada candidato usa un solo uniforme para la capa (y el signo en la normal) y la
+        abscisa; casi todos caen dentro del rectángulo y se aceptan sin evaluar la
+        densidad. Solo los que caen en la cuña o en la cola pasan por las rutas
+        lentas, procesadas con máscaras sobre el subconjunto correspondiente.
+        """
+        x, fx, r = DistributionTransformer._ziggurat_table(kind)
+        symmetric = kind == 'normal'
+        if symmetric:
+            density = lambda z: np.exp(-0.5 * z * z)
+            # Dos casillas por capa: la paridad da el signo
+            layer_of = np.repeat(np.arange(x.size - 1), 2)
+            width = x[layer_of] * np.tile([1.0, -1.0], x.size - 1)
+        else:
+            density = lambda z: np.exp(-z)
+            layer_of = np.arange(x.size - 1)
+            width = x[:-1]
+        ratio = x[layer_of + 1] / x[layer_of]
+        slots = layer_of.size
+        
+        def tail(count):
+            """Valores de la cola x > r"""
+            if not symmetric:
+                # La exponencial no tiene memoria: r + Exp(1)
+                return r - np.log1p(-src.draw(count))
+            
+            def propose(m):
+                t = -np.log1p(-src.draw(m)) / r
+                y = -np.log1p(-src.draw(m))
+                return t, 2 * y > t * t
+            return r + DistributionTransformer._rejection(count, propose)
+        
+        def propose(m):
+            # La parte entera elige la casilla y la fraccionaria da la abscisa, como
+            # el Ziggurat original que reutiliza los bits de una sola palabra
+            scaled = src.draw(m) * slots
+            j = np.minimum(scaled.astype(np.intp), slots - 1)
+            frac = scaled - j
+            z = frac * width[j]
+            accepted = frac < ratio[j]
+            rejected = np.flatnonzero(~accepted)
+            if rejected.size:
+                layer = layer_of[j[rejected]]
+                # Cuñas: comparar una altura uniforme de la capa con la densidad
+                wedge = rejected[layer > 0]
+                if wedge.size:
+                    iw = layer[layer > 0]
+                    y = fx[iw] + src.draw(wedge.size) * (fx[iw + 1] - fx[iw])
+                    accepted[wedge] = y < density(np.abs(z[wedge]))
+                # Cola de la capa base, con el signo de la casilla
+                base = rejected[layer == 0]
+                if base.size:
+                    z[base] = np.copysign(tail(base.size), width[j[base]])
+                    accepted[base] = True
+            return z, accepted
+        
+        return DistributionTransformer._rejection(n, propose)
+    
+    @staticmethod
+    def benchmark(n=1000000, generator='pcg', repeat=3):
+        """Compara Box-Muller/inversión con Ziggurat alimentados por el mismo flujo.
+        
+        Devuelve el mejor tiempo (en segundos) de cada variante; incluye la generación
+        de los uniformes, ya que Ziggurat consume más de un uniforme por valor.
+        """
+        cases = (('normal', 'box-muller'), ('normal', 'ziggurat'),
+                 ('exponential', 'inversion'), ('exponential', 'ziggurat'))
+        timings = {}
+        for name, method in cases:
+            func = getattr(DistributionTransformer, name)
+            best = float('inf')
+            for _ in range(repeat):
+                source = UniformSource(RandomGenerator.stream(generator, chunk_size=n))
+                start = time.perf_counter()
+                func(source.draw(n), method=method, source=source)
+                best = min(best, time.perf_counter() - start)
+            timings[f"{name} {method}"] = best
+        return timings
+    
+    @staticmethod
+    def _uniforms(random_nums, source):
+        """Fuente que entrega primero los números de entrada y después los de `source`.
+        
+        Si no se indica fuente, se continúa con un flujo PCG cuya semilla se deriva de
+        los propios números de entrada, de modo que el resultado es reproducible.
+        `source` puede ser una UniformSource, un iterador de bloques o un objeto de
+        estado de numpy (np.random.Generator, BitGenerator o RandomState).
+        """
+        u = np.asarray(random_nums, dtype=np.float64)
+        if source is None:
+            digest = hashlib.blake2b(u.tobytes(), digest_size=8).digest()
+            source = RandomGenerator.stream('pcg', int.from_bytes(digest, 'little'))
+        return UniformSource(source, values=u)
+    
+    @staticmethod
+    def _rejection(n, propose, dtype=np.float64):
+        """Muestreo por rechazo vectorizado.
+        
+        `propose(m)` devuelve (candidatos, aceptados) para m posiciones; la siguiente
+        ronda se repite solo sobre las posiciones rechazadas.
+        """
+        values, accepted = propose(n)
+        result = np.array(values, dtype=dtype)
+        pending = np.flatnonzero(~accepted)
+        while pending.size:
+            values, accepted = propose(pending.size)
+            result[pending[accepted]] = values[accepted]
+            pending = pending[~accepted]
+        return result
+    
+    @staticmethod
+    def _inversion(u, first, ratio, limit):
+        """Inversión secuencial de una distribución discreta para un arreglo de uniformes.
+        
+        La probabilidad de k+1 es la de k multiplicada por ratio(k); el recorrido
+        avanza todos los valores a la vez y termina cuando ninguno supera la
+        acumulada o se alcanza `limit`.
+        """
+        result = np.zeros(u.size, dtype=np.int64)
+        prob = cumulative = first
+        k = 0
+        active = u > cumulative
+        while k < limit and active.any():
+            result[active] += 1
+            prob *= ratio(k)
+            cumulative += prob
+            k += 1
+            active &= u > cumulative
+        return result
+    
+    @staticmethod
+    def _log_gamma_variates(n, shape, src):
+        """Logaritmo de n variables Gamma(shape, 1) (Marsaglia-Tsang).
+        
+        Para shape < 1 se usa Gamma(shape + 1) * U^(1/shape); trabajar en logaritmos
+        evita que las formas pequeñas se redondeen a cero.
+        """
+        boost = None
+        if shape < 1:
+            boost = np.log(np.maximum(src.draw(n), 1e-300)) / shape
+            shape += 1
+        d = shape - 1 / 3
+        c = 1 / np.sqrt(9 * d)
+        
+        def propose(m):
+            x = DistributionTransformer.normal(src.draw(m))
+            v = 1 + c * x
+            u = src.draw(m)
+            positive = v > 0
+            v = np.where(positive, v, 1) ** 3
+            x2 = x * x
+            with np.errstate(divide='ignore'):
+                accepted = positive & ((u < 1 - 0.0331 * x2 * x2) |
+                                       (np.log(u) < 0.5 * x2 + d * (1 - v + np.log(v))))
+            return np.log(d * v), accepted
+        
+        result = DistributionTransformer._rejection(n, propose)
+        if boost is not None:
+            result += boost
+        return result
+    
+    @staticmethod
+    def poisson(random_nums, lambd=1.0, source=None):
+        """Distribución de Poisson.
+        
+        Para lambda < 10 se invierte la función de distribución con un uniforme por
+        valor; para lambda >= 10 se usa el algoritmo PTRS de Hörmann (transformación
+        con rechazo), que toma pares de uniformes de la fuente.
+        """
+        src = DistributionTransformer._uniforms(random_nums, source)
+        n = src.buffer.size
+        if lambd < 10:
+            u = src.draw(n)
+            result = DistributionTransformer._inversion(u, np.exp(-lambd), lambda k: lambd / (k + 1),
+                                                        limit=int(lambd + 40 * np.sqrt(lambd) + 40))
+            return DistributionTransformer._result(result, random_nums)
+        
+        slam, loglam = np.sqrt(lambd), np.log(lambd)
+        b = 0.931 + 2.53 * slam
+        a = -0.059 + 0.02483 * b
+        invalpha = 1.1239 + 1.1328 / (b - 3.4)
+        vr = 0.9277 - 3.6224 / (b - 2)
+        
+        def propose(m):
+            u = src.draw(m) - 0.5
+            v = src.draw(m)
+            us = 0.5 - np.abs(u)
+            k = np.floor((2 * a / us + b) * u + lambd + 0.43)
+            quick = (us >= 0.07) & (v <= vr)
+            valid = (k >= 0) & ~((us < 0.013) & (v > us))
+            with np.errstate(divide='ignore'):
+                exact = (np.log(v) + np.log(invalpha) - np.log(a / (us * us) + b)
+                         <= -lambd + k * loglam - gammaln(np.maximum(k, 0) + 1))
+            return k, quick | (valid & exact)
+        
+        result = DistributionTransformer._rejection(n, propose).astype(np.int64)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def binomial(random_nums, n=10, p=0.5, source=None):
+        """Distribución Binomial.
+        
+        Con n*min(p, 1-p) < 30 se invierte la función de distribución (un uniforme por
+        valor); en otro caso se usa BTPE de Kachitvichyanukul y Schmeiser, con la
+        prueba de aceptación final evaluada exactamente mediante log-probabilidades.
+        """
+        src = DistributionTransformer._uniforms(random_nums, source)
+        size = src.buffer.size
+        r = min(p, 1 - p)
+        q = 1 - r
+        
+        if n * r < 30:
+            u = src.draw(size)
+            result = DistributionTransformer._inversion(u, q ** n, lambda k: (n - k) / (k + 1) * r / q,
+                                                        limit=n)
+        else:
+            fm = n * r + r
+            m = np.floor(fm)
+            p1 = np.floor(2.195 * np.sqrt(n * r * q) - 4.6 * q) + 0.5
+            xm = m + 0.5
+            xl, xr = xm - p1, xm + p1
+            c = 0.134 + 20.5 / (15.3 + m)
+            a = (fm - xl) / (fm - xl * r)
+            laml = a * (1 + a / 2)
+            a = (xr - fm) / (xr * q)
+            lamr = a * (1 + a / 2)
+            p2 = p1 * (1 + 2 * c)
+            p3 = p2 + c / laml
+            p4 = p3 + c / lamr
+            log_fm = gammaln(m + 1) + gammaln(n - m + 1) - m * np.log(r / q)
+            
+            def propose(count):
+                u = src.draw(count) * p4
+                v = src.draw(count).copy()
+                y = np.empty(count)
+                # Región 1: triángulo central, aceptación inmediata
+                center = u <= p1
+                y[center] = np.floor(xm - p1 * v[center] + u[center])
+                # Región 2: paralelogramos
+                para = ~center & (u <= p2)
+                x = xl + (u[para] - p1) / c
+                v[para] = v[para] * c + 1 - np.abs(m - x + 0.5) / p1
+                y[para] = np.floor(x)
+                # Regiones 3 y 4: colas exponenciales izquierda y derecha
+                left = ~center & ~para & (u <= p3)
+                right = ~center & ~para & ~left
+                with np.errstate(divide='ignore'):
+                    y[left] = np.floor(xl + np.log(v[left]) / laml)
+                    y[right] = np.floor(xr - np.log(v[right]) / lamr)
+                v[left] *= (u[left] - p2) * laml
+                v[right] *= (u[right] - p3) * lamr
+                
+                inside = (v <= 1) & (y >= 0) & (y <= n)
+                k = np.clip(y, 0, n)
+                log_ratio = log_fm - gammaln(k + 1) - gammaln(n - k + 1) + k * np.log(r / q)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    accepted = center | (~center & inside & (np.log(v) <= log_ratio))
+                return y, accepted
+            
+            result = DistributionTransformer._rejection(size, propose).astype(np.int64)
+        if p > 0.5:
+            result = n - result
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def gamma(random_nums, shape=1.0, scale=1.0, source=None):
+        """Distribución Gamma (Marsaglia-Tsang)"""
+        src = DistributionTransformer._uniforms(random_nums, source)
+        result = DistributionTransformer._log_gamma_variates(src.buffer.size, shape, src)
+        np.exp(result, out=result)
+        result *= scale
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def beta(random_nums, alpha=2.0, beta=2.0, source=None):
+        """Distribución Beta como X / (X + Y) con X ~ Gamma(alpha) e Y ~ Gamma(beta)"""
+        src = DistributionTransformer._uniforms(random_nums, source)
+        n = src.buffer.size
+        log_x = DistributionTransformer._log_gamma_variates(n, alpha, src)
+        log_y = DistributionTransformer._log_gamma_variates(n, beta, src)
+        # X / (X + Y) = 1 / (1 + exp(log Y - log X)), estable aunque X e Y sean diminutos
+        result = expit(log_x - log_y)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def chi_squared(random_nums, df=1, source=None):
+        """Distribución Chi-cuadrado (caso especial de Gamma)"""
+        # Chi-cuadrado es un caso especial de Gamma con shape=df/2 y scale=2
+        return DistributionTransformer.gamma(random_nums, shape=df/2, scale=2, source=source)
+    
+    @staticmethod
+    def t_distribution(random_nums, df=1, source=None):
+        """Distribución t-Student: Z / sqrt(V / df) con Z normal y V chi-cuadrado"""
+        src = DistributionTransformer._uniforms(random_nums, source)
+        n = src.buffer.size
+        z = DistributionTransformer.normal(src.draw(n))
+        v = DistributionTransformer.chi_squared(src.draw(n), df, source=src)
+        result = z / np.sqrt(v / df)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def f_distribution(random_nums, dfn=1, dfd=1, source=None):
+        """Distribución F como cociente de dos chi-cuadrado independientes"""
+        src = DistributionTransformer._uniforms(random_nums, source)
+        n = src.buffer.size
+        chi1 = DistributionTransformer.chi_squared(src.draw(n), dfn, source=src)
+        chi2 = DistributionTransformer.chi_squared(src.draw(n), dfd, source=src)
+        result = (chi1 / dfn) / (chi2 / dfd)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def geometric(random_nums, p=0.5):
+        """Distribución Geométrica"""
+        # Número de ensayos Bernoulli hasta el primer éxito (al menos uno)
+        u = np.minimum(np.asarray(random_nums, dtype=np.float64), np.nextafter(1, 0))
+        trials = np.log(1 - u)
+        trials /= np.log(1 - p)
+        np.ceil(trials, out=trials)
+        result = np.maximum(trials, 1).astype(np.int64)
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def discrete(random_nums, table, source=None):
+        """Distribución discreta definida por el usuario (AliasTable).
+        
+        Los números de entrada eligen la columna y los uniformes del lanzamiento de
+        moneda se toman a continuación de `source`.
+        """
+        u = np.asarray(random_nums, dtype=np.float64)
+        src = DistributionTransformer._uniforms(u, source)
+        columns = src.draw(u.size)
+        result = table.sample(columns, src.draw(u.size))
+        return DistributionTransformer._result(result, random_nums)
+    
+    @staticmethod
+    def negative_binomial(random_nums, n=10, p=0.5, source=None):
+        """Distribución Binomial Negativa (fracasos antes del n-ésimo éxito).
+        
+        Se suman n geométricas de fracasos, floor(log(U) / log(1 - p)); el primer
+        uniforme de cada valor es el de entrada y los demás se toman de `source`.
+        """
+        src = DistributionTransformer._uniforms(random_nums, source)
+        size = src.buffer.size
+        log_q = np.log1p(-p)
+        result = np.zeros(size, dtype=np.int64)
+        for _ in range(n):
+            failures = np.log1p(-np.minimum(src.draw(size), np.nextafter(1, 0)))
+            failures /= log_q
+            result += np.floor(failures).astype(np.int64)
+        return DistributionTransformer._result(result, random_nums)
+
+
+def main(argv=None):
+    """Modo sin interfaz: escribe palabras crudas de un generador en la salida estándar o un archivo.
+    
+    Ejemplos:
+        python generadores.py pcg --seed 42 | RNG_test stdin32
+        python generadores.py well --param variant=1024a --count 268435456 --output well.bin
+    """
+    import argparse
+    import ast
+    parser = argparse.ArgumentParser(description="Salida binaria cruda de RandomGenerator")
+    parser.add_argument('method', help="Nombre del método de RandomGenerator (pcg, well, philox, ...)")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla (por defecto la del método)")
+    parser.add_argument('--bits', type=int, choices=(32, 64), default=32, help="Tamaño de palabra")
+    parser.add_argument('--count', type=int, default=None,
+                        help="Palabras a escribir (obligatorio con --output; sin él la salida estándar no termina)")
+    parser.add_argument('--output', default='-', help="'-' para la salida estándar o ruta .bin/.npy")
+    parser.add_argument('--chunk-size', type=int, default=2**20, help="Palabras por bloque")
+    parser.add_argument('--param', action='append', default=[], metavar='CLAVE=VALOR',
+                        help="Parámetro adicional del método (por ejemplo variant=1024a)")
+    args = parser.parse_args(argv)
+    
+    params = {}
+    for item in args.param:
+        key, _, value = item.partition('=')
+        try:
+            params[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            params[key] = value
+    written = RandomGenerator.write_raw(args.method, args.output, args.count, args.seed, args.bits,
+                                        args.chunk_size, **params)
+    if args.output != '-':
+        print(f"{written} palabras de {args.bits} bits escritas en {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
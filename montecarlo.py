@@ -5,13 +5,31 @@ from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QLineEdit, QCheckBox, QSpinBox, QGroupBox, 
                             QFormLayout, QSplitter, QTableWidget, QTableWidgetItem,
-                            QComboBox, QMessageBox, QFileDialog, QHeaderView)
+                            QComboBox, QMessageBox, QFileDialog, QHeaderView, QProgressDialog)
 from PyQt5.QtCore import Qt
 import sys
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
 from sympy import symbols, sympify, lambdify, integrate, S
-import random
+from generadores import RandomGenerator, RunningStats
 
 class MonteCarloSimulator(QWidget):
+    # Puntos que se procesan a la vez en el modo por bloques (unos pocos MB por bloque)
+    TAMANO_BLOQUE = 2**16
+    # Por encima de esta cantidad la simulación se hace siempre por bloques
+    MAX_EN_MEMORIA = 1000000
+    # Cuantil 0.975 de la normal estándar para el intervalo de confianza del 95 %
+    Z_95 = 1.959963984540054
+    # Estimadores disponibles; salvo acierto-fallo, todos promedian (b - a)·|f(x) - g(x)|
+    ESTIMADORES = ["Acierto-fallo", "Media muestral", "Variables antitéticas", "Variable de control",
+                   "Muestreo estratificado", "Muestreo por importancia",
+                   "Cuasi-Monte Carlo (Sobol)", "Cuasi-Monte Carlo (Halton)"]
+    # Puntos por estrato en el muestreo estratificado (al menos 2 para estimar su varianza)
+    PUNTOS_POR_ESTRATO = 10
+    # Nodos de la malla con la que se invierte la densidad propuesta
+    NODOS_DENSIDAD = 4097
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Integración por Monte Carlo")
@@ -28,6 +46,9 @@ class MonteCarloSimulator(QWidget):
         self.area_mc = None
         self.func1 = None
         self.func2 = None
+        self.semilla = None
+        self.pool = None
+        self.pool_procesos = 0
         
         # Layout principal con splitter
         main_layout = QHBoxLayout(self)
@@ -87,12 +108,53 @@ class MonteCarloSimulator(QWidget):
         
         # Número de simulaciones
         self.input_simulaciones = QSpinBox()
-        self.input_simulaciones.setRange(100, 1000000)
+        self.input_simulaciones.setRange(100, 1000000000)
         self.input_simulaciones.setValue(10000)
         self.input_simulaciones.setSingleStep(1000)
         self.input_simulaciones.setStyleSheet(estilo_input)
         form_integracion.addRow("Simulaciones:", self.input_simulaciones)
         
+        # Semilla del generador propio de la simulación
+        self.input_semilla = QSpinBox()
+        self.input_semilla.setRange(1, 2**31-1)
+        self.input_semilla.setValue(12345)
+        self.input_semilla.setStyleSheet(estilo_input)
+        form_integracion.addRow("Semilla:", self.input_semilla)
+        
+        # Procesos para el modo por bloques (el resultado no depende de cuántos sean)
+        self.input_procesos = QSpinBox()
+        self.input_procesos.setRange(1, os.cpu_count() or 1)
+        self.input_procesos.setValue(1)
+        self.input_procesos.setStyleSheet(estilo_input)
+        form_integracion.addRow("Procesos:", self.input_procesos)
+        
+        # Estimador de la integral
+        self.selector_estimador = QComboBox()
+        self.selector_estimador.addItems(self.ESTIMADORES)
+        self.selector_estimador.setStyleSheet(
+            "padding: 5px; border-radius: 4px; background-color: #E4F0F6; "
+            "color: #333333; border: 1px solid #B0D2E0;"
+        )
+        self.selector_estimador.currentIndexChanged.connect(self.actualizar_estimador)
+        form_integracion.addRow("Estimador:", self.selector_estimador)
+        
+        # Variable de control c(x): su media exacta en [a, b] se calcula con sympy
+        self.input_control = QLineEdit("x")
+        self.input_control.setStyleSheet(estilo_input)
+        form_integracion.addRow("Control c(x):", self.input_control)
+        
+        # Densidad propuesta p(x) para muestreo por importancia (no hace falta normalizarla)
+        self.input_densidad = QLineEdit("1")
+        self.input_densidad.setStyleSheet(estilo_input)
+        form_integracion.addRow("Densidad p(x):", self.input_densidad)
+        
+        # Réplicas aleatorizadas independientes del modo cuasi-Monte Carlo (dan la barra de error)
+        self.input_replicas = QSpinBox()
+        self.input_replicas.setRange(2, 256)
+        self.input_replicas.setValue(16)
+        self.input_replicas.setStyleSheet(estilo_input)
+        form_integracion.addRow("Réplicas QMC:", self.input_replicas)
+        
         grupo_integracion.setLayout(form_integracion)
         panel_izquierdo.addWidget(grupo_integracion)
         
@@ -111,6 +173,11 @@ class MonteCarloSimulator(QWidget):
         
         panel_izquierdo.addLayout(opciones_layout)
         
+        self.check_bloques = QCheckBox("Procesar por bloques (memoria constante)")
+        self.check_bloques.setChecked(False)
+        self.check_bloques.setStyleSheet("font-size: 12px;")
+        panel_izquierdo.addWidget(self.check_bloques)
+        
         # Botones de acción
         botones_layout = QHBoxLayout()
         
@@ -151,11 +218,13 @@ class MonteCarloSimulator(QWidget):
         
         self.etiqueta_area_exacta = QLabel("Valor exacto de la integral: -")
         self.etiqueta_area_mc = QLabel("Aproximación Monte Carlo: -")
+        self.etiqueta_intervalo = QLabel("Intervalo de confianza 95%: -")
         self.etiqueta_error = QLabel("Error relativo: -")
+        self.etiqueta_varianza = QLabel("Varianza del estimador: -")
         self.etiqueta_puntos = QLabel("Puntos simulados: -")
         
-        for etiqueta in [self.etiqueta_area_exacta, self.etiqueta_area_mc, 
-                        self.etiqueta_error, self.etiqueta_puntos]:
+        for etiqueta in [self.etiqueta_area_exacta, self.etiqueta_area_mc, self.etiqueta_intervalo,
+                        self.etiqueta_varianza, self.etiqueta_error, self.etiqueta_puntos]:
             etiqueta.setStyleSheet("font-size: 12px; padding: 2px;")
             resultados_layout.addWidget(etiqueta)
         
@@ -163,8 +232,8 @@ class MonteCarloSimulator(QWidget):
         panel_izquierdo.addWidget(self.grupo_resultados)
         
         # Tabla de convergencia
-        self.tabla_convergencia = QTableWidget(0, 3)
-        self.tabla_convergencia.setHorizontalHeaderLabels(['Simulaciones', 'Área Monte Carlo', 'Error Rel. (%)'])
+        self.tabla_convergencia = QTableWidget(0, 5)
+        self.tabla_convergencia.setHorizontalHeaderLabels(['Estimador', 'Simulaciones', 'Área Monte Carlo', 'IC 95% (±)', 'Error Rel. (%)'])
         self.tabla_convergencia.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.tabla_convergencia.setStyleSheet("font-size: 12px;")
         panel_izquierdo.addWidget(self.tabla_convergencia)
@@ -197,6 +266,7 @@ class MonteCarloSimulator(QWidget):
         
         # Establecer estado inicial
         self.actualizar_formulario()
+        self.actualizar_estimador()
     
     def actualizar_formulario(self):
         """Actualiza el formulario según el tipo de cálculo seleccionado"""
@@ -206,6 +276,16 @@ class MonteCarloSimulator(QWidget):
         else:
             self.input_funcion2.setEnabled(True)
     
+    def actualizar_estimador(self):
+        """Habilita solo las opciones que usa el estimador seleccionado"""
+        estimador = self.selector_estimador.currentText()
+        self.input_control.setEnabled(estimador == "Variable de control")
+        self.input_densidad.setEnabled(estimador == "Muestreo por importancia")
+        self.input_replicas.setEnabled(estimador.startswith("Cuasi-Monte Carlo"))
+        # Los bloques y el pool de procesos son del modo acierto-fallo
+        self.input_procesos.setEnabled(estimador == "Acierto-fallo")
+        self.check_bloques.setEnabled(estimador == "Acierto-fallo")
+    
     def parsear_expresion(self, expresion_texto):
         """Convierte una expresión de texto a una función lambda"""
         try:
@@ -216,6 +296,204 @@ class MonteCarloSimulator(QWidget):
             QMessageBox.critical(self, "Error", f"Error al parsear la expresión: {str(e)}")
             return None
     
+    @staticmethod
+    def evaluar(func, x):
+        """Evalúa una función lambdificada sobre un arreglo (las constantes devuelven un escalar)"""
+        return np.broadcast_to(np.asarray(func(x), dtype=np.float64), x.shape)
+    
+    @staticmethod
+    def clasificar_puntos(func1, func2, x, y, y_min, y_max):
+        """Máscara booleana de los puntos (x, y) que caen entre las curvas f y g"""
+        valores_f1 = MonteCarloSimulator.evaluar(func1, x)
+        valores_f2 = MonteCarloSimulator.evaluar(func2, x)
+        inferior = np.minimum(valores_f1, valores_f2)
+        superior = np.maximum(valores_f1, valores_f2)
+        return (y_min <= y) & (y <= y_max) & (inferior <= y) & (y <= superior)
+    
+    @staticmethod
+    def semiamplitud(estadisticas):
+        """Semiamplitud del intervalo de confianza del 95 % de la media acumulada"""
+        if estadisticas.count < 2:
+            return float('inf')
+        return MonteCarloSimulator.Z_95 * math.sqrt(estadisticas.m2 / (estadisticas.count - 1) / estadisticas.count)
+    
+    # Estimadores de reducción de varianza. Todos reciben h vectorizada y devuelven
+    # (estimación de ∫[a,b] h, varianza estimada de esa estimación) usando n evaluaciones de h.
+    
+    @staticmethod
+    def media_muestral(h, a, b, n, rng):
+        """Promedio de (b - a)·h(x) con x uniforme en [a, b]"""
+        valores = (b - a) * h(rng.uniform(a, b, n))
+        return valores.mean(), valores.var(ddof=1) / n
+    
+    @staticmethod
+    def antiteticas(h, a, b, n, rng):
+        """Media muestral sobre pares (x, a + b - x): n/2 pares, n evaluaciones"""
+        x = rng.uniform(a, b, max(n // 2, 2))
+        valores = (b - a) * (h(x) + h(a + b - x)) / 2
+        return valores.mean(), valores.var(ddof=1) / valores.size
+    
+    @staticmethod
+    def variable_control(h, a, b, n, rng, control, media_control):
+        """Media muestral corregida con c(x), de media conocida, y el coeficiente óptimo estimado"""
+        x = rng.uniform(a, b, n)
+        valores = (b - a) * h(x)
+        c = MonteCarloSimulator.evaluar(control, x)
+        varianza_c = c.var(ddof=1)
+        beta = np.cov(valores, c)[0, 1] / varianza_c if varianza_c > 0 else 0.0
+        valores = valores - beta * (c - media_control)
+        return valores.mean(), valores.var(ddof=1) / n
+    
+    @staticmethod
+    def estratificado(h, a, b, n, rng, por_estrato=PUNTOS_POR_ESTRATO):
+        """Estratos de igual ancho con asignación proporcional (por_estrato puntos en cada uno)"""
+        estratos = max(n // por_estrato, 1)
+        cantidades = np.full(estratos, n // estratos)
+        cantidades[:n % estratos] += 1
+        estrato = np.repeat(np.arange(estratos), cantidades)
+        ancho = (b - a) / estratos
+        valores = h(a + ancho * (estrato + rng.random(n)))
+        medias = np.bincount(estrato, valores, estratos) / cantidades
+        varianzas = np.bincount(estrato, np.square(valores - medias[estrato]), estratos) / (cantidades - 1)
+        return ancho * medias.sum(), ancho ** 2 * (varianzas / cantidades).sum()
+    
+    @staticmethod
+    def importancia(h, a, b, n, rng, densidad, nodos=NODOS_DENSIDAD):
+        """Promedio de h(x)/q(x) con x ~ q, la densidad p normalizada en [a, b].
+        
+        p se evalúa en una malla y se muestrea invirtiendo su acumulada lineal a
+        trozos; el peso usa la densidad de esa misma acumulada (constante en cada
+        celda), así que el estimador es insesgado siempre que p > 0 donde h ≠ 0.
+        """
+        malla = np.linspace(a, b, nodos)
+        p = MonteCarloSimulator.evaluar(densidad, malla)
+        if not np.all(np.isfinite(p)) or np.any(p < 0):
+            raise ValueError("La densidad propuesta debe ser finita y no negativa en [a, b].")
+        anchos = np.diff(malla)
+        masas = (p[:-1] + p[1:]) / 2 * anchos
+        total = masas.sum()
+        if total <= 0:
+            raise ValueError("La densidad propuesta no puede ser nula en todo [a, b].")
+        masas /= total
+        acumulada = np.concatenate(([0.0], np.cumsum(masas)))
+        acumulada[-1] = 1.0
+        u = rng.random(n)
+        # Las celdas sin masa nunca se eligen: su acumulada no avanza
+        celda = np.clip(np.searchsorted(acumulada, u, side='right') - 1, 0, nodos - 2)
+        x = malla[celda] + (u - acumulada[celda]) / masas[celda] * anchos[celda]
+        valores = h(x) * anchos[celda] / masas[celda]
+        return valores.mean(), valores.var(ddof=1) / n
+    
+    @staticmethod
+    def cuasi_montecarlo(h, a, b, n, semilla, secuencia="sobol", replicas=16):
+        """Media muestral sobre `replicas` secuencias de Sobol o Halton aleatorizadas.
+        
+        Cada réplica usa n // replicas puntos de la secuencia con su propio
+        scrambling (semilla [semilla, réplica]), así las réplicas son independientes
+        e insesgadas y su dispersión da la varianza. Para integrandos suaves el error
+        decae cerca de 1/N en lugar de 1/√N; con Sobol conviene que n / replicas sea
+        potencia de 2.
+        """
+        generador = getattr(RandomGenerator, secuencia)
+        puntos = max(n // replicas, 1)
+        estimaciones = np.array([(b - a) * h(a + (b - a) * generador(puntos, seed=[semilla, replica],
+                                                                     scramble=True, as_array=True)).mean()
+                                 for replica in range(replicas)])
+        return estimaciones.mean(), estimaciones.var(ddof=1) / replicas
+    
+    def estimar_integral(self, estimador, a, b, n, rng):
+        """Aplica el estimador de reducción de varianza elegido a h(x) = |f(x) - g(x)|"""
+        func1, func2 = self.func1, self.func2
+        h = lambda x: np.abs(self.evaluar(func1, x) - self.evaluar(func2, x))
+        if estimador == "Media muestral":
+            return self.media_muestral(h, a, b, n, rng)
+        if estimador == "Variables antitéticas":
+            return self.antiteticas(h, a, b, n, rng)
+        if estimador == "Variable de control":
+            x = symbols('x')
+            expresion_control = sympify(self.input_control.text())
+            media_control = float(integrate(expresion_control, (x, a, b)).evalf()) / (b - a)
+            control = lambdify(x, expresion_control, 'numpy')
+            return self.variable_control(h, a, b, n, rng, control, media_control)
+        if estimador == "Muestreo estratificado":
+            return self.estratificado(h, a, b, n, rng)
+        if estimador == "Muestreo por importancia":
+            densidad = lambdify(symbols('x'), sympify(self.input_densidad.text()), 'numpy')
+            return self.importancia(h, a, b, n, rng, densidad)
+        if estimador.startswith("Cuasi-Monte Carlo"):
+            secuencia = "sobol" if "Sobol" in estimador else "halton"
+            return self.cuasi_montecarlo(h, a, b, n, self.semilla, secuencia, self.input_replicas.value())
+        raise ValueError(f"Estimador desconocido: {estimador}")
+    
+    def simular_por_bloques(self, a, b, y_min, y_max, area_rectangulo, num_simulaciones, semilla, procesos=1):
+        """Acierto-fallo por bloques de TAMANO_BLOQUE puntos con memoria constante.
+        
+        Cada bloque usa su propio flujo (ver `simular_bloque`) y de él solo vuelven la
+        cantidad de aciertos, la media y la suma de cuadrados centrados, que se
+        combinan en el orden de los bloques (Welford/Chan en RunningStats). Con
+        `procesos` > 1 los bloques se reparten en un pool de procesos; como los
+        flujos y el orden de combinación no dependen del reparto, el resultado es
+        idéntico bit a bit con cualquier cantidad de procesos. Tras cada bloque se
+        muestra la estimación con su intervalo del 95 %. Para la gráfica se guardan
+        únicamente los puntos del primer bloque. Devuelve (estadísticas, aciertos).
+        """
+        tareas = self.tareas_bloques(a, b, y_min, y_max, area_rectangulo, num_simulaciones, semilla)
+        random_x, random_y, dentro = puntos_bloque(tareas[0])
+        self.valores_x, self.valores_y = random_x, random_y
+        self.puntos_dentro = np.column_stack((random_x[dentro], random_y[dentro]))
+        self.puntos_fuera = np.column_stack((random_x[~dentro], random_y[~dentro]))
+        
+        estadisticas = RunningStats()
+        aciertos = 0
+        progreso = QProgressDialog("Simulando por bloques...", "Cancelar", 0, num_simulaciones, self)
+        progreso.setWindowTitle("Simulación en curso")
+        progreso.setWindowModality(Qt.WindowModal)
+        progreso.setMinimumDuration(500)
+        
+        if procesos > 1:
+            resultados = self.obtener_pool(procesos).map(simular_bloque, tareas, chunksize=8)
+        else:
+            resultados = map(simular_bloque, tareas)
+        try:
+            for cantidad, aciertos_bloque, media, m2 in resultados:
+                estadisticas.merge_moments(cantidad, media, m2)
+                aciertos += aciertos_bloque
+                
+                self.etiqueta_area_mc.setText(f"Aproximación Monte Carlo: {estadisticas.mean:.6f}")
+                self.etiqueta_intervalo.setText(f"Intervalo de confianza 95%: ±{self.semiamplitud(estadisticas):.6f}")
+                self.etiqueta_puntos.setText(f"Puntos simulados: {estadisticas.count} ({aciertos} dentro)")
+                progreso.setValue(estadisticas.count)
+                if progreso.wasCanceled():
+                    break
+        finally:
+            # Al cerrar el iterador del pool se cancelan los bloques pendientes
+            if hasattr(resultados, 'close'):
+                resultados.close()
+            progreso.close()
+        return estadisticas, aciertos
+    
+    def tareas_bloques(self, a, b, y_min, y_max, area_rectangulo, num_simulaciones, semilla):
+        """Tareas de acierto-fallo, una por bloque de TAMANO_BLOQUE puntos (ver `puntos_bloque`)"""
+        return [(self.input_funcion1.text(), self.input_funcion2.text(), a, b, y_min, y_max,
+                 area_rectangulo, semilla, indice, min(self.TAMANO_BLOQUE, num_simulaciones - inicio))
+                for indice, inicio in enumerate(range(0, num_simulaciones, self.TAMANO_BLOQUE))]
+    
+    def obtener_pool(self, procesos):
+        """Pool de procesos reutilizable entre simulaciones (se recrea si cambia el tamaño)"""
+        if self.pool is None or self.pool_procesos != procesos:
+            if self.pool is not None:
+                self.pool.shutdown(cancel_futures=True)
+            self.pool = ProcessPoolExecutor(max_workers=procesos)
+            self.pool_procesos = procesos
+        return self.pool
+    
+    def closeEvent(self, event):
+        """Libera el pool de procesos al cerrar la ventana"""
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+        super().closeEvent(event)
+    
     def ejecutar_simulacion(self):
         """Ejecuta la simulación Monte Carlo"""
         try:
@@ -248,8 +526,8 @@ class MonteCarloSimulator(QWidget):
             
             # Evaluar funciones en límites para encontrar rango vertical
             x_vals = np.linspace(a, b, 1000)
-            y1_vals = self.func1(x_vals)
-            y2_vals = self.func2(x_vals)
+            y1_vals = self.evaluar(self.func1, x_vals)
+            y2_vals = self.evaluar(self.func2, x_vals)
             
             # Encontrar el rango vertical para el rectángulo
             y_min = min(np.min(y2_vals), np.min(y1_vals))
@@ -270,35 +548,56 @@ class MonteCarloSimulator(QWidget):
             area_rectangulo = (b - a) * (y_max - y_min)
             
             # Realizar simulación Monte Carlo
-            puntos_dentro = 0
-            
-            # Generar puntos aleatorios
-            random_x = np.random.uniform(a, b, num_simulaciones)
-            random_y = np.random.uniform(y_min, y_max, num_simulaciones)
+            # Generar puntos aleatorios con un generador propio (no el estado global de
+            # numpy), así la simulación es reproducible y no interfiere con otras ventanas
+            self.semilla = self.input_semilla.value()
+            rng = np.random.default_rng(self.semilla)
             
-            # Variables para guardar puntos para la gráfica
-            self.valores_x = random_x
-            self.valores_y = random_y
-            self.puntos_dentro = []
-            self.puntos_fuera = []
-            
-            # Evaluar los puntos
-            for i in range(num_simulaciones):
-                x = random_x[i]
-                y = random_y[i]
+            estimador = self.selector_estimador.currentText()
+            procesos = self.input_procesos.value()
+            if estimador != "Acierto-fallo":
+                if num_simulaciones > self.MAX_EN_MEMORIA:
+                    QMessageBox.warning(self, "Error", "Los estimadores de reducción de varianza trabajan en memoria: "
+                                        f"use como máximo {self.MAX_EN_MEMORIA} simulaciones.")
+                    return
+                self.area_mc, varianza = self.estimar_integral(estimador, a, b, num_simulaciones, rng)
+                semiamplitud = self.Z_95 * math.sqrt(varianza)
+                # Estos estimadores no clasifican puntos del rectángulo: no hay nada que dibujar
+                self.valores_x, self.valores_y = [], []
+                self.puntos_dentro = self.puntos_fuera = np.empty((0, 2))
+                puntos_dentro = None
+            elif self.check_bloques.isChecked() or procesos > 1 or num_simulaciones > self.MAX_EN_MEMORIA:
+                estadisticas, puntos_dentro = self.simular_por_bloques(
+                    a, b, y_min, y_max, area_rectangulo, num_simulaciones, self.semilla, procesos)
+                # Si se canceló, el resultado corresponde a los puntos ya procesados
+                num_simulaciones = estadisticas.count
+                self.area_mc = estadisticas.mean
+                semiamplitud = self.semiamplitud(estadisticas)
+                varianza = (semiamplitud / self.Z_95) ** 2
+            else:
+                # Mismos flujos por bloque y mismo orden de combinación que el modo por bloques,
+                # así el resultado no depende del modo ni de la cantidad de procesos
+                bloques = [puntos_bloque(tarea) for tarea in
+                           self.tareas_bloques(a, b, y_min, y_max, area_rectangulo, num_simulaciones, self.semilla)]
+                estadisticas = RunningStats()
+                puntos_dentro = 0
+                for _, _, dentro in bloques:
+                    cantidad, aciertos, media, m2 = resumir_bloque(dentro, area_rectangulo)
+                    estadisticas.merge_moments(cantidad, media, m2)
+                    puntos_dentro += aciertos
                 
-                valor_f1 = self.func1(x)
-                valor_f2 = self.func2(x)
+                # Variables para guardar puntos para la gráfica
+                random_x = np.concatenate([bloque[0] for bloque in bloques])
+                random_y = np.concatenate([bloque[1] for bloque in bloques])
+                dentro = np.concatenate([bloque[2] for bloque in bloques])
+                self.valores_x = random_x
+                self.valores_y = random_y
+                self.puntos_dentro = np.column_stack((random_x[dentro], random_y[dentro]))
+                self.puntos_fuera = np.column_stack((random_x[~dentro], random_y[~dentro]))
                 
-                # Determinar si el punto está dentro de la región
-                if (y_min <= y <= y_max) and ((valor_f2 <= y <= valor_f1) if valor_f1 >= valor_f2 else (valor_f1 <= y <= valor_f2)):
-                    puntos_dentro += 1
-                    self.puntos_dentro.append((x, y))
-                else:
-                    self.puntos_fuera.append((x, y))
-            
-            # Calcular el área estimada
-            self.area_mc = (puntos_dentro / num_simulaciones) * area_rectangulo
+                self.area_mc = estadisticas.mean
+                semiamplitud = self.semiamplitud(estadisticas)
+                varianza = (semiamplitud / self.Z_95) ** 2
             
             # Calcular error relativo
             if self.valor_exacto != 0:
@@ -309,21 +608,32 @@ class MonteCarloSimulator(QWidget):
             # Actualizar resultados
             self.etiqueta_area_exacta.setText(f"Valor exacto de la integral: {self.valor_exacto:.6f}")
             self.etiqueta_area_mc.setText(f"Aproximación Monte Carlo: {self.area_mc:.6f}")
+            self.etiqueta_intervalo.setText(f"Intervalo de confianza 95%: ±{semiamplitud:.6f} "
+                                            f"[{self.area_mc - semiamplitud:.6f}, {self.area_mc + semiamplitud:.6f}]")
+            self.etiqueta_varianza.setText(f"Varianza del estimador ({estimador}): {varianza:.6e}")
             self.etiqueta_error.setText(f"Error relativo: {error_relativo:.4f}%")
-            self.etiqueta_puntos.setText(f"Puntos simulados: {num_simulaciones} ({puntos_dentro} dentro)")
+            if puntos_dentro is None:
+                self.etiqueta_puntos.setText(f"Puntos simulados: {num_simulaciones} (evaluaciones de f y g)")
+            else:
+                self.etiqueta_puntos.setText(f"Puntos simulados: {num_simulaciones} ({puntos_dentro} dentro)")
             
             # Actualizar tabla de convergencia
             fila = self.tabla_convergencia.rowCount()
             self.tabla_convergencia.insertRow(fila)
-            self.tabla_convergencia.setItem(fila, 0, QTableWidgetItem(str(num_simulaciones)))
-            self.tabla_convergencia.setItem(fila, 1, QTableWidgetItem(f"{self.area_mc:.6f}"))
-            self.tabla_convergencia.setItem(fila, 2, QTableWidgetItem(f"{error_relativo:.4f}%"))
+            self.tabla_convergencia.setItem(fila, 0, QTableWidgetItem(estimador))
+            self.tabla_convergencia.setItem(fila, 1, QTableWidgetItem(str(num_simulaciones)))
+            self.tabla_convergencia.setItem(fila, 2, QTableWidgetItem(f"{self.area_mc:.6f}"))
+            self.tabla_convergencia.setItem(fila, 3, QTableWidgetItem(f"{semiamplitud:.6f}"))
+            self.tabla_convergencia.setItem(fila, 4, QTableWidgetItem(f"{error_relativo:.4f}%"))
             self.tabla_convergencia.scrollToBottom()
             
             # Guardar resultado para uso posterior
             self.resultados.append({
+                'estimador': estimador,
                 'simulaciones': num_simulaciones,
                 'area_mc': self.area_mc,
+                'ic95': semiamplitud,
+                'varianza': varianza,
                 'error': error_relativo
             })
             
@@ -358,8 +668,8 @@ class MonteCarloSimulator(QWidget):
         
         # Generar puntos para las curvas
         x_vals = np.linspace(a, b, 1000)
-        y1_vals = self.func1(x_vals)
-        y2_vals = self.func2(x_vals)
+        y1_vals = self.evaluar(self.func1, x_vals)
+        y2_vals = self.evaluar(self.func2, x_vals)
         
         # Graficar funciones
         ax.plot(x_vals, y1_vals, 'b-', linewidth=2, label=f'f(x) = {self.input_funcion1.text()}')
@@ -371,38 +681,22 @@ class MonteCarloSimulator(QWidget):
         ax.fill_between(x_vals, y1_vals, y2_vals, color='skyblue', alpha=0.4)
         
         # Mostrar puntos de la simulación si está activada la opción
-        if self.check_puntos.isChecked() and self.puntos_dentro and self.puntos_fuera:
-            # Separar coordenadas de puntos dentro
-            x_dentro = [p[0] for p in self.puntos_dentro]
-            y_dentro = [p[1] for p in self.puntos_dentro]
-            
-            # Separar coordenadas de puntos fuera
-            x_fuera = [p[0] for p in self.puntos_fuera]
-            y_fuera = [p[1] for p in self.puntos_fuera]
-            
+        if self.check_puntos.isChecked() and len(self.puntos_dentro) and len(self.puntos_fuera):
             # Mostrar solo una muestra de puntos para no sobrecargar la gráfica
             max_puntos = min(1000, len(self.puntos_dentro), len(self.puntos_fuera))
+            rng = np.random.default_rng(self.semilla)
             
-            # Seleccionar índices aleatorios
-            if len(x_dentro) > max_puntos:
-                indices = random.sample(range(len(x_dentro)), max_puntos)
-                x_dentro_muestra = [x_dentro[i] for i in indices]
-                y_dentro_muestra = [y_dentro[i] for i in indices]
-            else:
-                x_dentro_muestra = x_dentro
-                y_dentro_muestra = y_dentro
-                
-            if len(x_fuera) > max_puntos:
-                indices = random.sample(range(len(x_fuera)), max_puntos)
-                x_fuera_muestra = [x_fuera[i] for i in indices]
-                y_fuera_muestra = [y_fuera[i] for i in indices]
-            else:
-                x_fuera_muestra = x_fuera
-                y_fuera_muestra = y_fuera
+            # Seleccionar filas aleatorias
+            muestra_dentro = self.puntos_dentro
+            if len(muestra_dentro) > max_puntos:
+                muestra_dentro = muestra_dentro[rng.choice(len(muestra_dentro), max_puntos, replace=False)]
+            muestra_fuera = self.puntos_fuera
+            if len(muestra_fuera) > max_puntos:
+                muestra_fuera = muestra_fuera[rng.choice(len(muestra_fuera), max_puntos, replace=False)]
             
             # Graficar puntos
-            ax.scatter(x_dentro_muestra, y_dentro_muestra, color='blue', s=5, alpha=0.5, label='Puntos dentro')
-            ax.scatter(x_fuera_muestra, y_fuera_muestra, color='red', s=5, alpha=0.2, label='Puntos fuera')
+            ax.scatter(muestra_dentro[:, 0], muestra_dentro[:, 1], color='blue', s=5, alpha=0.5, label='Puntos dentro')
+            ax.scatter(muestra_fuera[:, 0], muestra_fuera[:, 1], color='red', s=5, alpha=0.2, label='Puntos fuera')
         
         # Configurar gráfica
         ax.grid(self.check_grid.isChecked())
@@ -450,9 +744,10 @@ class MonteCarloSimulator(QWidget):
                     nombre_archivo += '.csv'
                 
                 # Crear contenido CSV
-                lineas = ["simulaciones,area_monte_carlo,error_relativo"]
+                lineas = ["estimador,simulaciones,area_monte_carlo,ic95,varianza,error_relativo"]
                 for res in self.resultados:
-                    lineas.append(f"{res['simulaciones']},{res['area_mc']},{res['error']}")
+                    lineas.append(f"{res['estimador']},{res['simulaciones']},{res['area_mc']},"
+                                  f"{res['ic95']},{res['varianza']},{res['error']}")
                 
                 # Guardar archivo
                 with open(nombre_archivo, 'w') as f:
@@ -477,6 +772,12 @@ class MonteCarloSimulator(QWidget):
         self.input_funcion1.setText("x**2")
         self.input_funcion2.setText("0")
         self.input_simulaciones.setValue(10000)
+        self.input_semilla.setValue(12345)
+        self.check_bloques.setChecked(False)
+        self.selector_estimador.setCurrentIndex(0)
+        self.input_control.setText("x")
+        self.input_densidad.setText("1")
+        self.input_replicas.setValue(16)
         
         # Limpiar resultados
         self.resultados = []
@@ -488,10 +789,13 @@ class MonteCarloSimulator(QWidget):
         self.area_mc = None
         self.func1 = None
         self.func2 = None
+        self.semilla = None
         
         # Limpiar etiquetas
         self.etiqueta_area_exacta.setText("Valor exacto de la integral: -")
         self.etiqueta_area_mc.setText("Aproximación Monte Carlo: -")
+        self.etiqueta_intervalo.setText("Intervalo de confianza 95%: -")
+        self.etiqueta_varianza.setText("Varianza del estimador: -")
         self.etiqueta_error.setText("Error relativo: -")
         self.etiqueta_puntos.setText("Puntos simulados: -")
         
@@ -504,3 +808,40 @@ class MonteCarloSimulator(QWidget):
         # Actualizar formulario
         self.actualizar_formulario()
 
+
+# Funciones lambdificadas por proceso: las de sympy no se pueden enviar entre procesos,
+# así que cada proceso del pool las reconstruye a partir del texto una sola vez
+_funciones = {}
+
+def _lambdificar(expresion1, expresion2):
+    """Devuelve (f, g) lambdificadas para las expresiones dadas, con caché por proceso"""
+    clave = (expresion1, expresion2)
+    if clave not in _funciones:
+        x = symbols('x')
+        _funciones[clave] = (lambdify(x, sympify(expresion1), 'numpy'),
+                             lambdify(x, sympify(expresion2), 'numpy'))
+    return _funciones[clave]
+
+def puntos_bloque(tarea):
+    """Puntos (x, y) de un bloque y su máscara de aciertos.
+    
+    El bloque i usa un flujo Philox propio, el de la semilla adelantado i * 2^128
+    posiciones, así que los flujos de bloques distintos nunca se solapan.
+    """
+    expresion1, expresion2, a, b, y_min, y_max, _, semilla, indice, cantidad = tarea
+    func1, func2 = _lambdificar(expresion1, expresion2)
+    rng = np.random.Generator(np.random.Philox(semilla).jumped(indice))
+    random_x = rng.uniform(a, b, cantidad)
+    random_y = rng.uniform(y_min, y_max, cantidad)
+    return random_x, random_y, MonteCarloSimulator.clasificar_puntos(func1, func2, random_x, random_y, y_min, y_max)
+
+def resumir_bloque(dentro, area_rectangulo):
+    """Resume una máscara de aciertos como (cantidad, aciertos, media, suma de cuadrados centrados)"""
+    valores = dentro * area_rectangulo
+    media = valores.mean()
+    return dentro.size, int(np.count_nonzero(dentro)), media, float(np.square(valores - media).sum())
+
+def simular_bloque(tarea):
+    """Resumen de un bloque (ver `resumir_bloque`), para ejecutarlo en el pool de procesos"""
+    _, _, dentro = puntos_bloque(tarea)
+    return resumir_bloque(dentro, tarea[6])
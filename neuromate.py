@@ -1,6 +1,7 @@
 import sys
 import os
 import traceback
+import multiprocessing
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
     QFrame, QMessageBox, QHBoxLayout, QSplitter, QScrollArea,
@@ -626,6 +627,8 @@ class NeuroMate(QWidget):
         return page
 
 if __name__ == '__main__':
+    # Necesario para los pools de procesos en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     try:
         app = QApplication(sys.argv)
         if getattr(sys, 'frozen', False):
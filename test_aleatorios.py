@@ -0,0 +1,482 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from generadores import AliasTable, RandomGenerator, SpectralTest
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+def ejecutar_cli(*argumentos):
+    """Ejecuta la salida cruda como en un servidor: sin pantalla ni backend de Qt configurado"""
+    entorno = {clave: valor for clave, valor in os.environ.items()
+               if clave not in ('DISPLAY', 'WAYLAND_DISPLAY', 'QT_QPA_PLATFORM', 'MPLBACKEND')}
+    return subprocess.run([sys.executable, os.path.join(RAIZ, 'generadores.py'), *argumentos],
+                          capture_output=True, env=entorno, timeout=120, check=True)
+
+
+def test_cli_sin_pantalla_salida_estandar():
+    salida = ejecutar_cli('pcg', '--seed', '42', '--count', '16').stdout
+    esperado = next(RandomGenerator.raw_stream('pcg', 42, total=16))
+    np.testing.assert_array_equal(np.frombuffer(salida, dtype='<u4'), esperado)
+
+
+@pytest.mark.parametrize("bits", [32, 64])
+def test_cli_sin_pantalla_archivo_npy(tmp_path, bits):
+    ruta = str(tmp_path / 'well.npy')
+    ejecutar_cli('well', '--param', 'variant=1024a', '--bits', str(bits), '--count', '1000', '--output', ruta)
+    esperado = np.concatenate(list(RandomGenerator.raw_stream('well', bits=bits, total=1000, variant='1024a')))
+    np.testing.assert_array_equal(np.load(ruta), esperado)
+
+
+def test_palabras_xorshift_con_semilla_de_mas_de_32_bits():
+    semilla = 2**40 + 12345
+    palabras = next(RandomGenerator.raw_stream('xorshift', semilla, total=50))
+    estados = RandomGenerator._xorshift_states(50, semilla)
+    np.testing.assert_array_equal(palabras, (estados & 0xFFFFFFFF).astype(np.uint64))
+    salida = ejecutar_cli('xorshift', '--seed', str(semilla), '--count', '50').stdout
+    np.testing.assert_array_equal(np.frombuffer(salida, dtype='<u4'), palabras)
+
+
+@pytest.mark.parametrize("a, esperado", [(65539, 2**29), (5, 2**29), (1, 2**31), (7, 2**31), (9, 2**31), (6, 2**31)])
+def test_modulo_del_reticulo_solo_se_reduce_con_a_3_o_5_mod_8(a, esperado):
+    assert SpectralTest.lattice_modulus(a, 0, 2**31) == esperado
+    assert SpectralTest.lattice_modulus(a, 1, 2**31) == 2**31
+
+
+# Bucles originales (anteriores a la vectorización), copiados tal cual como referencia
+
+def original_mersenne_twister(n, seed=None):
+    np.random.seed(seed)
+    return list(np.random.random(n))
+
+
+def original_xorshift(n, seed=123456789):
+    numbers = []
+    state = seed
+    for _ in range(n):
+        state ^= (state << 13) & 0xFFFFFFFF
+        state ^= (state >> 17) & 0xFFFFFFFF
+        state ^= (state << 5) & 0xFFFFFFFF
+        numbers.append(state / 0xFFFFFFFF)
+    return numbers
+
+
+def original_pcg(n, seed=42, mult=6364136223846793005, inc=1442695040888963407):
+    numbers = []
+    state = seed
+    for _ in range(n):
+        state = (mult * state + inc) & 0xFFFFFFFFFFFFFFFF
+        xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
+        rot = state >> 59
+        result = ((xorshifted >> rot) | (xorshifted << (32 - rot))) & 0xFFFFFFFF
+        numbers.append(result / 0xFFFFFFFF)
+    return numbers
+
+
+def original_lcg(n, seed=123456789, a=1103515245, c=12345, m=2**31):
+    numbers = []
+    x = seed
+    for _ in range(n):
+        x = (a * x + c) % m
+        numbers.append(x / m)
+    return numbers
+
+
+def original_mcg(n, seed=123456789, a=48271, m=2**31-1):
+    numbers = []
+    x = seed
+    for _ in range(n):
+        x = (a * x) % m
+        numbers.append(x / m)
+    return numbers
+
+
+def original_middle_square_weyl(n, seed=675248, w_seed=123456789):
+    numbers = []
+    x = seed
+    w = w_seed
+    m = 2**32
+    for _ in range(n):
+        w = (w + w_seed) % m
+        x = (x + w) % m
+        y = (x * x) % m
+        numbers.append(y / m)
+        x = y
+    return numbers
+
+
+@pytest.mark.parametrize("metodo, original, semillas, parametros", [
+    ('mersenne_twister', original_mersenne_twister, [0, 12345, 2**32 - 1], {}),
+    ('xorshift', original_xorshift, [1, 123456789, 0xFFFFFFFF, 2**40 + 7], {}),
+    ('pcg', original_pcg, [0, 42, 2**64 - 1], {}),
+    ('pcg', original_pcg, [7], {'mult': 0x5851F42D4C957F2D, 'inc': 1}),
+    ('lcg', original_lcg, [0, 123456789, 2**31 - 1], {}),
+    ('lcg', original_lcg, [5], {'a': 1664525, 'c': 1013904223, 'm': 2**32}),
+    ('lcg', original_lcg, [3], {'a': 6364136223846793005, 'c': 1, 'm': 2**64}),
+    ('mcg', original_mcg, [1, 123456789], {}),
+    ('mcg', original_mcg, [1], {'a': 16807}),
+    ('mcg', original_mcg, [12345], {'a': 65539, 'm': 2**31}),
+    ('middle_square_weyl', original_middle_square_weyl, [0, 675248, 2**32 - 1], {}),
+    ('middle_square_weyl', original_middle_square_weyl, [99], {'w_seed': 0xB5AD4ECEDA1CE2A9 % 2**32}),
+])
+def test_motores_vectorizados_iguales_a_los_bucles_originales(metodo, original, semillas, parametros):
+    for semilla in semillas:
+        for n in (1, 17, 5000):
+            assert getattr(RandomGenerator, metodo)(n, semilla, **parametros) == original(n, semilla, **parametros)
+
+
+SALTABLES = [
+    ('lcg', 123456789, {}),
+    ('lcg', 5, {'a': 1664525, 'c': 1013904223, 'm': 2**32}),
+    ('mcg', 123456789, {}),
+    ('pcg', 42, {}),
+    ('philox', 20111115, {}),
+    ('threefry', 2**40 + 3, {}),
+    ('sobol', 7, {'dim': 3, 'scramble': True}),
+    ('halton', 7, {'dim': 2, 'scramble': True}),
+]
+
+
+@pytest.mark.parametrize("metodo, semilla, parametros", SALTABLES)
+def test_subflujos_y_saltos_iguales_a_la_serie(metodo, semilla, parametros):
+    generar = getattr(RandomGenerator, metodo)
+    serie = generar(1000, semilla, as_array=True, **parametros)
+    for k in (1, 3, 7):
+        subflujos = RandomGenerator.split(metodo, 1000, k, semilla, **parametros)
+        partes = [RandomGenerator.generate_substream(subflujo) for subflujo in subflujos]
+        np.testing.assert_array_equal(np.concatenate(partes), serie)
+    for salto in (0, 1, 333, 999):
+        np.testing.assert_array_equal(generar(1000 - salto, semilla, as_array=True, offset=salto, **parametros),
+                                      serie[salto:])
+
+
+def test_generacion_en_paralelo_igual_a_la_serie():
+    serie = RandomGenerator.pcg(10001, 42, as_array=True)
+    np.testing.assert_array_equal(RandomGenerator.generate_parallel('pcg', 10001, 42, workers=3), serie)
+
+
+@pytest.mark.parametrize("a, c, m", [(1103515245, 12345, 2**31), (48271, 0, 2**31 - 1),
+                                     (6364136223846793005, 1442695040888963407, 2**64)])
+def test_skip_ahead_igual_a_avanzar_paso_a_paso(a, c, m):
+    x = semilla = 987654321
+    for k in range(1, 300):
+        x = (a * x + c) % m
+        assert RandomGenerator.skip_ahead(semilla, k, a, c, m) == x
+    assert RandomGenerator.skip_ahead(semilla, 0, a, c, m) == semilla
+
+
+# Transcripción directa de WELL512a.c y WELL1024a.c (Panneton, L'Ecuyer y Matsumoto)
+
+def _mat0pos(t, v):
+    return v ^ (v >> t)
+
+
+def _mat0neg(t, v):
+    return (v ^ (v << -t)) & 0xFFFFFFFF
+
+
+def referencia_well512a(estado, n):
+    STATE, i, salida = list(estado), 0, []
+    for _ in range(n):
+        z0 = STATE[(i + 15) & 0xF]
+        z1 = _mat0neg(-16, STATE[i]) ^ _mat0neg(-15, STATE[(i + 13) & 0xF])
+        z2 = _mat0pos(11, STATE[(i + 9) & 0xF])
+        STATE[i] = z1 ^ z2
+        STATE[(i + 15) & 0xF] = (_mat0neg(-2, z0) ^ _mat0neg(-18, z1) ^ ((z2 << 28) & 0xFFFFFFFF)
+                                 ^ (STATE[i] ^ ((STATE[i] << 5) & 0xDA442D24)))
+        i = (i + 15) & 0xF
+        salida.append(STATE[i])
+    return salida
+
+
+def referencia_well1024a(estado, n):
+    STATE, i, salida = list(estado), 0, []
+    for _ in range(n):
+        z0 = STATE[(i + 31) & 0x1F]
+        z1 = STATE[i] ^ _mat0pos(8, STATE[(i + 3) & 0x1F])
+        z2 = _mat0neg(-19, STATE[(i + 24) & 0x1F]) ^ _mat0neg(-14, STATE[(i + 10) & 0x1F])
+        STATE[i] = z1 ^ z2
+        STATE[(i + 31) & 0x1F] = _mat0neg(-11, z0) ^ _mat0neg(-7, z1) ^ _mat0neg(-13, z2)
+        i = (i + 31) & 0x1F
+        salida.append(STATE[i])
+    return salida
+
+
+@pytest.mark.parametrize("variante, referencia", [('512a', referencia_well512a), ('1024a', referencia_well1024a)])
+def test_well_igual_a_la_implementacion_de_referencia(variante, referencia):
+    r = RandomGenerator.WELL_VARIANTS[variante][0]
+    for semilla in (1, 123456789, 2**32 - 1):
+        estado = [int(palabra) for palabra in RandomGenerator._seed_words(semilla, r)]
+        for n in (1, r - 1, r, 3 * r + 5, 20000):
+            palabras = RandomGenerator.well(n, semilla, variante, as_array=True) * 2**32
+            np.testing.assert_array_equal(palabras, referencia(estado, n))
+
+
+def original_tausworthe(n, seed=123456789):
+    numbers = []
+    r = 32
+    q = 3
+    s = seed
+    for _ in range(n):
+        result = 0
+        for j in range(32):
+            bit = (s >> 0) & 1
+            result = result | (bit << j)
+            new_bit = ((s >> 0) ^ (s >> q)) & 1
+            s = (s >> 1) | (new_bit << (r-1))
+        numbers.append(result / 0xFFFFFFFF)
+    return numbers
+
+
+def test_tausworthe_lfsr_igual_al_bucle_original():
+    for semilla in (1, 123456789, 0xFFFFFFFF, 2**35 + 11):
+        for n in (1, 33, 3000):
+            assert RandomGenerator.tausworthe(n, semilla, variant='lfsr') == original_tausworthe(n, semilla)
+
+
+# Transcripción directa de taus88 (L'Ecuyer, 1996) y LFSR113 (L'Ecuyer, 1999)
+
+def referencia_taus88(s1, s2, s3, n):
+    salida = []
+    for _ in range(n):
+        b = (((s1 << 13) & 0xFFFFFFFF) ^ s1) >> 19
+        s1 = (((s1 & 4294967294) << 12) & 0xFFFFFFFF) ^ b
+        b = (((s2 << 2) & 0xFFFFFFFF) ^ s2) >> 25
+        s2 = (((s2 & 4294967288) << 4) & 0xFFFFFFFF) ^ b
+        b = (((s3 << 3) & 0xFFFFFFFF) ^ s3) >> 11
+        s3 = (((s3 & 4294967280) << 17) & 0xFFFFFFFF) ^ b
+        salida.append(s1 ^ s2 ^ s3)
+    return salida
+
+
+def referencia_lfsr113(z1, z2, z3, z4, n):
+    salida = []
+    for _ in range(n):
+        b = (((z1 << 6) & 0xFFFFFFFF) ^ z1) >> 13
+        z1 = (((z1 & 4294967294) << 18) & 0xFFFFFFFF) ^ b
+        b = (((z2 << 2) & 0xFFFFFFFF) ^ z2) >> 27
+        z2 = (((z2 & 4294967288) << 2) & 0xFFFFFFFF) ^ b
+        b = (((z3 << 13) & 0xFFFFFFFF) ^ z3) >> 21
+        z3 = (((z3 & 4294967280) << 7) & 0xFFFFFFFF) ^ b
+        b = (((z4 << 3) & 0xFFFFFFFF) ^ z4) >> 12
+        z4 = (((z4 & 4294967168) << 13) & 0xFFFFFFFF) ^ b
+        salida.append(z1 ^ z2 ^ z3 ^ z4)
+    return salida
+
+
+@pytest.mark.parametrize("variante, referencia", [('taus88', referencia_taus88), ('lfsr113', referencia_lfsr113)])
+def test_tausworthe_combinado_igual_a_la_referencia(variante, referencia):
+    componentes = RandomGenerator.TAUSWORTHE_VARIANTS[variante]
+    for semilla in (1, 12345, 987654321):
+        estados = RandomGenerator._tausworthe_seeds(semilla, componentes)
+        for n in (1, 50, 20000):
+            palabras = RandomGenerator.tausworthe(n, semilla, variante, as_array=True) * 2**32
+            np.testing.assert_array_equal(palabras, referencia(*estados, n))
+
+
+FLUJOS = [
+    ('mersenne_twister', 5, {}),
+    ('xorshift', 123456789, {}),
+    ('xorshift', 2**40 + 12345, {}),
+    ('pcg', 42, {}),
+    ('well', 9, {'variant': '512a'}),
+    ('well', 9, {'variant': '1024a'}),
+    ('lcg', 123456789, {}),
+    ('mcg', 123456789, {}),
+    ('tausworthe', 123456789, {'variant': 'lfsr'}),
+    ('tausworthe', 123456789, {'variant': 'taus88'}),
+    ('tausworthe', 123456789, {'variant': 'lfsr113'}),
+    ('philox', 20111115, {}),
+    ('threefry', 20111115, {}),
+    ('middle_square', 675248, {}),
+    ('middle_square', 1234567, {}),
+    ('middle_square_weyl', 675248, {}),
+    ('sobol', 3, {'scramble': True}),
+    ('halton', 3, {'scramble': True}),
+]
+
+
+@pytest.mark.parametrize("metodo, semilla, parametros", FLUJOS)
+def test_stream_igual_a_la_generacion_serie(metodo, semilla, parametros):
+    serie = getattr(RandomGenerator, metodo)(10000, semilla, as_array=True, **parametros)
+    for bloque in (1000, 999, 4096):
+        bloques = list(RandomGenerator.stream(metodo, semilla, bloque, total=10000, **parametros))
+        assert all(len(parte) == bloque for parte in bloques[:-1])
+        np.testing.assert_array_equal(np.concatenate(bloques), serie)
+
+
+@pytest.mark.parametrize("pesos", [
+    [1.0],
+    [1, 1, 1, 1],
+    [0.5, 0.25, 0.125, 0.125],
+    [0, 3, 0, 1, 0],
+    [1000, 1, 1, 1, 1, 1],
+    np.random.default_rng(1).random(1000),
+    np.random.default_rng(2).pareto(1.0, 5000),
+])
+def test_tabla_de_alias_reproduce_las_probabilidades_exactas(pesos):
+    tabla = AliasTable(pesos)
+    k = len(tabla)
+    # Columna j: j con probabilidad prob[j] y su alias con 1 - prob[j], cada columna con 1/k
+    implicitas = tabla.prob / k
+    np.add.at(implicitas, tabla.alias, (1 - tabla.prob) / k)
+    esperadas = np.asarray(pesos, dtype=np.float64) / np.sum(pesos)
+    np.testing.assert_allclose(implicitas, esperadas, rtol=0, atol=1e-12)
+    # sample aplica la tabla: la moneda decide entre la columna y su alias
+    columnas = (np.arange(k) + 0.5) / k
+    np.testing.assert_array_equal(tabla.sample(columnas, np.zeros(k)), np.where(tabla.prob > 0, np.arange(k), tabla.alias))
+    np.testing.assert_array_equal(tabla.sample(columnas, np.full(k, 1 - 1e-12)),
+                                  np.where(tabla.prob > 1 - 1e-12, np.arange(k), tabla.alias))
+
+
+def periodo_por_fuerza_bruta(paso, x):
+    """(mu, lambda) recordando el índice de cada estado visitado"""
+    vistos = {}
+    i = 0
+    while x not in vistos:
+        vistos[x] = i
+        x = paso(x)
+        i += 1
+    return vistos[x], i - vistos[x]
+
+
+def paso_productos_medios(semilla):
+    digitos = len(str(semilla))
+    if digitos % 2:
+        semilla, digitos = semilla * 10, digitos + 1
+    def paso(x):
+        cuadrado = str(x * x).zfill(2 * digitos)
+        inicio = (len(cuadrado) - digitos) // 2
+        x = int(cuadrado[inicio:inicio + digitos])
+        return semilla if x == 0 else x
+    return semilla, paso
+
+
+@pytest.mark.parametrize("metodo, parametros", [
+    ('lcg', {'a': 21, 'c': 7, 'm': 1000}),
+    ('lcg', {'a': 6, 'c': 4, 'm': 100}),
+    ('mcg', {'a': 2, 'm': 101}),
+    ('mcg', {'a': 6, 'm': 2**10}),
+])
+def test_periodo_brent_congruenciales(metodo, parametros):
+    a, c, m = parametros['a'], parametros.get('c', 0), parametros['m']
+    semillas = list(range(0, m, 7))
+    mu, lam = RandomGenerator.period(metodo, semillas, **parametros)
+    for semilla, mu_i, lam_i in zip(semillas, mu, lam):
+        assert (mu_i, lam_i) == periodo_por_fuerza_bruta(lambda x: (a * x + c) % m, semilla)
+
+
+def test_periodo_brent_productos_medios():
+    semillas = list(range(1000, 1300)) + [12, 57, 123, 4567, 675248]
+    mu, lam = RandomGenerator.period('middle_square', semillas)
+    for semilla, mu_i, lam_i in zip(semillas, mu, lam):
+        inicio, paso = paso_productos_medios(semilla)
+        assert (mu_i, lam_i) == periodo_por_fuerza_bruta(paso, inicio)
+
+
+def test_periodo_brent_sin_ciclo_dentro_del_limite():
+    mu, lam = RandomGenerator.period('lcg', [1, 2], max_steps=100, a=5, c=3, m=2**12)
+    assert list(mu) == [-1, -1] and list(lam) == [-1, -1]
+
+
+def original_middle_square(n, seed=675248):
+    numbers = []
+    digits = len(str(seed))
+    if digits % 2 != 0:
+        seed = seed * 10
+        digits += 1
+    x = seed
+    for _ in range(n):
+        x_squared = x * x
+        x_squared_str = str(x_squared).zfill(digits * 2)
+        start = (len(x_squared_str) - digits) // 2
+        x = int(x_squared_str[start:start+digits])
+        numbers.append(x / (10**digits))
+        if x == 0:
+            x = seed
+    return numbers
+
+
+@pytest.mark.parametrize("semilla", [12, 57, 1234, 5678, 675248, 1234567, 9876543210])
+def test_productos_medios_igual_al_bucle_original(semilla):
+    for n in (1, 10, 2000):
+        assert RandomGenerator.middle_square(n, semilla) == original_middle_square(n, semilla)
+
+
+def test_productos_medios_por_bloques_con_memoria_limitada(monkeypatch):
+    # Con pocos estados recordados el ciclo se completa avanzando desde el estado repetido
+    monkeypatch.setattr(RandomGenerator, 'MIDDLE_SQUARE_MEMORY', 5)
+    for semilla in (1234, 5678, 675248):
+        serie = original_middle_square(3000, semilla)
+        np.testing.assert_array_equal(np.concatenate(list(RandomGenerator.stream('middle_square', semilla, 701,
+                                                                                   total=3000))), serie)
+
+
+# Vectores de respuesta conocida de Random123 (kat_vectors): contador, clave y salida
+
+@pytest.mark.parametrize("contador, clave, esperado", [
+    ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+    ((0xFFFFFFFF,) * 4, (0xFFFFFFFF,) * 2, (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD)),
+    ((0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344), (0xA4093822, 0x299F31D0),
+     (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1)),
+])
+def test_philox4x32_10_respuestas_conocidas(contador, clave, esperado):
+    assert tuple(int(palabra) for palabra in RandomGenerator.philox_block(contador, clave)) == esperado
+
+
+@pytest.mark.parametrize("contador, clave, esperado", [
+    ((0, 0), (0, 0), (0x6B200159, 0x99BA4EFE)),
+    ((0xFFFFFFFF,) * 2, (0xFFFFFFFF,) * 2, (0x1CB996FC, 0xBB002BE7)),
+    ((0x243F6A88, 0x85A308D3), (0x13198A2E, 0x03707344), (0xC4923A9C, 0x483DF7A0)),
+])
+def test_threefry2x32_20_respuestas_conocidas(contador, clave, esperado):
+    assert tuple(int(palabra) for palabra in RandomGenerator.threefry_block(contador, clave)) == esperado
+
+
+def test_philox_y_threefry_acceso_directo():
+    # La palabra i sale del bloque del contador i // 4 (Philox) o i // 2 (Threefry)
+    semilla = 0x0123456789ABCDEF
+    clave = (semilla & 0xFFFFFFFF, semilla >> 32)
+    palabras = RandomGenerator.philox(12, semilla, as_array=True) * 2**32
+    np.testing.assert_array_equal(palabras[8:], RandomGenerator.philox_block((2, 0, 0, 0), clave))
+    palabras = RandomGenerator.threefry(12, semilla, as_array=True) * 2**32
+    np.testing.assert_array_equal(palabras[10:], RandomGenerator.threefry_block((5, 0), clave))
+
+
+@pytest.mark.parametrize("dim", [1, 2, 5, len(RandomGenerator.SOBOL_DIRECTIONS) + 1])
+@pytest.mark.parametrize("desplazamiento", [0, 1, 255, 1000])
+def test_sobol_igual_a_scipy(dim, desplazamiento):
+    qmc = pytest.importorskip("scipy.stats.qmc")
+    referencia = qmc.Sobol(dim, scramble=False)
+    if desplazamiento:
+        referencia.fast_forward(desplazamiento)
+    puntos = RandomGenerator.sobol(1024, dim=dim, offset=desplazamiento, as_array=True)
+    np.testing.assert_array_equal(puntos, referencia.random(1024).reshape(puntos.shape))
+
+
+@pytest.mark.parametrize("dim", [1, 3, 10])
+@pytest.mark.parametrize("desplazamiento", [0, 7, 1000])
+def test_halton_igual_a_scipy(dim, desplazamiento):
+    qmc = pytest.importorskip("scipy.stats.qmc")
+    referencia = qmc.Halton(dim, scramble=False)
+    if desplazamiento:
+        referencia.fast_forward(desplazamiento)
+    puntos = RandomGenerator.halton(1000, dim=dim, offset=desplazamiento, as_array=True)
+    np.testing.assert_allclose(puntos, referencia.random(1000).reshape(puntos.shape), rtol=0, atol=1e-15)
+
+
+def test_sobol_mezclado_conserva_la_estratificacion():
+    # Los primeros 2^m puntos caen uno en cada intervalo de ancho 2^-m en cada dimensión
+    puntos = RandomGenerator.sobol(256, seed=11, dim=4, scramble=True, as_array=True)
+    for columna in puntos.T:
+        assert sorted(np.floor(columna * 256).astype(int)) == list(range(256))
+
+
+def test_valores_espectrales_de_knuth_para_16807():
+    # TAOCP vol. 2, §3.3.4, tabla 1: nu_t^2 para el generador mínimo estándar
+    resultado = SpectralTest.analyze(16807, 2**31 - 1, range(2, 7))
+    assert [round(resultado[t][0] ** 2) for t in range(2, 7)] == [282475250, 408197, 21682, 4439, 895]
@@ -0,0 +1,37 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+import montecarlo
+
+
+@pytest.fixture
+def simulador():
+    ventana = montecarlo.MonteCarloSimulator()
+    ventana.input_funcion1.setText("exp(-x**2)")
+    ventana.input_limite_a.setText("-1")
+    ventana.input_limite_b.setText("2")
+    ventana.input_semilla.setValue(12345)
+    yield ventana
+    ventana.close()
+
+
+@pytest.mark.parametrize("num_simulaciones", [300000, 1500000])
+def test_acierto_fallo_no_depende_de_los_procesos(simulador, num_simulaciones):
+    """Misma semilla, mismo resultado con 1, 2 o 3 procesos y con o sin bloques"""
+    simulador.input_simulaciones.setValue(num_simulaciones)
+    # Permitir más procesos que núcleos para probar el reparto también en máquinas pequeñas
+    simulador.input_procesos.setMaximum(3)
+    areas = []
+    for procesos, bloques in [(1, False), (1, True), (2, False), (3, False)]:
+        simulador.input_procesos.setValue(procesos)
+        simulador.check_bloques.setChecked(bloques)
+        simulador.ejecutar_simulacion()
+        areas.append(simulador.area_mc)
+    assert len(set(areas)) == 1
+    assert abs(areas[0] - 1.6289055235748486) < 0.01